@@ -4,6 +4,7 @@ FastAPI의 Depends를 위한 래퍼 함수들.
 실제 객체 생성은 app.core.container.Container에서 담당합니다.
 """
 from ..core.container import Container
+from ..core.news_store import NewsStore
 from ..repositories import NewsRepository, ArticleRepository
 from ..services.news_service import NewsService
 from ..services.article_service import ArticleService
@@ -19,16 +20,17 @@ def get_article_repository() -> ArticleRepository:
     return Container.get_article_repository()
 
 
-def get_news_service(
-    news_repo: NewsRepository | None = None,
-) -> NewsService:
-    """NewsService 인스턴스 반환 (FastAPI Depends용)"""
-    return Container.get_news_service(news_repo=news_repo)
+def get_news_store() -> NewsStore:
+    """전역 NewsStore 반환 (FastAPI Depends용)"""
+    return Container.get_news_store()
 
 
-def get_article_service(
-    article_repo: ArticleRepository | None = None,
-) -> ArticleService:
+def get_news_service() -> NewsService:
+    """공유 스냅샷을 사용하는 NewsService 반환 (FastAPI Depends용)"""
+    return Container.get_news_service()
+
+
+def get_article_service() -> ArticleService:
     """ArticleService 인스턴스 반환 (FastAPI Depends용)"""
-    return Container.get_article_service(article_repo=article_repo)
+    return Container.get_article_service()
 
@@ -1,6 +1,12 @@
 """뉴스 API 라우터"""
-from typing import List
-from fastapi import APIRouter, Query, HTTPException, Depends
+import functools
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+import numpy as np
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from ....schemas.news import (
     NewsOut, 
@@ -10,10 +16,181 @@ from ....schemas.news import (
     NewsDescriptionResponse
 )
 from ....api.deps import get_news_service
+from ....core.config import settings
+from ....core.exceptions import ValidationException
+from ....core.executor import run_blocking
+from ....core.news_store import NewsSnapshot
+from ....core.responses import CodecJSONResponse
 from ....services.news_service import NewsService
+from ....utils.json_codec import codec
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 다음 페이지 커서 응답 헤더 (목록 응답은 배열이므로 헤더로 전달)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 일반(비스트리밍) 응답의 최대 조회 개수
+PAGE_MAX_LIMIT = 100
+
+
+# 응답 필드 값을 만드는 데 필요한 레코드 필드 (응답 필드와 이름이 같으면 생략)
+_NEWS_OUT_SOURCES = {"published": ("published", "processed_at")}
+_NEWS_ENTRY_SOURCES = {"guid": ("guid", "id")}
+
+
+class SparseFields(NamedTuple):
+    """``fields=``로 요청한 응답 필드와 레코드에서 가져올 필드"""
+    output: Tuple[str, ...]
+    record: Tuple[str, ...]
+    model: Type[BaseModel]
+
+
+def _parse_fields(
+    fields: Optional[str], model: Type[BaseModel], sources: Mapping[str, Tuple[str, ...]]
+) -> Optional[SparseFields]:
+    """쉼표로 구분한 필드 목록 파싱 (없으면 None, 모델에 없는 필드는 ValidationException)"""
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in model.model_fields]
+    if not names or unknown:
+        raise ValidationException(
+            f"알 수 없는 필드: {', '.join(unknown) or fields} (사용 가능: {', '.join(model.model_fields)})"
+        )
+    record = tuple(dict.fromkeys(source for name in names for source in sources.get(name, (name,))))
+    return SparseFields(names, record, model)
+
+
+def _news_out_values(item: Dict[str, Any]) -> Dict[str, Any]:
+    """레코드 → NewsOut 필드 값"""
+    return dict(
+        source=item.get('source'),
+        title=item.get('title'),
+        link=item.get('link'),
+        published=item.get('published') or item.get('processed_at'),
+        summary=item.get('summary'),
+        authors=item.get('authors', []),
+        tags=item.get('tags', [])
+    )
+
+
+def _news_entry_values(item: Dict[str, Any]) -> Dict[str, Any]:
+    """레코드 → NewsEntry 필드 값"""
+    return dict(
+        guid=item.get('guid', str(item.get('id', ''))),
+        source=item.get('source', ''),
+        title=item.get('title', ''),
+        link=item.get('link', ''),
+        article_text=item.get('article_text'),
+        summary=item.get('summary'),
+        tags=item.get('tags', []),
+        content_type=item.get('content_type', 'NEWS'),
+        language=item.get('language', 'ENGLISH'),
+        readability_score=item.get('readability_score'),
+        key_entities=item.get('key_entities', []),
+        processed_at=item.get('processed_at'),
+        text_length=item.get('text_length')
+    )
+
+
+# 레코드 목록을 한 번에 검증/직렬화하는 어댑터 (검증 스키마는 모듈 로드 시 한 번 생성)
+_NEWS_OUT_LIST = TypeAdapter(List[NewsOut])
+_NEWS_ENTRY_LIST = TypeAdapter(List[NewsEntry])
+
+
+def _encode_many(adapter: TypeAdapter, values: List[Dict[str, Any]]) -> List[bytes]:
+    """필드 값 목록을 한 번에 검증해 레코드별 JSON 조각으로 인코딩
+
+    모델을 하나씩 만드는 대신 목록 어댑터로 검증(link의 HttpUrl 포함)과
+    JSON 모드 변환을 한 번에 하며, 결과는 response_model 직렬화와 같은 bytes입니다.
+    """
+    rows = adapter.dump_python(adapter.validate_python(values), mode="json")
+    return [codec.dumps(row) for row in rows]
+
+
+def _encode_news_out(items: List[Dict[str, Any]]) -> List[bytes]:
+    """레코드 목록 → NewsOut JSON 조각 목록"""
+    return _encode_many(_NEWS_OUT_LIST, [_news_out_values(item) for item in items])
+
+
+def _encode_news_entry(items: List[Dict[str, Any]]) -> List[bytes]:
+    """레코드 목록 → NewsEntry JSON 조각 목록"""
+    return _encode_many(_NEWS_ENTRY_LIST, [_news_entry_values(item) for item in items])
+
+
+def _json_array(fragments: List[bytes]) -> bytes:
+    """JSON 조각을 배열 본문으로 연결"""
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def _description_body(fragments: List[bytes], total: int, next_cursor: Optional[str]) -> bytes:
+    """NewsDescriptionResponse와 같은 필드 순서의 본문 (data는 미리 인코딩한 조각)"""
+    head = codec.dumps({"success": True, "count": len(fragments)})
+    tail = codec.dumps({"total": total, "next_cursor": next_cursor})
+    return head[:-1] + b',"data":' + _json_array(fragments) + b"," + tail[1:]
+
+
+@functools.lru_cache(maxsize=None)
+def _field_list_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    """모델 필드 하나의 값 목록 어댑터 (모델과 같은 검증/JSON 직렬화)"""
+    return TypeAdapter(List[model.model_fields[name].annotation])
+
+
+def _sparse_rows(
+    items: List[Dict[str, Any]], sparse: SparseFields, to_values: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """요청한 필드만 담은 행 목록
+
+    전체 모델은 만들지 않지만 요청한 필드는 필드별 목록 어댑터로 한 번에 검증하고
+    JSON 모드로 변환하므로, 값은 전체 응답의 같은 키와 같습니다(link 정규화, 숫자 변환,
+    잘못된 값은 검증 오류).
+    """
+    values = [to_values(item) for item in items]
+    columns = []
+    for name in sparse.output:
+        adapter = _field_list_adapter(sparse.model, name)
+        columns.append(adapter.dump_python(adapter.validate_python([row[name] for row in values]), mode="json"))
+    return [dict(zip(sparse.output, row)) for row in zip(*columns)] if columns else []
+
+
+def _sparse_page(
+    snapshot: NewsSnapshot,
+    ids: List[int],
+    sparse: SparseFields,
+    to_values: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """레코드 번호 목록의 sparse 응답 항목 (레코드를 가져와 필드별로 검증)"""
+    return _sparse_rows(snapshot.get_items(ids, sparse.record), sparse, to_values)
+
+
+def _ndjson_lines(
+    snapshot: NewsSnapshot, page_ids: np.ndarray, sparse: Optional[SparseFields] = None
+) -> Iterator[bytes]:
+    """NewsEntry를 한 줄씩 인코딩 (청크 단위로 레코드를 가져오므로 메모리는 페이지 크기와 무관)
+
+    동기 제너레이터이므로 StreamingResponse가 스레드 풀에서 순회하며, 레코드 디코딩과
+    인코딩은 이벤트 루프를 막지 않습니다.
+    """
+    try:
+        ids = page_ids.tolist()
+        chunk_size = settings.news_stream_chunk_size
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            if sparse is not None:
+                rows = _sparse_page(snapshot, chunk, sparse, _news_entry_values)
+                yield b"".join(codec.dumps(row) + b"\n" for row in rows)
+                continue
+            for fragment in snapshot.get_fragments("entry", chunk, _encode_news_entry):
+                yield fragment + b"\n"
+    except Exception as e:
+        # 상태 코드는 이미 전송되었으므로 로그만 남기고 스트림 종료
+        logger.error(f"뉴스 NDJSON 스트리밍 오류: {e}")
+        raise
+
 
 @router.get("/", response_model=List[NewsOut])
 async def get_news(
@@ -22,86 +199,108 @@ async def get_news(
     group: str = Query(None, description="특정 그룹 필터"),
     limit: int = Query(20, ge=1, le=100, description="조회 개수"),
     offset: int = Query(0, ge=0, description="오프셋"),
-    sort: str = Query("fresh", pattern="^(fresh|time)$", description="정렬 방식"),
+    sort: str = Query("fresh", pattern="^(fresh|time|relevance)$", description="정렬 방식 (relevance: 검색어 BM25 관련도)"),
     refresh: bool = Query(False, description="캐시 새로고침"),
+    cursor: str = Query(None, description="이전 응답 X-Next-Cursor 헤더 값 (sort=time 키셋 페이지네이션)"),
+    fields: str = Query(None, description="반환할 필드 (쉼표 구분, 예: title,link,source,published)"),
     news_service: NewsService = Depends(get_news_service)
 ):
-    """뉴스 목록 조회"""
+    """뉴스 목록 조회
+
+    sort=time이면 페이지가 가득 찼을 때 다음 페이지 커서를 ``X-Next-Cursor``
+    헤더로 반환합니다. 이 값을 ``cursor``로 넘기면 offset 없이 이어서 조회합니다.
+    ``fields``를 지정하면 레코드에서 그 필드만 꺼내 필드별로 검증해 반환합니다.
+    """
     try:
+        sparse = _parse_fields(fields, NewsOut, _NEWS_OUT_SOURCES)
         query = NewsQuery(
             q=q, source=source, group=group,
-            limit=limit, offset=offset, sort=sort, refresh=refresh
+            limit=limit, offset=offset, sort=sort, refresh=refresh, cursor=cursor
         )
         
-        data, total = await news_service.search_news(query)
-        
-        # NewsOut 형식으로 변환
-        news_items = []
-        for item in data:
-            news_out = NewsOut(
-                source=item.get('source'),
-                title=item.get('title'),
-                link=item.get('link'),
-                published=item.get('published') or item.get('processed_at'),
-                summary=item.get('summary'),
-                authors=item.get('authors', []),
-                tags=item.get('tags', [])
-            )
-            news_items.append(news_out)
+        # 목록 응답에는 전체 개수가 없으므로 검색어 조회는 최신 세그먼트에서 페이지가 차면 멈춤
+        snapshot, page_ids, _ = await news_service.search_news_page(query, count_total=False)
+        next_cursor = news_service.next_cursor(snapshot, query, page_ids)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+        if sparse is not None:
+            rows = await run_blocking(_sparse_page, snapshot, page_ids.tolist(), sparse, _news_out_values)
+            return CodecJSONResponse(rows, headers=headers)
         
-        return news_items
+        # 레코드별로 캐시된 NewsOut JSON 조각을 이어 붙여 응답
+        fragments = await run_blocking(snapshot.get_fragments, "out", page_ids.tolist(), _encode_news_out)
+        return Response(_json_array(fragments), media_type="application/json", headers=headers)
         
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 조회 오류: {str(e)}")
 
 
 @router.get("/description", response_model=NewsDescriptionResponse)
 async def get_news_description(
+    request: Request,
     q: str = Query(None, description="검색어"),
     source: str = Query(None, description="특정 소스 필터"),
     group: str = Query(None, description="특정 그룹 필터"),
-    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    limit: int = Query(20, ge=1, le=settings.news_stream_max_limit, description=f"조회 개수 (스트리밍이 아니면 {PAGE_MAX_LIMIT} 이하)"),
     offset: int = Query(0, ge=0, description="오프셋"),
-    sort: str = Query("fresh", pattern="^(fresh|time)$", description="정렬 방식"),
+    sort: str = Query("fresh", pattern="^(fresh|time|relevance)$", description="정렬 방식 (relevance: 검색어 BM25 관련도)"),
     refresh: bool = Query(False, description="캐시 새로고침"),
+    cursor: str = Query(None, description="이전 응답의 next_cursor (sort=time 키셋 페이지네이션)"),
+    stream: bool = Query(False, description="NDJSON 스트리밍 (Accept: application/x-ndjson과 동일)"),
+    fields: str = Query(None, description="반환할 NewsEntry 필드 (쉼표 구분, 예: guid,title,link)"),
     news_service: NewsService = Depends(get_news_service)
 ):
-    """뉴스 description 응답 형식으로 조회"""
+    """뉴스 description 응답 형식으로 조회
+
+    ``stream=true`` 또는 ``Accept: application/x-ndjson``이면 NewsEntry를 한 줄에
+    하나씩 스트리밍하고 전체 개수와 다음 페이지 커서는 ``X-Total-Count``,
+    ``X-Next-Cursor`` 헤더로 반환합니다. ``fields``를 지정하면 각 항목에
+    그 필드만 담습니다(본문 ``article_text``를 빼면 디코딩도 생략, 값은 전체 응답과 같음).
+    """
+    stream = stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+    if not stream and limit > PAGE_MAX_LIMIT:
+        raise HTTPException(
+            status_code=422,
+            detail=f"limit은 {PAGE_MAX_LIMIT} 이하여야 합니다 (NDJSON 스트리밍은 {settings.news_stream_max_limit} 이하)",
+        )
     try:
+        sparse = _parse_fields(fields, NewsEntry, _NEWS_ENTRY_SOURCES)
         query = NewsQuery(
             q=q, source=source, group=group,
-            limit=limit, offset=offset, sort=sort, refresh=refresh
+            limit=limit, offset=offset, sort=sort, refresh=refresh, cursor=cursor
         )
         
-        data, total = await news_service.search_news(query)
-        
-        # NewsEntry 형식으로 변환
-        news_entries = []
-        for item in data:
-            news_entry = NewsEntry(
-                guid=item.get('guid', str(item.get('id', ''))),
-                source=item.get('source', ''),
-                title=item.get('title', ''),
-                link=item.get('link', ''),
-                article_text=item.get('article_text'),
-                summary=item.get('summary'),
-                tags=item.get('tags', []),
-                content_type=item.get('content_type', 'NEWS'),
-                language=item.get('language', 'ENGLISH'),
-                readability_score=item.get('readability_score'),
-                key_entities=item.get('key_entities', []),
-                processed_at=item.get('processed_at'),
-                text_length=item.get('text_length')
+        snapshot, page_ids, total = await news_service.search_news_page(query)
+        next_cursor = news_service.next_cursor(snapshot, query, page_ids)
+        if stream:
+            headers = {"X-Total-Count": str(total)}
+            if next_cursor is not None:
+                headers[NEXT_CURSOR_HEADER] = next_cursor
+            return StreamingResponse(
+                _ndjson_lines(snapshot, page_ids, sparse),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=headers,
             )
-            news_entries.append(news_entry)
         
-        return NewsDescriptionResponse(
-            success=True,
-            count=len(news_entries),
-            data=news_entries,
-            total=total
+        if sparse is not None:
+            rows = await run_blocking(_sparse_page, snapshot, page_ids.tolist(), sparse, _news_entry_values)
+            return CodecJSONResponse({
+                "success": True,
+                "count": len(rows),
+                "data": rows,
+                "total": total,
+                "next_cursor": next_cursor,
+            })
+        
+        # 레코드별로 캐시된 NewsEntry JSON 조각을 이어 붙여 응답
+        fragments = await run_blocking(snapshot.get_fragments, "entry", page_ids.tolist(), _encode_news_entry)
+        return Response(
+            _description_body(fragments, total, next_cursor), media_type="application/json",
         )
         
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 description 조회 오류: {str(e)}")
 
@@ -117,7 +316,13 @@ async def health_check(
             ok=status["ok"],
             count=status["count"],
             backend=status["backend"],
-            version=status["version"]
+            version=status["version"],
+            dataset_version=status["dataset_version"],
+            date_formats=status["date_formats"],
+            query_cache=status["query_cache"],
+            fragment_cache=status["fragment_cache"],
+            dedup=status["dedup"],
+            snapshot=status["snapshot"]
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"헬스체크 오류: {str(e)}")
@@ -127,10 +332,11 @@ async def health_check(
 async def get_sources(
     news_service: NewsService = Depends(get_news_service)
 ):
-    """사용 가능한 뉴스 소스 목록"""
+    """사용 가능한 뉴스 소스 목록 (소스별 뉴스 수와 최신 발행 시각 포함)"""
     try:
-        sources = await news_service.get_sources()
-        return {"sources": sources, "count": len(sources)}
+        facets = await news_service.get_facets("source")
+        sources = [facet["name"] for facet in facets]
+        return {"sources": sources, "count": len(sources), "facets": facets}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"소스 목록 조회 오류: {str(e)}")
 
@@ -139,10 +345,11 @@ async def get_sources(
 async def get_groups(
     news_service: NewsService = Depends(get_news_service)
 ):
-    """사용 가능한 뉴스 그룹 목록"""
+    """사용 가능한 뉴스 그룹 목록 (그룹별 뉴스 수와 최신 발행 시각 포함)"""
     try:
-        groups = await news_service.get_groups()
-        return {"groups": groups, "count": len(groups)}
+        facets = await news_service.get_facets("group")
+        groups = [facet["name"] for facet in facets]
+        return {"groups": groups, "count": len(groups), "facets": facets}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"그룹 목록 조회 오류: {str(e)}")
 
@@ -53,7 +53,37 @@ class Settings(BaseSettings):
     backend: str = "FILE"
     
     # 파일 백엔드 설정
-    news_file: Path = Path("data/all_entries_20250825_025249.jsonl")
+    news_file: Path = Path("data/all_entries_20250825_025249.jsonl")  # 파일, 디렉터리 또는 글롭 패턴
+    news_file_mode: str = "memory"  # memory: 전체 레코드 보관, mmap: 오프셋 인덱스 + 지연 디코딩
+    news_compact_records: bool = True  # memory 모드에서 dict 대신 압축 레코드(NewsRecord) 사용
+    news_load_workers: int = 0  # JSONL 병렬 디코딩 워커 수 (0: CPU 수, 1: 직렬)
+    news_parallel_min_bytes: int = 64 * 1024 * 1024  # 이 크기 미만을 읽을 때는 직렬 디코딩
+    news_io_workers: int = 4  # 파일/MongoDB 로드를 이벤트 루프 밖에서 실행하는 스레드 수
+    
+    # 뉴스 스냅샷 설정
+    news_cache_ttl: int = 300  # MONGO 백엔드 스냅샷 유효 시간(초)
+    news_refresh_interval: float = 5.0  # 백그라운드 갱신 확인 주기(초), 0이면 요청 시 확인/재로드
+    news_max_staleness: float = 60.0  # 마지막 변경 확인 후 허용 시간(초), 넘으면 즉시 갱신 요청/stale 표시
+    # 검색 색인 구축 여부 (None: memory 모드에서만 구축, mmap 모드는 로드 시 전체 디코딩/메모리 비용 때문에 생략)
+    news_text_index: Optional[bool] = None  # 전문 검색 역색인(sort=relevance)
+    news_trigram_index: Optional[bool] = None  # 부분 문자열 검색(q)용 트라이그램 색인
+    news_dedup: bool = True  # guid/link가 같은 뉴스는 최신 버전만 노출
+    news_segment_hours: int = 24  # 최신순/신선도 검색 시간 세그먼트 폭(시간), 최신 세그먼트부터 확인
+    news_snapshot_cache: bool = True  # FILE 백엔드 스냅샷 사이드카 저장/사용 여부
+    news_snapshot_path: Optional[Path] = None  # 사이드카 경로 (기본: <NEWS_FILE>.snapshot)
+    
+    # 뉴스 검색 결과 캐시 설정 (항목 수 또는 바이트가 0이면 비활성화)
+    news_query_cache_entries: int = 1024  # 최대 캐시 항목 수
+    news_query_cache_bytes: int = 16 * 1024 * 1024  # 최대 메모리 사용량(바이트, 근사치)
+    news_query_cache_ttl: float = 60.0  # 항목 유효 시간(초), 신선도 정렬 순서 변화 반영
+    news_fragment_cache_bytes: int = 64 * 1024 * 1024  # 레코드별 응답 JSON 조각 캐시 최대 메모리(바이트, 0이면 비활성화)
+    
+    # NDJSON 스트리밍 응답 설정 (/news/description, Accept: application/x-ndjson 또는 stream=true)
+    news_stream_max_limit: int = 1000  # 스트리밍 모드 최대 조회 개수 (일반 응답은 100)
+    news_stream_chunk_size: int = 64  # 한 번에 가져와 인코딩하는 레코드 수
+    
+    # JSON 코덱 (auto: orjson이 설치되어 있으면 사용, orjson, json)
+    json_codec: str = "auto"
     
     # 데이터베이스 설정
     database: DatabaseSettings = DatabaseSettings()
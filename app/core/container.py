@@ -7,6 +7,7 @@ from typing import Optional
 
 from ..repositories import NewsRepository, ArticleRepository
 from ..services.news_service import NewsService
+from .news_store import NewsStore, news_store
 from ..services.article_service import ArticleService
 
 
@@ -23,13 +24,21 @@ class Container:
         """ArticleRepository 인스턴스 반환"""
         return ArticleRepository()
     
+    @staticmethod
+    def get_news_store() -> NewsStore:
+        """프로세스 전역 NewsStore 반환 (모든 요청이 공유)"""
+        return news_store
+    
     @staticmethod
     def get_news_service(
         news_repo: Optional[NewsRepository] = None,
     ) -> NewsService:
-        """NewsService 인스턴스 반환"""
+        """NewsService 인스턴스 반환
+
+        Repository를 지정하지 않으면 전역 스토어의 스냅샷을 공유합니다.
+        """
         if news_repo is None:
-            news_repo = Container.get_news_repository()
+            return NewsService(news_store=Container.get_news_store())
         return NewsService(news_repo=news_repo)
     
     @staticmethod
@@ -0,0 +1,43 @@
+"""
+블로킹 작업 실행기 - 파일/MongoDB I/O와 파싱을 이벤트 루프 밖에서 실행
+
+``async def`` 안에서 동기 ``open()``/JSON 파싱/pymongo 커서 순회를 그대로
+호출하면 그동안 이벤트 루프 전체가 멈추므로, 이런 작업은 크기가 제한된 전역
+스레드 풀(``news_io_workers``)에서 실행합니다. 대용량 JSONL 디코딩은 이 스레드
+안에서 다시 프로세스 풀로 나뉩니다(``news_load_workers``).
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """블로킹 작업용 스레드 풀 (최초 사용 시 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.news_io_workers),
+            thread_name_prefix="news-io",
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동기 함수를 스레드 풀에서 실행하고 결과를 기다림 (루프는 다른 요청 처리)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    """애플리케이션 종료 시 스레드 풀 정리 (실행 중인 작업은 완료까지 대기)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
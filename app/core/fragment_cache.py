@@ -0,0 +1,97 @@
+"""
+뉴스 응답 조각 캐시 - 레코드별로 미리 인코딩한 JSON bytes의 LRU
+
+``/news``, ``/news/description`` 응답은 레코드마다 NewsOut/NewsEntry 모델을
+만들어 검증하고 다시 직렬화하는 비용이 검색보다 큽니다. 레코드 내용은 스냅샷
+안에서 바뀌지 않으므로 (응답 형식, 레코드 번호)별 인코딩 결과를 한 번만 만들어
+두고, 응답은 조각을 이어 붙여 만듭니다.
+
+캐시는 스냅샷에 붙어 있으며, 증분 추가로 만든 다음 버전 스냅샷은 레코드 번호가
+유지되므로 같은 캐시를 이어서 씁니다. 전체 재로드한 스냅샷은 새 캐시를 씁니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# 키/항목 객체 등 조각 bytes 외의 항목당 대략적인 메모리 (바이트)
+_ENTRY_OVERHEAD = 120
+
+
+class FragmentCache:
+    """메모리 사용량을 제한하는 레코드별 JSON 조각 LRU
+
+    Args:
+        max_bytes: 최대 메모리 사용량 (바이트, 근사치, 0이면 캐시하지 않음)
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[Hashable, int], bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get_many(
+        self,
+        kind: Hashable,
+        ids: Sequence[int],
+        encode_missing: Callable[[List[int]], List[bytes]],
+    ) -> List[bytes]:
+        """레코드 번호 순서대로 조각 반환 (없는 것만 encode_missing으로 만들어 저장)
+
+        Args:
+            kind: 응답 형식 (예: "out", "entry")
+            ids: 레코드 번호 목록
+            encode_missing: 캐시에 없는 레코드 번호 목록 → 같은 순서의 조각 목록
+        """
+        if not self.enabled:
+            return encode_missing(list(ids))
+
+        fragments: List[Optional[bytes]] = []
+        missing: List[int] = []
+        with self._lock:
+            for i in ids:
+                fragment = self._entries.get((kind, i))
+                if fragment is not None:
+                    self._entries.move_to_end((kind, i))
+                else:
+                    missing.append(i)
+                fragments.append(fragment)
+            self.hits += len(fragments) - len(missing)
+            self.misses += len(missing)
+        if not missing:
+            return fragments
+
+        encoded = dict(zip(missing, encode_missing(missing)))
+        with self._lock:
+            for i, fragment in encoded.items():
+                self._put((kind, i), fragment)
+        return [fragment if fragment is not None else encoded[i] for i, fragment in zip(ids, fragments)]
+
+    def _put(self, key: Tuple[Hashable, int], fragment: bytes) -> None:
+        size = len(fragment) + _ENTRY_OVERHEAD
+        if size > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = fragment
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted) + _ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/제거 카운터와 현재 사용량"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,477 @@
+"""
+뉴스 데이터셋 스토어 - 프로세스 전역 스냅샷 관리
+
+요청마다 NewsService/NewsRepository를 새로 만들면 캐시가 적중하지 않으므로,
+애플리케이션 수명(lifespan) 동안 하나의 스토어가 불변 스냅샷을 보관하고
+모든 요청과 엔드포인트가 이를 공유합니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .config import settings
+from .executor import run_blocking
+from .fragment_cache import FragmentCache
+from .query_cache import QueryCache
+from .snapshot_file import load_snapshot, read_meta, save_snapshot, sidecar_path, snapshot_config
+from ..repositories.news_columns import NewsColumns, build_search_text
+from ..repositories.news_dataset import KEY_COLUMNS, MmapNewsRecords
+from ..repositories.news_dedup import DedupIndex, DedupKeys, dedup_keys
+from ..repositories.news_record import project_fields
+from ..repositories.news_text_index import TextIndexView
+from ..repositories.news_trigram_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _search_texts(items: Sequence[Dict[str, Any]]) -> Iterable[str]:
+    """레코드별 검색 텍스트 (색인 구축 중에만 하나씩 만들고 보관하지 않음)"""
+    return (build_search_text(item) for item in items)
+
+
+def _index_enabled(setting: Optional[bool], items: Sequence[Dict[str, Any]]) -> bool:
+    """검색 색인 구축 여부 (설정하지 않으면 mmap 레코드가 아닐 때만)
+
+    mmap 모드에서 색인을 만들면 로드 시 모든 레코드를 디코딩하고 본문 크기에
+    비례하는 색인을 메모리에 두므로, 명시적으로 켠 경우에만 만듭니다.
+    """
+    if setting is None:
+        return not isinstance(items, MmapNewsRecords)
+    return setting
+
+
+def _record_keys(items: Sequence[Dict[str, Any]]) -> List[DedupKeys]:
+    """레코드별 중복 제거 키 (mmap 레코드는 로드 시 추출한 키 컬럼 사용)"""
+    if isinstance(items, MmapNewsRecords):
+        return list(zip(*(items.columns[field] for field in KEY_COLUMNS)))
+    return [dedup_keys(item) for item in items]
+
+
+class NewsSnapshot:
+    """특정 시점의 뉴스 데이터셋 (불변)
+
+    스냅샷은 한 번 만들어지면 수정되지 않습니다. 재로드는 항상 새 스냅샷을
+    만들어 교체하므로, 요청 처리 중에 데이터가 바뀌지 않습니다.
+
+    중복 제거(``news_dedup``)가 켜져 있으면 guid/link가 같은 레코드 중 마지막
+    것만 남깁니다. 전체 로드 시에는 이전 버전을 빼고 만들며(mmap 모드 제외),
+    증분 추가로 생긴 이전 버전은 컬럼의 ``hidden``으로 숨깁니다.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        items: Sequence[Dict[str, Any]],
+        loaded_at: Optional[float] = None,
+        columns: Optional[NewsColumns] = None,
+        text_index: Optional[TextIndexView] = None,
+        trigram_index: Optional[TrigramIndex] = None,
+        dedup: Optional[DedupIndex] = None,
+        fragments: Optional[FragmentCache] = None,
+    ):
+        self.version = version
+        # mmap 모드의 지연 디코딩 시퀀스는 그대로, 일반 목록은 튜플로 고정
+        if not isinstance(items, MmapNewsRecords):
+            items = tuple(items)
+        if columns is None and dedup is None and settings.news_dedup:
+            keys = _record_keys(items)
+            dedup = DedupIndex.build(keys)
+            if len(dedup.hidden) and not isinstance(items, MmapNewsRecords):
+                # 이전 버전 레코드는 스냅샷에 넣지 않음
+                dedup, kept = dedup.compact(keys)
+                items = tuple(items[i] for i in kept.tolist())
+        # guid/link 중복 제거 색인 (비활성화 시 None)
+        self.dedup = dedup
+        self.items: Sequence[Dict[str, Any]] = items
+        self.loaded_at = loaded_at if loaded_at is not None else time.time()
+        # 필터링/정렬용 컬럼형 표현 (스냅샷 생성 시 한 번 구축, 날짜도 이때 정규화)
+        if columns is None:
+            columns = NewsColumns.build(
+                items, hidden=dedup.hidden if dedup is not None else None,
+                segment_us=max(1, settings.news_segment_hours) * 3600 * 1_000_000,
+            )
+        self.columns = columns
+        # 전문 검색 역색인 (비활성화 시 None)
+        if text_index is None and _index_enabled(settings.news_text_index, items):
+            text_index = TextIndexView.build(items)
+        self.text_index = text_index
+        # 부분 문자열 검색 후보 축소용 트라이그램 색인 (비활성화 시 None)
+        if trigram_index is None and _index_enabled(settings.news_trigram_index, items):
+            trigram_index = TrigramIndex.build(_search_texts(items))
+        self.trigram_index = trigram_index
+        # 레코드별 응답 JSON 조각 캐시 (증분 추가한 다음 버전과 공유)
+        self.fragments = fragments if fragments is not None else FragmentCache(settings.news_fragment_cache_bytes)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get_items(self, ids: Iterable[int], fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """레코드 번호 목록에 해당하는 레코드 반환 (fields가 있으면 그 필드만 담은 dict)"""
+        items = self.items
+        if fields is None:
+            return [items[i] for i in ids]
+        if isinstance(items, MmapNewsRecords):
+            return items.get_many(ids, fields)
+        return [project_fields(items[i], fields) for i in ids]
+
+    def get_fragments(
+        self, kind: str, ids: Sequence[int], encode: Callable[[List[Dict[str, Any]]], List[bytes]]
+    ) -> List[bytes]:
+        """레코드 번호 순서대로 응답 형식(kind)의 JSON 조각 반환
+
+        캐시에 없는 레코드만 가져와 ``encode``(레코드 목록 → 같은 순서의 조각 목록)로
+        한 번에 인코딩합니다.
+        """
+        return self.fragments.get_many(kind, ids, lambda missing: encode(self.get_items(missing)))
+
+    def extend(self, version: int, new_items: Sequence[Dict[str, Any]]) -> "NewsSnapshot":
+        """기존 항목 뒤에 새 항목을 붙인 다음 버전의 스냅샷 생성
+
+        컬럼과 색인은 새 항목 부분만 만들어 기존 것 뒤에 이어 붙입니다.
+        새 항목과 guid/link가 같은 기존 항목은 숨깁니다.
+        """
+        dedup = None
+        if self.dedup is not None:
+            dedup = DedupIndex.build(_record_keys(new_items), base=self.dedup)
+        columns = NewsColumns.build(
+            new_items, base=self.columns, hidden=dedup.hidden if dedup is not None else None,
+        )
+        if isinstance(self.items, MmapNewsRecords) and isinstance(new_items, MmapNewsRecords):
+            items = self.items + new_items
+        else:
+            items = tuple(self.items) + tuple(new_items)
+        text_index = None
+        if self.text_index is not None:
+            text_index = self.text_index.extend(new_items) or TextIndexView.build(items)
+        trigram_index = None
+        if self.trigram_index is not None:
+            trigram_index = self.trigram_index.extend(_search_texts(new_items))
+        return NewsSnapshot(
+            version, items, columns=columns,
+            text_index=text_index, trigram_index=trigram_index, dedup=dedup,
+            fragments=self.fragments,
+        )
+
+
+class NewsStore:
+    """뉴스 스냅샷 보관소
+
+    - 파일 백엔드: 파일의 (mtime, size)가 바뀐 경우에만 재로드
+    - MONGO 백엔드: ``news_cache_ttl`` 초가 지나면 재로드
+    - 재로드는 락으로 직렬화되며, 완료되면 스냅샷을 한 번에 교체
+    - 파일 백엔드는 스냅샷 사이드카(``news_snapshot_cache``)가 유효하면 첫 로드 때
+      재파싱 없이 불러오고, 전체 로드 후와 종료 시 사이드카를 갱신
+    - ``start()`` 후에는 백그라운드 갱신 태스크가 ``news_refresh_interval`` 초마다
+      변경을 확인해 재로드하고(stale-while-revalidate), 요청은 재로드를 기다리지
+      않고 항상 현재 스냅샷을 받음. 마지막 확인 이후 ``news_max_staleness`` 초가
+      지나면 갱신 태스크를 즉시 깨우고 헬스체크에 stale로 표시
+    """
+
+    def __init__(self, news_repo=None):
+        self._news_repo = news_repo
+        self._snapshot: Optional[NewsSnapshot] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._version = 0
+        # 마지막으로 사이드카에 기록한(또는 사이드카에서 불러온) 스냅샷 버전
+        self._saved_version: Optional[int] = None
+        self._lock = asyncio.Lock()
+        # 스냅샷이 원본과 같다고 마지막으로 확인한 시각 (신선도 지표)
+        self._checked_at: Optional[float] = None
+        # 백그라운드 갱신 태스크와 깨우기 이벤트 (start() 이후에만 존재)
+        self._refresher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._refresh_full = False
+        self._last_error: Optional[str] = None
+        self._stale_warned = False
+        self._empty: Optional[NewsSnapshot] = None
+        self._started_at: Optional[float] = None
+        # 검색 결과 캐시 (키에 스냅샷 버전이 포함되므로 교체 시 별도 무효화 불필요)
+        self.query_cache = QueryCache(
+            max_entries=settings.news_query_cache_entries,
+            max_bytes=settings.news_query_cache_bytes,
+            ttl=settings.news_query_cache_ttl,
+        )
+
+    @property
+    def news_repo(self):
+        """데이터를 읽어올 NewsRepository (최초 사용 시 생성)"""
+        if self._news_repo is None:
+            from ..repositories.news_repository import NewsRepository
+            self._news_repo = NewsRepository()
+        return self._news_repo
+
+    @property
+    def snapshot(self) -> Optional[NewsSnapshot]:
+        """현재 스냅샷 (아직 로드되지 않았으면 None)"""
+        return self._snapshot
+
+    @property
+    def refreshing_in_background(self) -> bool:
+        """백그라운드 갱신 태스크가 동작 중인지 여부"""
+        return self._refresher is not None and not self._refresher.done()
+
+    async def start(self) -> None:
+        """애플리케이션 시작 시 초기 스냅샷 로드 후 백그라운드 갱신 시작
+
+        초기 로드가 실패해도(원본 손상, DB 연결 불가 등) 애플리케이션은 시작합니다.
+        오류는 ``status()``의 마지막 오류로 보고하고, 갱신 태스크가 주기적으로 다시
+        로드를 시도하며, 그동안 요청은 빈 스냅샷을 받습니다.
+        """
+        self._started_at = time.time()
+        try:
+            snapshot = await self.get_snapshot()
+            logger.info(f"뉴스 스토어 시작: v{snapshot.version}, {len(snapshot)}개 항목")
+        except Exception as e:
+            self._last_error = str(e)
+            logger.exception(f"뉴스 스냅샷 초기 로드 실패 (빈 데이터로 시작 후 재시도): {e}")
+        if settings.news_refresh_interval > 0 and not self.refreshing_in_background:
+            self._wakeup = asyncio.Event()
+            self._refresher = asyncio.create_task(self._refresh_loop(), name="news-store-refresher")
+
+    async def close(self) -> None:
+        """애플리케이션 종료 시 스냅샷 해제 (증분 로드가 있었으면 사이드카 갱신)"""
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.cancel()
+            try:
+                await refresher
+            except asyncio.CancelledError:
+                pass
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version != self._saved_version:
+            self._save_sidecar(snapshot)
+        self._snapshot = None
+        self.query_cache.clear()
+
+    async def get_snapshot(self, refresh: bool = False) -> NewsSnapshot:
+        """현재 스냅샷 반환
+
+        백그라운드 갱신 중에는 변경 확인/재로드 없이 현재 스냅샷을 바로 반환하고
+        (``refresh``는 갱신 태스크에 즉시 확인을 요청), 그렇지 않으면 변경이
+        감지된 경우 재로드 후 반환합니다. ``refresh``도 원본이 그대로면 기존
+        스냅샷을 유지하고, 바뀌었으면 증분으로 재로드합니다.
+        """
+        snapshot = self._snapshot
+        if snapshot is None and self.refreshing_in_background:
+            # 초기 로드가 실패한 상태: 갱신 태스크가 다시 시도하는 동안 빈 스냅샷
+            return self._empty_snapshot()
+        if snapshot is not None and self.refreshing_in_background:
+            if refresh:
+                self.request_refresh(full=True)
+            elif self.staleness() > settings.news_max_staleness:
+                self._on_stale()
+            return snapshot
+        if snapshot is not None and not refresh and not self._is_stale(snapshot):
+            self._checked_at = time.time()
+            return snapshot
+
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 재로드했을 수 있음
+            snapshot = self._snapshot
+            if snapshot is not None and not refresh and not self._is_stale(snapshot):
+                self._checked_at = time.time()
+                return snapshot
+            return await self._reload(full=snapshot is None)
+
+    def _empty_snapshot(self) -> NewsSnapshot:
+        """첫 로드 전에 돌려줄 빈 스냅샷 (버전 0)"""
+        if self._empty is None:
+            self._empty = NewsSnapshot(0, [])
+        return self._empty
+
+    def request_refresh(self, full: bool = False) -> None:
+        """백그라운드 갱신 태스크를 즉시 깨우기 (``full``이면 변경 확인을 건너뛰고 재로드 시도)"""
+        self._refresh_full = self._refresh_full or full
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _on_stale(self) -> None:
+        if not self._stale_warned:
+            self._stale_warned = True
+            logger.warning(
+                f"뉴스 스냅샷이 {self.staleness():.0f}초 동안 확인되지 않음 "
+                f"(허용 {settings.news_max_staleness:.0f}초, 마지막 오류: {self._last_error})"
+            )
+        self.request_refresh()
+
+    async def _refresh_loop(self) -> None:
+        """주기적으로(또는 요청 시) 원본 변경을 확인해 재로드 (실패해도 이전 스냅샷 유지)"""
+        # close()가 먼저 태스크 참조를 지우므로, wait_for가 취소를 삼키는 경우에도 루프 종료
+        while self._refresher is asyncio.current_task():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.news_refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            full, self._refresh_full = self._refresh_full, False
+            try:
+                async with self._lock:
+                    snapshot = self._snapshot
+                    checked_at = time.time()
+                    if full or snapshot is None or await run_blocking(self._is_stale, snapshot):
+                        await self._reload(full=snapshot is None)
+                    else:
+                        self._checked_at = checked_at
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                logger.exception(f"뉴스 스냅샷 백그라운드 갱신 실패 (이전 스냅샷 유지): {e}")
+                continue
+            self._last_error = None
+            self._stale_warned = False
+
+    def staleness(self) -> float:
+        """스냅샷이 원본과 같다고 마지막으로 확인한 뒤 지난 시간(초)"""
+        if self._checked_at is None:
+            if self._snapshot is None:
+                # 첫 로드 전이면 0, 시작 시 첫 로드가 실패했으면 시작 후 지난 시간
+                return 0.0 if self._started_at is None else max(0.0, time.time() - self._started_at)
+            return float("inf")
+        return max(0.0, time.time() - self._checked_at)
+
+    def status(self) -> Dict[str, Any]:
+        """스냅샷 신선도 지표 (헬스체크용)"""
+        snapshot = self._snapshot
+        staleness = self.staleness()
+        return {
+            "age_seconds": round(time.time() - snapshot.loaded_at, 3) if snapshot is not None else None,
+            "staleness_seconds": round(staleness, 3),
+            "max_staleness_seconds": settings.news_max_staleness,
+            # 로드된 스냅샷 없이 오류만 있으면(첫 로드 실패) 빈 데이터를 서비스 중이므로 stale
+            "stale": staleness > settings.news_max_staleness or (snapshot is None and self._last_error is not None),
+            "background_refresh": self.refreshing_in_background,
+            "last_error": self._last_error,
+        }
+
+    def _is_stale(self, snapshot: NewsSnapshot) -> bool:
+        """스냅샷이 원본 데이터보다 오래되었는지 확인"""
+        if self.news_repo.backend == "MONGO":
+            return time.time() - snapshot.loaded_at >= settings.news_cache_ttl
+        return self.news_repo.get_signature() != self._signature
+
+    async def _reload(self, full: bool = True) -> NewsSnapshot:
+        """원본에서 데이터를 읽어 새 스냅샷으로 교체
+
+        ``full``이 False이면 마지막 로드 이후 추가된 항목만 읽어 기존
+        스냅샷 뒤에 붙입니다. 원본이 교체된 경우에는 전체를 다시 읽습니다.
+        """
+        # 로드 도중 파일이 바뀌면 다음 확인에서 다시 로드되도록 로드 전에 서명을 기록
+        signature = await run_blocking(self.news_repo.get_signature)
+        checked_at = time.time()
+        if full and self._snapshot is None and await run_blocking(self._restore_sidecar) is not None:
+            if signature == self._signature:
+                self._checked_at = checked_at
+                return self._snapshot
+            # 사이드카 저장 이후 추가된 라인만 읽기 (파일이 교체되었으면 전체)
+            full = False
+        if not full and signature is not None and signature == self._signature:
+            # 원본이 그대로면 다시 읽지 않음 (새로고침 요청도 스냅샷/사이드카 유지)
+            self._checked_at = checked_at
+            return self._snapshot
+        if full:
+            items, full = await self.news_repo.load_all(), True
+        else:
+            items, full = await self.news_repo.get_updates()
+
+        self._signature = signature
+        self._checked_at = checked_at
+        if not full and not items:
+            # 서명만 바뀌고 추가된 라인이 없으면 기존 스냅샷 유지
+            return self._snapshot
+
+        # 색인 구축은 CPU 작업이므로 스레드에서 수행 (그동안 요청은 이전 스냅샷 사용)
+        version = self._version + 1
+        if full:
+            snapshot = await run_blocking(NewsSnapshot, version, items)
+        else:
+            snapshot = await run_blocking(self._snapshot.extend, version, items)
+        self._version = version
+        self._snapshot = snapshot
+        logger.info(
+            f"뉴스 스냅샷 교체: v{snapshot.version}, {len(snapshot)}개 항목 "
+            f"({'전체' if full else f'{len(items)}개 추가'})"
+        )
+        if full and snapshot.version != self._saved_version:
+            await run_blocking(self._save_sidecar, snapshot)
+        return snapshot
+
+    def _sidecar_enabled(self) -> bool:
+        # 디렉터리/글롭 소스는 파일별 캐시로 증분 로드하므로 사이드카 미사용
+        repo = self.news_repo
+        return settings.news_snapshot_cache and repo.backend != "MONGO" and repo.file_set is None
+
+    def _restore_sidecar(self) -> Optional[NewsSnapshot]:
+        """사이드카에서 스냅샷과 파일 읽기 위치 복원 (사용할 수 없으면 None)"""
+        if not self._sidecar_enabled():
+            return None
+        news_file = self.news_repo.news_file
+        path = sidecar_path(news_file)
+        meta = read_meta(path)
+        if meta is None or meta.get("config") != snapshot_config():
+            return None
+        try:
+            inode = os.stat(news_file).st_ino
+        except OSError:
+            return None
+        if meta.get("source") != str(news_file.resolve()) or meta["reader"]["inode"] != inode:
+            return None
+
+        started = time.perf_counter()
+        loaded = load_snapshot(path)
+        if loaded is None:
+            return None
+        payload, meta = loaded
+        self.news_repo.restore_reader_state(meta["reader"])
+        self._version += 1
+        snapshot = NewsSnapshot(
+            self._version, payload["items"], columns=payload["columns"],
+            text_index=payload["text_index"], trigram_index=payload["trigram_index"],
+            dedup=payload["dedup"],
+        )
+        self._signature = tuple(meta["signature"])
+        self._snapshot = snapshot
+        self._saved_version = snapshot.version
+        logger.info(
+            f"스냅샷 사이드카에서 로드: v{snapshot.version}, {len(snapshot)}개 항목 "
+            f"({time.perf_counter() - started:.2f}s, {path})"
+        )
+        return snapshot
+
+    def _save_sidecar(self, snapshot: NewsSnapshot) -> None:
+        """현재 스냅샷과 파일 읽기 위치를 사이드카에 기록 (실패해도 서비스는 계속)"""
+        if not self._sidecar_enabled() or self._signature is None:
+            return
+        news_file = self.news_repo.news_file
+        path = sidecar_path(news_file)
+        payload = {
+            "items": snapshot.items,
+            "columns": snapshot.columns,
+            "text_index": snapshot.text_index,
+            "trigram_index": snapshot.trigram_index,
+            "dedup": snapshot.dedup,
+        }
+        meta = {
+            "config": snapshot_config(),
+            "source": str(news_file.resolve()),
+            "signature": list(self._signature),
+            "reader": self.news_repo.get_reader_state(),
+            "count": len(snapshot),
+        }
+        try:
+            started = time.perf_counter()
+            size = save_snapshot(path, payload, meta)
+        except Exception as e:
+            logger.warning(f"스냅샷 사이드카 저장 실패: {path} ({e})")
+            return
+        self._saved_version = snapshot.version
+        logger.info(
+            f"스냅샷 사이드카 저장: v{snapshot.version}, {size / 1e6:.1f} MB "
+            f"({time.perf_counter() - started:.2f}s, {path})"
+        )
+
+
+# 전역 뉴스 스토어 인스턴스
+news_store = NewsStore()
@@ -0,0 +1,118 @@
+"""
+뉴스 검색 결과 캐시 - 쿼리별 결과 레코드 번호의 LRU
+
+같은 쿼리(첫 페이지, 그룹별 피드 등)가 반복해서 들어오므로, 정규화한 쿼리와
+스냅샷 버전을 키로 결과 페이지의 레코드 번호와 전체 개수를 보관합니다.
+스냅샷이 바뀌면 버전이 달라져 기존 항목은 더 이상 조회되지 않고 LRU로
+밀려납니다. 신선도 정렬은 시간이 지나면 순서가 달라질 수 있으므로 항목마다
+유효 시간을 둡니다.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from ..schemas.news import NewsQuery
+
+# 키/항목 객체 등 레코드 번호 배열 외의 항목당 대략적인 메모리 (바이트)
+_ENTRY_OVERHEAD = 200
+
+
+def normalize_query(query: NewsQuery, version: int) -> Tuple[Hashable, ...]:
+    """캐시 키 (refresh 제외, 결과에 영향 없는 차이는 통일)
+
+    검색어는 모든 검색 경로에서 소문자로 비교하므로 소문자로, 빈 문자열 조건은
+    조건 없음(None)으로 맞춥니다.
+    """
+    return (
+        version,
+        query.q.lower() if query.q else None,
+        query.source or None,
+        query.group or None,
+        query.sort,
+        query.offset,
+        query.limit,
+        query.cursor or None,
+    )
+
+
+class QueryCache:
+    """메모리 사용량을 제한하는 LRU 검색 결과 캐시
+
+    Args:
+        max_entries: 최대 항목 수 (0이면 캐시하지 않음)
+        max_bytes: 최대 메모리 사용량 (바이트, 근사치)
+        ttl: 항목 유효 시간 (초)
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, int, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, int]]:
+        """(결과 레코드 번호, 전체 개수) 반환, 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[2] >= self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key: Hashable, ids: np.ndarray, total: int) -> None:
+        """결과 저장 (한도를 넘으면 오래 쓰지 않은 항목부터 제거)"""
+        if not self.enabled:
+            return
+        ids = np.array(ids, dtype=np.int64)
+        ids.flags.writeable = False
+        size = ids.nbytes + sys.getsizeof(key) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (ids, total, time.monotonic(), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+    def clear(self) -> None:
+        """모든 항목 제거 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/제거 카운터와 현재 사용량"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
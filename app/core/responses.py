@@ -0,0 +1,19 @@
+"""
+API 응답 클래스 - 애플리케이션 JSON 코덱으로 직렬화
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from ..utils.json_codec import codec
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSON 코덱(orjson 또는 표준 json)으로 본문을 만드는 기본 응답 클래스
+
+    ``fastapi.responses.ORJSONResponse``와 같은 역할이며, orjson이 없으면
+    표준 json으로 같은 형식(compact, 비ASCII 유지)의 본문을 만듭니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return codec.dumps(content)
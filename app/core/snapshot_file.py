@@ -0,0 +1,147 @@
+"""
+뉴스 스냅샷 사이드카 파일 - 파일 백엔드 재시작 시 재파싱 생략
+
+로드한 스냅샷(레코드, 정규화된 발행 시각, 컬럼과 검색 색인)과 JSONL 읽기
+위치를 뉴스 파일 옆의 바이너리 파일에 저장해 두고, 다음 시작 시 원본
+파일이 같으면(크기/mtime/inode, 읽은 구간의 끝부분 내용) 그대로 불러옵니다.
+원본에 라인이 추가되었으면 불러온 뒤 추가분만 읽고, 교체되었거나 형식/설정이
+다르면 사용하지 않고 전체를 다시 파싱합니다.
+
+파일 형식::
+
+    MAGIC(8) | 헤더 길이(u64) | 헤더(JSON) | pickle 본문 | 버퍼...
+
+NumPy 배열은 pickle protocol 5의 out-of-band 버퍼로 따로 기록하고, 읽을 때
+파일을 mmap해서 배열이 파일을 직접 참조하도록 합니다(복사 없음, 읽기 전용).
+
+사이드카는 뉴스 파일과 같은 디렉터리의 신뢰할 수 있는 파일로 취급합니다
+(pickle 형식이므로 외부에서 받은 파일을 사용하면 안 됩니다).
+"""
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RFNSNAP\x01"
+
+# 저장 구조가 바뀌면 올려서 이전 사이드카를 무시
+FORMAT_VERSION = 3
+
+# out-of-band 버퍼 정렬 (바이트)
+_ALIGNMENT = 64
+
+_HEADER_LEN = struct.Struct("<Q")
+
+
+def sidecar_path(news_file: Path) -> Path:
+    """뉴스 파일의 사이드카 경로 (설정이 없으면 ``<뉴스 파일>.snapshot``)"""
+    if settings.news_snapshot_path:
+        return Path(settings.news_snapshot_path)
+    return news_file.with_name(news_file.name + ".snapshot")
+
+
+def snapshot_config() -> Dict[str, Any]:
+    """스냅샷 내용에 영향을 주는 설정 (다르면 사이드카를 쓰지 않음)"""
+    return {
+        "format": FORMAT_VERSION,
+        "app_version": settings.app_version,
+        "file_mode": settings.news_file_mode,
+        "compact_records": settings.news_compact_records,
+        "text_index": settings.news_text_index,
+        "trigram_index": settings.news_trigram_index,
+        "dedup": settings.news_dedup,
+        "segment_hours": settings.news_segment_hours,
+    }
+
+
+def save_snapshot(path: Path, payload: Any, meta: Dict[str, Any]) -> int:
+    """스냅샷 저장 (임시 파일에 쓴 뒤 교체하므로 동시에 읽어도 안전)
+
+    Returns:
+        기록한 바이트 수
+    """
+    buffers = []
+    body = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+
+    layout = []
+    position = 0
+    for buffer in buffers:
+        raw = buffer.raw()
+        layout.append((position, raw.nbytes))
+        position += -(-raw.nbytes // _ALIGNMENT) * _ALIGNMENT
+    header = json.dumps({**meta, "body": len(body), "buffers": layout}).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LEN.pack(len(header)))
+            f.write(header)
+            f.write(body)
+            data_start = f.tell()
+            data_start += -data_start % _ALIGNMENT
+            for (offset, _), buffer in zip(layout, buffers):
+                f.seek(data_start + offset)
+                f.write(buffer.raw())
+            size = f.tell()
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def read_meta(path: Path) -> Optional[Dict[str, Any]]:
+    """사이드카 헤더만 읽기 (없거나 형식이 다르면 None)"""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            (length,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+            return json.loads(f.read(length))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def load_snapshot(path: Path) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """사이드카 읽기 → (저장한 객체, 헤더), 없거나 손상되었으면 None
+
+    NumPy 배열은 mmap된 파일 영역을 직접 참조합니다.
+    """
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        view = memoryview(mm)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            return None
+        start = len(MAGIC)
+        (length,) = _HEADER_LEN.unpack_from(view, start)
+        start += _HEADER_LEN.size
+        meta = json.loads(bytes(view[start:start + length]))
+        start += length
+        body = view[start:start + meta["body"]]
+        data_start = start + meta["body"]
+        data_start += -data_start % _ALIGNMENT
+        buffers = [view[data_start + offset:data_start + offset + size] for offset, size in meta["buffers"]]
+        payload = pickle.loads(body, buffers=buffers)
+        return payload, meta
+    except Exception as e:
+        logger.warning(f"스냅샷 사이드카를 읽을 수 없음, 전체 파싱으로 진행: {path} ({e})")
+        return None
@@ -3,10 +3,12 @@ RedFin API - FastAPI 메인 애플리케이션
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from .core.config import settings
+from .core.responses import CodecJSONResponse
 from .core.database import database
+from .core.executor import shutdown_executor
+from .core.news_store import news_store
 from .api.v1.api import api_router
 
 # FastAPI 앱 초기화
@@ -15,7 +17,8 @@ app = FastAPI(
     description=settings.app_description,
     version=settings.app_version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=CodecJSONResponse
 )
 
 # CORS 미들웨어 설정
@@ -35,12 +38,15 @@ app.include_router(api_router, prefix="/api/v1")
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     await database.connect()
+    await news_store.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    await news_store.close()
     await database.disconnect()
+    shutdown_executor()
 
 
 @app.get("/")
@@ -68,7 +74,7 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """전역 예외 처리"""
-    return JSONResponse(
+    return CodecJSONResponse(
         status_code=500,
         content={
             "detail": "내부 서버 오류가 발생했습니다",
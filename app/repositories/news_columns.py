@@ -0,0 +1,383 @@
+"""News 컬럼형 표현 - 필터링/정렬용 NumPy 배열
+
+스냅샷의 레코드 목록과 같은 순서로 다음 컬럼을 보관합니다.
+
+- source/group: 사전 인코딩된 int32 코드 배열 (-1 = 값 없음)
+- epoch_us: 로드 시 한 번 정규화한 발행 시각(published → pub_date →
+  processed_at → scraped_at)의 epoch 마이크로초 int64 배열
+- lead_text: 제목/요약을 미리 소문자로 변환해 이어 붙인 문자열. 본문까지 두면
+  레코드의 본문을 압축하지 않은 사본이 하나 더 생기므로 본문은 검색할 때
+  레코드에서 읽음 (mmap 모드에서는 None)
+- time_order: 최신순으로 정렬된 레코드 번호 (같은 시각은 레코드 순서)
+- time_segments: time_order를 발행 시각 구간(기본 하루)별로 나눈 세그먼트 경계.
+  최신순/신선도 검색은 최신 세그먼트부터 확인하고 필요한 개수가 차면 멈춤
+- source_facet/group_facet: 값별 레코드 번호 목록, 개수, 최신 발행 시각
+- hidden: 중복 제거로 숨긴(이전 버전) 레코드 번호. time_order와 값별 색인에서
+  제외되므로 필터/정렬/패싯 결과에 나타나지 않음
+"""
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.date_parser import DateNormalizer
+from .news_dataset import EPOCH_COLUMN, MmapNewsRecords
+from .news_dedup import live_mask
+
+# 날짜가 없거나 파싱할 수 없는 레코드의 epoch 값 (내림차순 정렬 시 맨 뒤)
+MISSING_EPOCH = np.iinfo(np.int64).min
+
+# 검색 텍스트 필드 구분자 (필드 경계를 넘는 부분 일치를 막기 위함)
+TEXT_SEPARATOR = "\x00"
+
+SEARCH_FIELDS = ("title", "summary", "article_text")
+
+# 검색 텍스트 중 컬럼에 미리 만들어 두는 필드 (나머지는 레코드에서 읽음)
+LEAD_FIELDS = ("title", "summary")
+
+# 시간 세그먼트 기본 폭 (마이크로초, 하루)
+SEGMENT_US = 24 * 3600 * 1_000_000
+
+
+class DictionaryColumn:
+    """사전 인코딩된 범주형 컬럼"""
+
+    def __init__(self, codes: np.ndarray, values: List[Any], lookup: Dict[Any, int]):
+        self.codes = codes
+        self.values = values
+        self.lookup = lookup
+
+    @classmethod
+    def encode(
+        cls,
+        raw_values: Sequence[Any],
+        base: Optional["DictionaryColumn"] = None,
+    ) -> "DictionaryColumn":
+        """값 목록을 인코딩 (base가 있으면 기존 사전을 이어서 사용)"""
+        values = list(base.values) if base else []
+        lookup = dict(base.lookup) if base else {}
+        codes = np.empty(len(raw_values), dtype=np.int32)
+        for i, value in enumerate(raw_values):
+            if value is None or not isinstance(value, (str, int, float)):
+                codes[i] = -1
+                continue
+            code = lookup.get(value)
+            if code is None:
+                code = len(values)
+                lookup[value] = code
+                values.append(sys.intern(value) if isinstance(value, str) else value)
+            codes[i] = code
+        if base is not None:
+            codes = np.concatenate([base.codes, codes])
+        return cls(codes, values, lookup)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class FacetIndex:
+    """사전 인코딩 컬럼의 값별 색인
+
+    레코드 번호를 코드 순(같은 코드는 레코드 순)으로 나열한 ``order``와 코드별
+    시작 위치 ``starts``(CSR)를 보관하므로, 값 하나의 레코드 번호 목록은
+    슬라이스 하나로 얻습니다. 값별 레코드 수와 최신 발행 시각도 함께 둡니다.
+    """
+
+    def __init__(
+        self,
+        order: np.ndarray,
+        starts: np.ndarray,
+        counts: np.ndarray,
+        latest: np.ndarray,
+        record_count: int,
+    ):
+        self.order = order
+        self.starts = starts
+        self.counts = counts
+        self.latest = latest
+        # 색인한 레코드 수 (값이 없는 레코드 포함)
+        self.record_count = record_count
+
+    @classmethod
+    def build(
+        cls,
+        column: DictionaryColumn,
+        epoch_us: np.ndarray,
+        base: Optional["FacetIndex"] = None,
+        live: Optional[np.ndarray] = None,
+    ) -> "FacetIndex":
+        """컬럼 색인 생성
+
+        Args:
+            column: 전체 레코드의 사전 인코딩 컬럼
+            epoch_us: 전체 레코드의 발행 시각
+            base: 앞쪽 레코드의 색인. 주어지면 그 뒤의 레코드만 색인해 병합합니다.
+            live: 색인할 레코드 마스크 (None이면 전체)
+        """
+        n_values = len(column.values)
+        start = base.record_count if base else 0
+        codes = column.codes[start:]
+        valid = codes >= 0
+        if live is not None:
+            valid &= live[start:]
+        valid = np.flatnonzero(valid)
+        new_codes = codes[valid]
+        order = valid[np.argsort(new_codes, kind='stable')] + start
+        sorted_codes = np.sort(new_codes, kind='stable')
+
+        counts = np.bincount(new_codes, minlength=n_values).astype(np.int64)
+        latest = np.full(n_values, MISSING_EPOCH, dtype=np.int64)
+        np.maximum.at(latest, new_codes, epoch_us[start:][valid])
+        if base is not None:
+            # 새 레코드를 각 코드 구간의 끝에 삽입 (기존 사전에 없던 코드는 맨 뒤)
+            positions = base.starts[np.minimum(sorted_codes + 1, len(base.counts))]
+            order = np.insert(base.order, positions, order)
+            counts[:len(base.counts)] += base.counts
+            latest[:len(base.latest)] = np.maximum(latest[:len(base.latest)], base.latest)
+
+        starts = np.zeros(n_values + 1, dtype=np.int64)
+        np.cumsum(counts, out=starts[1:])
+        return cls(order, starts, counts, latest, len(column.codes))
+
+    def ids(self, code: int) -> np.ndarray:
+        """코드에 해당하는 레코드 번호 (오름차순)"""
+        return self.order[self.starts[code]:self.starts[code + 1]]
+
+
+def _epoch_us(ts: Optional[float]) -> int:
+    if ts is None:
+        return MISSING_EPOCH
+    return round(ts * 1_000_000)
+
+
+def _field_text(item: Dict[str, Any], field: str) -> str:
+    value = item.get(field) or ''
+    return value if isinstance(value, str) else str(value)
+
+
+def build_search_text(item: Dict[str, Any], fields: Sequence[str] = SEARCH_FIELDS) -> str:
+    """레코드의 검색 텍스트 (소문자, 필드 구분자로 연결)"""
+    return TEXT_SEPARATOR.join(_field_text(item, field) for field in fields).lower()
+
+
+def matches_search_term(item: Dict[str, Any], search_term: str) -> bool:
+    """제목/요약/본문 중 하나에 검색어(소문자)가 포함되는지 확인"""
+    return any(search_term in _field_text(item, field).lower() for field in SEARCH_FIELDS)
+
+
+def segment_bounds(time_keys: np.ndarray, segment_us: int) -> np.ndarray:
+    """최신순 정렬 키를 segment_us 폭의 시각 구간으로 나눈 경계 위치 (첫 값 0, 마지막 값 길이)
+
+    같은 발행 시각은 항상 같은 세그먼트에 들어가며, 발행 시각이 없는 레코드는
+    마지막 세그먼트에 모입니다.
+    """
+    buckets = (~time_keys) // segment_us
+    changes = np.flatnonzero(buckets[1:] != buckets[:-1]) + 1
+    return np.concatenate(([0], changes, [len(time_keys)])).astype(np.int64)
+
+
+class NewsColumns:
+    """뉴스 스냅샷의 컬럼형 표현"""
+
+    def __init__(
+        self,
+        source: DictionaryColumn,
+        group: DictionaryColumn,
+        epoch_us: np.ndarray,
+        lead_text: Optional[List[str]],
+        date_stats: Optional[Counter] = None,
+        time_order: Optional[np.ndarray] = None,
+        source_facet: Optional[FacetIndex] = None,
+        group_facet: Optional[FacetIndex] = None,
+        hidden: Optional[np.ndarray] = None,
+        segment_us: int = SEGMENT_US,
+    ):
+        self.source = source
+        self.group = group
+        self.epoch_us = epoch_us
+        self.lead_text = lead_text
+        # 날짜 필드/형식별 레코드 수 (정규화 통계)
+        self.date_stats = date_stats if date_stats is not None else Counter()
+        # 중복 제거로 숨긴 레코드 (오름차순)와 보이는 레코드 마스크 (숨긴 레코드가 없으면 None)
+        self.hidden = hidden if hidden is not None else np.empty(0, dtype=np.intp)
+        self.live = live_mask(len(epoch_us), self.hidden)
+        # 최신순 순열과 그 순서대로 나열한 정렬 키 (~epoch_us, 오름차순), 숨긴 레코드 제외
+        if time_order is None:
+            time_order = np.argsort(~epoch_us, kind='stable')
+        if self.live is not None:
+            time_order = time_order[self.live[time_order]]
+        self.time_order = time_order
+        self.time_keys = (~epoch_us)[time_order]
+        # 최신순 순열의 시간 세그먼트 경계 (세그먼트 i = time_order[bounds[i]:bounds[i + 1]])
+        self.segment_us = segment_us
+        self.time_segments = segment_bounds(self.time_keys, segment_us)
+        # 소스/그룹 값별 색인
+        self.source_facet = source_facet or FacetIndex.build(source, epoch_us, live=self.live)
+        self.group_facet = group_facet or FacetIndex.build(group, epoch_us, live=self.live)
+
+    def __len__(self) -> int:
+        return len(self.epoch_us)
+
+    @property
+    def live_count(self) -> int:
+        """숨긴 레코드를 뺀 레코드 수"""
+        return len(self.epoch_us) - len(self.hidden)
+
+    def live_ids(self) -> np.ndarray:
+        """숨기지 않은 레코드 번호 (오름차순)"""
+        if self.live is None:
+            return np.arange(len(self.epoch_us))
+        return np.flatnonzero(self.live)
+
+    def visible(self, ids: np.ndarray) -> np.ndarray:
+        """레코드 번호 중 숨긴 레코드를 뺀 것"""
+        return ids if self.live is None else ids[self.live[ids]]
+
+    @classmethod
+    def build(
+        cls,
+        items: Sequence[Dict[str, Any]],
+        base: Optional["NewsColumns"] = None,
+        hidden: Optional[np.ndarray] = None,
+        segment_us: Optional[int] = None,
+    ) -> "NewsColumns":
+        """레코드 목록으로 컬럼 생성
+
+        Args:
+            items: 레코드 목록. mmap 레코드는 로드 시 추출한 경량 필드와
+                정규화된 발행 시각만 사용하며, 제목/요약 텍스트는 만들지 않습니다.
+            base: 앞쪽 레코드의 컬럼. 주어지면 items를 그 뒤에 이어 붙입니다.
+            hidden: 숨길 레코드 번호 (전체 기준, 오름차순, base의 hidden 포함)
+            segment_us: 시간 세그먼트 폭 (None이면 base의 값 또는 하루)
+        """
+        if segment_us is None:
+            segment_us = base.segment_us if base else SEGMENT_US
+        if isinstance(items, MmapNewsRecords):
+            sources = items.columns["source"]
+            groups = items.columns["group"]
+            epochs = items.columns[EPOCH_COLUMN]
+            date_stats = items.date_stats
+            lead_text = None
+        else:
+            normalizer = DateNormalizer()
+            sources = [item.get("source") for item in items]
+            groups = [item.get("group") for item in items]
+            epochs = [normalizer.normalize(item) for item in items]
+            normalizer.log_summary()
+            date_stats = normalizer.stats
+            lead_text = [build_search_text(item, LEAD_FIELDS) for item in items]
+
+        epoch_us = np.fromiter((_epoch_us(ts) for ts in epochs), dtype=np.int64, count=len(epochs))
+        source = DictionaryColumn.encode(sources, base.source if base else None)
+        group = DictionaryColumn.encode(groups, base.group if base else None)
+        if base is None:
+            return cls(source, group, epoch_us, lead_text, date_stats, hidden=hidden, segment_us=segment_us)
+
+        # 새 레코드의 최신순 순열을 기존 순열에 병합 (같은 시각이면 기존 레코드가 앞)
+        new_order = np.argsort(~epoch_us, kind='stable')
+        positions = np.searchsorted(base.time_keys, (~epoch_us)[new_order], side='right')
+        time_order = np.insert(base.time_order, positions, new_order + len(base))
+
+        epoch_us = np.concatenate([base.epoch_us, epoch_us])
+        date_stats = base.date_stats + date_stats
+        if base.lead_text is None or lead_text is None:
+            lead_text = None
+        else:
+            lead_text = base.lead_text + lead_text
+        if hidden is None:
+            hidden = base.hidden
+        if np.searchsorted(hidden, len(base)) > len(base.hidden):
+            # 기존 레코드가 새로 숨겨지면 값별 색인을 다시 만듦 (순열은 생성자에서 걸러냄)
+            return cls(
+                source, group, epoch_us, lead_text, date_stats, time_order,
+                hidden=hidden, segment_us=segment_us,
+            )
+        live = live_mask(len(epoch_us), hidden)
+        return cls(
+            source, group, epoch_us, lead_text, date_stats, time_order,
+            source_facet=FacetIndex.build(source, epoch_us, base.source_facet, live),
+            group_facet=FacetIndex.build(group, epoch_us, base.group_facet, live),
+            hidden=hidden,
+            segment_us=segment_us,
+        )
+
+    def _facet(self, field: str) -> Tuple[DictionaryColumn, FacetIndex]:
+        if field == "source":
+            return self.source, self.source_facet
+        return self.group, self.group_facet
+
+    def _conditions(
+        self, source: Optional[str], group: Optional[str]
+    ) -> Optional[List[Tuple[DictionaryColumn, FacetIndex, int]]]:
+        """(컬럼, 색인, 코드) 조건 목록 (사전에 없는 값이 있으면 None)"""
+        conditions = []
+        for field, value in (("source", source), ("group", group)):
+            if not value:
+                continue
+            column, facet = self._facet(field)
+            code = column.lookup.get(value)
+            if code is None:
+                return None
+            conditions.append((column, facet, code))
+        return conditions
+
+    def filter_ids(self, source: Optional[str] = None, group: Optional[str] = None) -> Optional[np.ndarray]:
+        """소스/그룹 조건을 만족하는 레코드 번호 (오름차순, 조건이 없으면 None)
+
+        값별 색인에서 더 짧은 목록을 가져와 나머지 조건은 코드로 확인합니다.
+        """
+        if not source and not group:
+            return None
+        conditions = self._conditions(source, group)
+        if conditions is None:
+            return np.empty(0, dtype=np.intp)
+        postings = sorted(
+            ((facet.ids(code), column, code) for column, facet, code in conditions),
+            key=lambda posting: len(posting[0]),
+        )
+        ids = postings[0][0]
+        for _, column, code in postings[1:]:
+            ids = ids[column.codes[ids] == code]
+        return ids
+
+    def match(self, ids: np.ndarray, source: Optional[str] = None, group: Optional[str] = None) -> Optional[np.ndarray]:
+        """주어진 레코드 번호가 소스/그룹 조건을 만족하는지 (조건이 없으면 None)"""
+        if not source and not group:
+            return None
+        conditions = self._conditions(source, group)
+        if conditions is None:
+            return np.zeros(len(ids), dtype=bool)
+        keep = np.ones(len(ids), dtype=bool)
+        for column, _, code in conditions:
+            keep &= column.codes[ids] == code
+        return keep
+
+    def facet_counts(self, field: str) -> List[Tuple[Any, int, Optional[int]]]:
+        """값별 (값, 레코드 수, 최신 발행 시각 epoch_us 또는 None) 목록"""
+        column, facet = self._facet(field)
+        return [
+            (value, int(count), None if latest == MISSING_EPOCH else int(latest))
+            for value, count, latest in zip(column.values, facet.counts.tolist(), facet.latest.tolist())
+            if count
+        ]
+
+    def contains(
+        self,
+        ids: Iterable[int],
+        search_term: str,
+        items: Sequence[Dict[str, Any]],
+    ) -> List[int]:
+        """검색어(소문자)를 포함하는 레코드 번호만 반환
+
+        제목/요약은 미리 만든 텍스트에서 확인하고, 거기에 없을 때만 레코드의
+        본문을 읽습니다. 제목/요약 텍스트가 없으면(mmap 모드) 레코드를 디코딩해서
+        확인합니다.
+        """
+        text = self.lead_text
+        if text is None or TEXT_SEPARATOR in search_term:
+            return [i for i in ids if matches_search_term(items[i], search_term)]
+        return [
+            i for i in ids
+            if search_term in text[i] or search_term in _field_text(items[i], "article_text").lower()
+        ]
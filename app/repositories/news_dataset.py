@@ -0,0 +1,180 @@
+"""News 데이터셋 - mmap 기반 JSONL 레코드 시퀀스
+
+대용량 뉴스 파일을 디코딩된 dict로 모두 들고 있지 않도록, 파일을 mmap하고
+라인 시작 오프셋(``array('Q')``)과 필터/정렬에 필요한 일부 필드만 메모리에
+보관합니다. 전체 레코드는 실제로 반환할 때만 JSON 코덱으로 디코딩합니다.
+"""
+import mmap
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.date_parser import DateNormalizer
+from ..utils.json_codec import codec
+from .news_dedup import dedup_keys
+from .news_record import project_fields
+
+# mmap 모드에서 메모리에 유지하는 범주형 필드 (필터링용, 문자열 인터닝)
+LIGHT_FIELDS = ("source", "group")
+
+# 정규화된 발행 시각(epoch 초) 컬럼 이름 (정렬용)
+EPOCH_COLUMN = "epoch"
+
+# 중복 제거용 guid/link 해시 키 컬럼 (array('q'), 0 = 값 없음)
+KEY_COLUMNS = ("guid_key", "link_key")
+
+
+def _light_value(item: Dict[str, Any], field: str) -> Any:
+    value = item.get(field)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class MmapNewsRecords(Sequence):
+    """mmap된 JSONL 파일 위의 지연 디코딩 레코드 시퀀스
+
+    인덱싱할 때마다 해당 라인을 디코딩하므로, 같은 레코드를 반복해서
+    읽는 코드는 결과를 직접 보관해야 합니다.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        offsets: array,
+        columns: Dict[str, List[Any]],
+        mm: Optional[mmap.mmap] = None,
+        date_stats: Optional[Counter] = None,
+    ):
+        self.file_path = file_path
+        self.offsets = offsets
+        self.columns = columns
+        self.date_stats = date_stats if date_stats is not None else Counter()
+        self._mm = mm if mm is not None else self._open_mmap(file_path)
+
+    @staticmethod
+    def _open_mmap(file_path: Path) -> Optional[mmap.mmap]:
+        with open(file_path, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def from_lines(
+        cls,
+        file_path: Path,
+        lines: Iterable[Tuple[int, Any]],
+    ) -> "MmapNewsRecords":
+        """(오프셋, 레코드) 스트림에서 오프셋, 경량 필드, 정규화된 발행 시각, 중복 키만 추려 생성"""
+        offsets = array('Q')
+        columns: Dict[str, Any] = {field: [] for field in LIGHT_FIELDS + (EPOCH_COLUMN,)}
+        columns.update((field, array('q')) for field in KEY_COLUMNS)
+        guid_keys, link_keys = (columns[field] for field in KEY_COLUMNS)
+        normalizer = DateNormalizer()
+        for offset, item in lines:
+            if not isinstance(item, dict):
+                continue
+            offsets.append(offset)
+            for field in LIGHT_FIELDS:
+                columns[field].append(_light_value(item, field))
+            columns[EPOCH_COLUMN].append(normalizer.normalize(item))
+            guid_key, link_key = dedup_keys(item)
+            guid_keys.append(guid_key)
+            link_keys.append(link_key)
+        return cls(file_path, offsets, columns, date_stats=normalizer.stats)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("레코드 인덱스 범위 초과")
+        return self._decode(index)
+
+    def __add__(self, other: "MmapNewsRecords") -> "MmapNewsRecords":
+        """같은 파일의 뒤쪽 구간 레코드를 이어 붙인 새 시퀀스 (더 큰 mmap 사용)
+
+        다른 파일의 레코드이면 파일별 시퀀스를 이어 붙인 ``ChainedMmapRecords``를 반환합니다.
+        """
+        if isinstance(other, ChainedMmapRecords) or other.file_path != self.file_path:
+            return ChainedMmapRecords([self]) + other
+        offsets = array('Q', self.offsets)
+        offsets.extend(other.offsets)
+        columns = {
+            field: self.columns[field] + other.columns[field]
+            for field in self.columns
+        }
+        return MmapNewsRecords(
+            self.file_path, offsets, columns, other._mm or self._mm,
+            date_stats=self.date_stats + other.date_stats,
+        )
+
+    def __reduce__(self):
+        # mmap은 저장하지 않고 복원 시 파일을 다시 mmap
+        return (MmapNewsRecords, (self.file_path, self.offsets, self.columns, None, self.date_stats))
+
+    def _decode(self, index: int) -> Dict[str, Any]:
+        start = self.offsets[index]
+        end = self._mm.find(b'\n', start)
+        if end == -1:
+            end = len(self._mm)
+        return codec.loads(self._mm[start:end])
+
+    def get_many(self, indexes: Iterable[int], fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """여러 레코드를 디코딩해서 반환 (fields가 있으면 그 필드만 남김)"""
+        if fields is None:
+            return [self._decode(i) for i in indexes]
+        return [project_fields(self._decode(i), fields) for i in indexes]
+
+
+class ChainedMmapRecords(MmapNewsRecords):
+    """여러 파일의 mmap 레코드 시퀀스를 파일 순서대로 이어 붙인 시퀀스 (디렉터리/글롭 소스)"""
+
+    def __init__(self, parts: Sequence[MmapNewsRecords]):
+        parts = [part for part in parts if len(part)]
+        self.parts = parts
+        self.file_path = parts[-1].file_path if parts else None
+        # 파일별 첫 레코드의 전체 인덱스
+        self.starts = []
+        total = 0
+        for part in parts:
+            self.starts.append(total)
+            total += len(part)
+        self._len = total
+        self.columns = {
+            field: [value for part in parts for value in part.columns[field]]
+            for field in LIGHT_FIELDS + (EPOCH_COLUMN,)
+        }
+        for field in KEY_COLUMNS:
+            keys = self.columns[field] = array('q')
+            for part in parts:
+                keys.extend(part.columns[field])
+        self.date_stats = sum((part.date_stats for part in parts), Counter())
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __add__(self, other: MmapNewsRecords) -> "ChainedMmapRecords":
+        others = other.parts if isinstance(other, ChainedMmapRecords) else [other]
+        parts = list(self.parts)
+        for part in others:
+            if parts and part.file_path == parts[-1].file_path:
+                parts[-1] = parts[-1] + part
+            else:
+                parts.append(part)
+        return ChainedMmapRecords(parts)
+
+    def __reduce__(self):
+        return (ChainedMmapRecords, (self.parts,))
+
+    def _decode(self, index: int) -> Dict[str, Any]:
+        part = bisect_right(self.starts, index) - 1
+        return self.parts[part]._decode(index - self.starts[part])
@@ -0,0 +1,254 @@
+"""News 중복 제거 색인 - 정규화된 guid/link 기준 최신 버전 유지
+
+같은 기사가 수집 실행/소스마다 반복해서 들어오므로, 레코드마다 정규화한
+guid와 link의 64비트 해시 키를 만들고 키 → 최신 레코드 번호 해시 색인을
+유지합니다. 새 레코드가 기존 레코드와 guid나 link 중 하나라도 같으면 기존
+레코드를 이전 버전(superseded)으로 표시합니다(레코드당 O(1)).
+
+- 전체 로드: 이전 버전 레코드는 스냅샷에 넣지 않음(메모리 절약)
+- 증분 추가: 이전 버전 레코드 번호를 ``hidden``에 모아 필터/정렬/패싯에서 제외.
+  키 표는 버전 간에 공유하고 새 키만 추가하므로 추가 비용은 새 레코드 수에 비례
+"""
+import hashlib
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 정규화 시 제거하는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = frozenset(("fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid"))
+
+DedupKeys = Tuple[int, int]
+
+
+def normalize_guid(value: Any) -> Optional[str]:
+    """guid 정규화 (앞뒤 공백 제거, 비어 있으면 None)"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _is_tracking_param(pair: str) -> bool:
+    name = pair.split("=", 1)[0]
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+def normalize_link(value: Any) -> Optional[str]:
+    """link 정규화 (스킴/호스트 소문자, 프래그먼트/추적 파라미터/끝 슬래시 제거)
+
+    로드할 때 레코드마다 호출하므로 urllib 파싱 대신 문자열 연산만 사용합니다.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    value = value.split("#", 1)[0]
+    value, _, query = value.partition("?")
+    if query:
+        query = "&".join(pair for pair in query.split("&") if pair and not _is_tracking_param(pair))
+    scheme_end = value.find("://")
+    if scheme_end > 0:
+        host_end = value.find("/", scheme_end + 3)
+        if host_end == -1:
+            host_end = len(value)
+        head, path = value[:host_end].lower(), value[host_end:] or "/"
+    else:
+        head, path = "", value
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    return f"{head}{path}?{query}" if query else head + path
+
+
+def _hash_key(kind: bytes, value: str) -> int:
+    # 프로세스 간에 같은 값(사이드카 저장)이 되도록 내장 hash() 대신 blake2b 사용, 0은 '키 없음'
+    digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8, person=kind).digest()
+    return int.from_bytes(digest, "little", signed=True) or 1
+
+
+def dedup_keys(item: Dict[str, Any]) -> DedupKeys:
+    """레코드의 (guid 키, link 키), 값이 없으면 0"""
+    guid = normalize_guid(item.get("guid"))
+    link = normalize_link(item.get("link"))
+    return (
+        _hash_key(b"guid", guid) if guid else 0,
+        _hash_key(b"link", link) if link else 0,
+    )
+
+
+class _KeyTable:
+    """여러 버전의 색인이 공유하는 키 → 레코드 번호 표 (추가만 함)
+
+    키마다 최신 레코드 번호를 ``latest``에 두고, 덮어쓴 이전 번호는 ``older``에
+    오름차순으로 남겨 두므로 이전 버전 색인도 자기 레코드 수 이전의 값을 찾습니다.
+    ``record_count``는 표에 반영한 레코드 수(가장 최근 버전)입니다.
+    """
+
+    __slots__ = ("latest", "older", "record_count")
+
+    def __init__(self):
+        self.latest: Dict[int, int] = {}
+        self.older: Dict[int, List[int]] = {}
+        self.record_count = 0
+
+    def get(self, key: int, limit: int) -> Optional[int]:
+        """limit 미만 레코드 중 key를 가진 가장 최근 레코드 번호"""
+        record_id = self.latest.get(key)
+        if record_id is None or record_id < limit:
+            return record_id
+        previous = self.older.get(key)
+        if not previous:
+            return None
+        pos = bisect_left(previous, limit)
+        return previous[pos - 1] if pos else None
+
+    def put(self, key: int, record_id: int) -> Optional[int]:
+        """key의 최신 레코드 번호를 바꾸고 이전 번호를 반환"""
+        previous = self.latest.get(key)
+        if previous is not None:
+            self.older.setdefault(key, []).append(previous)
+        self.latest[key] = record_id
+        return previous
+
+    def truncated(self, limit: int) -> "_KeyTable":
+        """limit 미만 레코드만 남긴 복사본 (공유 표의 중간 버전에서 갈라질 때)"""
+        table = _KeyTable()
+        for key in self.latest:
+            record_id = self.get(key, limit)
+            if record_id is None:
+                continue
+            table.latest[key] = record_id
+            previous = self.older.get(key)
+            if previous and previous[0] < record_id:
+                table.older[key] = previous[:bisect_left(previous, record_id)]
+        table.record_count = limit
+        return table
+
+    def __getstate__(self):
+        return self.latest, self.older, self.record_count
+
+    def __setstate__(self, state):
+        self.latest, self.older, self.record_count = state
+
+
+class DedupKeyView(Mapping):
+    """한 버전 색인의 키 → 최신 레코드 번호 (읽기 전용, 공유 표에서 조회)"""
+
+    def __init__(self, table: _KeyTable, record_count: int, key_count: int):
+        self._table = table
+        self._record_count = record_count
+        self._key_count = key_count
+
+    def __getitem__(self, key: int) -> int:
+        record_id = self._table.get(key, self._record_count)
+        if record_id is None:
+            raise KeyError(key)
+        return record_id
+
+    def __iter__(self) -> Iterator[int]:
+        return (key for key in self._table.latest if self._table.get(key, self._record_count) is not None)
+
+    def __len__(self) -> int:
+        return self._key_count
+
+
+class DedupIndex:
+    """guid/link 키 → 최신 레코드 번호 색인 (스냅샷 버전별로 불변)
+
+    증분 추가로 만든 다음 버전은 키 표를 복사하지 않고 이어서 씁니다. 각 버전은
+    자기 레코드 수 이전의 번호만 보므로 이전 버전의 조회 결과는 바뀌지 않습니다.
+
+    Attributes:
+        ids: 키 → 그 키를 가진 가장 최근 레코드 번호
+        hidden: 이전 버전이 되어 숨긴 레코드 번호 (오름차순)
+        dropped: 전체 로드 시 스냅샷에 넣지 않은 이전 버전 레코드 수
+    """
+
+    def __init__(
+        self,
+        table: _KeyTable,
+        record_count: int,
+        key_count: int,
+        hidden: np.ndarray,
+        dropped: int = 0,
+    ):
+        self._table = table
+        self.record_count = record_count
+        self.key_count = key_count
+        self.hidden = hidden
+        self.dropped = dropped
+
+    @property
+    def ids(self) -> DedupKeyView:
+        return DedupKeyView(self._table, self.record_count, self.key_count)
+
+    @classmethod
+    def build(cls, keys: Iterable[DedupKeys], base: Optional["DedupIndex"] = None) -> "DedupIndex":
+        """레코드 키 목록으로 색인 생성 (base가 있으면 그 뒤에 이어 붙임)
+
+        base가 공유 표의 가장 최근 버전이면 표에 새 키만 추가하고, 그보다 이전
+        버전에서 갈라지면(재시도 등) base까지의 표를 복사해 씁니다.
+        """
+        if base is None:
+            table = _KeyTable()
+        elif base._table.record_count == base.record_count:
+            table = base._table
+        else:
+            table = base._table.truncated(base.record_count)
+        start = base.record_count if base else 0
+        # 구축 중에는 가장 최근 버전이 없음 (중간에 실패하면 다음 구축은 복사본 사용)
+        table.record_count = -1
+        key_count = base.key_count if base else 0
+        superseded = set()
+        count = 0
+        for i, (guid_key, link_key) in enumerate(keys, start):
+            count += 1
+            for key in (guid_key, link_key):
+                if not key:
+                    continue
+                previous = table.put(key, i)
+                if previous is None:
+                    key_count += 1
+                elif previous != i:
+                    superseded.add(previous)
+        table.record_count = start + count
+
+        hidden = np.fromiter(superseded, dtype=np.intp, count=len(superseded))
+        if base is not None:
+            hidden = np.union1d(base.hidden, hidden)
+        else:
+            hidden.sort()
+        return cls(table, start + count, key_count, hidden, base.dropped if base else 0)
+
+    def compact(self, keys: Sequence[DedupKeys]) -> Tuple["DedupIndex", np.ndarray]:
+        """숨긴 레코드를 빼고 다시 번호를 매긴 색인 → (색인, 남긴 레코드 번호)
+
+        전체 로드 시 이전 버전 레코드를 스냅샷에서 빼는 데 사용합니다.
+        남은 레코드끼리는 키가 겹치지 않으므로 새 색인의 hidden은 비어 있습니다.
+        """
+        if not len(self.hidden):
+            return self, np.arange(self.record_count)
+        kept = np.flatnonzero(live_mask(self.record_count, self.hidden))
+        unique = DedupIndex.build(keys[i] for i in kept.tolist())
+        unique.dropped = self.dropped + len(self.hidden)
+        return unique, kept
+
+    def stats(self) -> Dict[str, int]:
+        """중복 통계 (헬스체크용)"""
+        return {
+            "keys": self.key_count,
+            "duplicates": self.dropped + len(self.hidden),
+            "dropped": self.dropped,
+            "hidden": len(self.hidden),
+        }
+
+
+def live_mask(record_count: int, hidden: np.ndarray) -> Optional[np.ndarray]:
+    """숨긴 레코드를 False로 둔 마스크 (숨긴 레코드가 없으면 None)"""
+    if not len(hidden):
+        return None
+    mask = np.ones(record_count, dtype=bool)
+    mask[hidden] = False
+    return mask
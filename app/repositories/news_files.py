@@ -0,0 +1,162 @@
+"""News 파일 집합 - 디렉터리/글롭 패턴으로 지정한 여러 JSONL 파일 소스
+
+수집기는 실행마다 새 파일을 만들기 때문에, ``NEWS_FILE``에 디렉터리나 글롭
+패턴을 지정하면 해당하는 모든 파일을 이름순으로 이어 붙여 하나의 데이터셋으로
+사용합니다.
+
+- 파일마다 증분 리더와 로드한 레코드를 따로 캐시하고 (mtime, size)로 변경을
+  감지하므로, 바뀌었거나 새로 생긴 파일만 읽습니다.
+- 마지막 파일에 라인이 추가되었거나 그 뒤에 새 파일이 생긴 경우는 추가분만
+  반환해 스냅샷을 이어 붙이고, 파일 삭제(보존 기간 정리)나 중간 파일 변경은
+  캐시된 파일별 레코드를 다시 합쳐 전체 스냅샷을 만듭니다(재파싱 없음).
+"""
+import glob
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.data_loader import JsonlTailReader
+from .news_dataset import ChainedMmapRecords, MmapNewsRecords
+
+logger = logging.getLogger(__name__)
+
+# 디렉터리를 지정했을 때 읽는 파일 패턴
+NEWS_FILE_PATTERNS = ("*.jsonl", "*.jsonl.gz", "*.jsonl.zst")
+
+_GLOB_CHARS = frozenset("*?[")
+
+FileSignature = Tuple[str, int, int]
+
+
+def is_multi_file(news_file: Path) -> bool:
+    """디렉터리나 글롭 패턴이면 True"""
+    return news_file.is_dir() or any(char in _GLOB_CHARS for char in str(news_file))
+
+
+def merge_records(parts: Sequence[Sequence[Dict[str, Any]]]) -> Sequence[Dict[str, Any]]:
+    """파일별 레코드를 파일 순서대로 이어 붙이기 (mmap 레코드는 지연 디코딩 유지)"""
+    if parts and all(isinstance(part, MmapNewsRecords) for part in parts):
+        return ChainedMmapRecords(parts)
+    return [item for part in parts for item in part]
+
+
+class _FileEntry:
+    """파일 하나의 리더와 캐시된 레코드"""
+
+    __slots__ = ("reader", "signature", "records")
+
+    def __init__(self, reader: JsonlTailReader):
+        self.reader = reader
+        self.signature: Optional[Tuple[int, int]] = None
+        self.records: Sequence[Dict[str, Any]] = []
+
+
+class NewsFileSet:
+    """디렉터리/글롭 패턴에 해당하는 뉴스 파일 집합
+
+    Args:
+        pattern: 디렉터리 또는 글롭 패턴
+        open_reader: 파일 경로로 증분 리더를 만드는 함수
+        read: 리더의 현재 위치부터 읽어 (레코드, 전체 여부)를 반환하는 함수
+    """
+
+    def __init__(
+        self,
+        pattern: Path,
+        open_reader: Callable[[Path], JsonlTailReader],
+        read: Callable[[JsonlTailReader], Tuple[Sequence[Dict[str, Any]], bool]],
+    ):
+        self.pattern = pattern
+        self._open_reader = open_reader
+        self._read = read
+        self._entries: Dict[Path, _FileEntry] = {}
+        # 마지막으로 반환한 데이터셋의 파일 순서 (None이면 아직 없거나 캐시를 비움)
+        self._order: Optional[List[Path]] = None
+
+    def list_files(self) -> List[Path]:
+        """대상 파일 목록 (이름순)"""
+        if self.pattern.is_dir():
+            paths = {path for name in NEWS_FILE_PATTERNS for path in self.pattern.glob(name)}
+        else:
+            paths = {Path(name) for name in glob.glob(str(self.pattern))}
+        return sorted(path for path in paths if path.is_file())
+
+    def signature(self) -> Tuple[FileSignature, ...]:
+        """파일 집합의 변경 감지용 서명 (파일별 이름, mtime_ns, size)"""
+        signature = []
+        for path in self.list_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def reset(self) -> None:
+        """파일별 캐시 비우기 (다음 로드는 모든 파일을 다시 읽어 전체 반환)"""
+        self._entries.clear()
+        self._order = None
+
+    def _refresh(self, path: Path) -> Tuple[Sequence[Dict[str, Any]], bool, bool]:
+        """파일 하나를 갱신 → (새 레코드, 전체 재로드 여부, 변경 여부)"""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = _FileEntry(self._open_reader(path))
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == entry.signature:
+            return [], False, False
+
+        records, full = self._read(entry.reader)
+        entry.signature = signature
+        if full:
+            entry.records = records
+        elif len(records):
+            entry.records = entry.records + records
+        return records, full, True
+
+    def load_all(self) -> Sequence[Dict[str, Any]]:
+        """모든 파일의 레코드를 이어 붙여 반환 (바뀐 파일만 다시 읽음)"""
+        data, _ = self._collect(incremental=False)
+        return data
+
+    def load_updates(self) -> Tuple[Sequence[Dict[str, Any]], bool]:
+        """마지막 로드 이후 변경분 → (레코드, 전체 여부)
+
+        변경이 데이터셋 끝부분(마지막 파일에 추가, 그 뒤에 새 파일)에만 있으면
+        추가된 레코드만, 그 밖의 변경이면 전체 레코드를 반환합니다.
+        """
+        return self._collect(incremental=True)
+
+    def _collect(self, incremental: bool) -> Tuple[Sequence[Dict[str, Any]], bool]:
+        files = []
+        changes = []
+        for path in self.list_files():
+            try:
+                changes.append(self._refresh(path))
+            except FileNotFoundError as e:  # 목록 조회 후 삭제된 파일
+                logger.warning(f"뉴스 파일이 삭제되어 제외: {path} ({e})")
+                continue
+            # 그 밖의 읽기 오류(손상된 압축 파일 등)는 전달해 이전 스냅샷을 유지
+            files.append(path)
+        previous = self._order
+        # 이전 파일 순서가 그대로 앞부분에 남아 있어야 이어 붙일 수 있음
+        tail_only = incremental and previous is not None and files[:len(previous)] == previous
+        appended: List[Sequence[Dict[str, Any]]] = []
+        last = len(previous) - 1 if previous is not None else -1
+        for index, (records, full, changed) in enumerate(changes):
+            if not changed:
+                continue
+            if index < last or (index == last and full):
+                tail_only = False
+            if len(records):
+                appended.append(records)
+
+        for path in set(self._entries) - set(files):
+            logger.info(f"뉴스 파일 제외: {path}")
+            del self._entries[path]
+        self._order = files
+
+        if tail_only:
+            return merge_records(appended), False
+        return merge_records([self._entries[path].records for path in files]), True
@@ -0,0 +1,217 @@
+"""News 레코드 - 메모리 모드용 압축 레코드 타입
+
+메모리 모드에서 뉴스 항목마다 dict를 두면 키 테이블과 반복되는 값(소스,
+그룹, 태그, 수집 시각 등)이 레코드 수만큼 중복됩니다. ``NewsRecord``는
+
+- 자주 쓰는 필드를 ``__slots__``에 보관하고 범주형 문자열은 인터닝하며,
+- 태그/작성자 같은 목록은 튜플로 바꿔 같은 내용이면 한 객체를 공유하고,
+- 본문(article_text)과 그 밖의 필드는 압축 JSON 바이트로 두었다가
+  읽을 때마다 디코딩합니다.
+
+읽기 전용 Mapping이므로 기존 ``item.get(...)`` 코드를 그대로 사용할 수 있습니다.
+"""
+import sys
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.json_codec import codec
+
+# __slots__로 보관하는 필드 (범주형/짧은 값)
+SLOT_FIELDS = (
+    "guid", "id", "source", "group", "title", "link",
+    "published", "pub_date", "processed_at", "scraped_at",
+    "summary", "author", "category", "authors", "tags", "key_entities",
+    "content_type", "language", "readability_score", "text_length",
+)
+
+# 인터닝하는 문자열 필드 (값 종류가 적거나 여러 레코드가 같은 값을 공유)
+INTERNED_FIELDS = frozenset((
+    "source", "group", "author", "category", "content_type", "language",
+    "published", "pub_date", "processed_at", "scraped_at",
+))
+
+# 튜플로 바꿔 공유하는 목록 필드
+LIST_FIELDS = frozenset(("authors", "tags", "key_entities"))
+
+# 이 크기(바이트) 이상인 나머지 필드 JSON은 zlib으로 압축
+_COMPRESS_MIN_BYTES = 256
+
+_MISSING = object()
+
+
+def _intern_value(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_tuple(values: list, pool: Optional[Dict[Tuple[Any, ...], Tuple[Any, ...]]]) -> Tuple[Any, ...]:
+    """목록을 튜플로 변환하고 풀에 같은 내용이 있으면 기존 튜플을 반환"""
+    key = tuple(_intern_value(value) for value in values)
+    if pool is None:
+        return key
+    try:
+        return pool.setdefault(key, key)
+    except TypeError:  # 해시할 수 없는 원소 (중첩 객체)
+        return key
+
+
+def _encode_heavy(fields: Dict[str, Any]) -> bytes:
+    raw = codec.dumps(fields)
+    if len(raw) >= _COMPRESS_MIN_BYTES:
+        return zlib.compress(raw, 1)
+    return raw
+
+
+def _decode_heavy(data: bytes) -> Dict[str, Any]:
+    # JSON 객체는 '{'로 시작하므로 그 밖의 값은 zlib 스트림
+    if data[:1] != b'{':
+        data = zlib.decompress(data)
+    return codec.loads(data)
+
+
+class NewsRecord(Mapping):
+    """뉴스 항목 하나 (읽기 전용 Mapping)"""
+
+    __slots__ = SLOT_FIELDS + ("_heavy",)
+
+    @classmethod
+    def from_dict(
+        cls,
+        item: Dict[str, Any],
+        pool: Optional[Dict[Tuple[Any, ...], Tuple[Any, ...]]] = None,
+    ) -> "NewsRecord":
+        """dict 레코드를 변환 (없는 필드는 슬롯을 비워 두어 누락 여부를 유지)
+
+        Args:
+            item: 원본 레코드
+            pool: 같은 내용의 목록 필드 튜플을 공유할 풀 (None이면 공유하지 않음)
+        """
+        record = cls.__new__(cls)
+        heavy = None
+        for key, value in item.items():
+            if key in _SLOT_SET:
+                if key in LIST_FIELDS and type(value) is list:
+                    value = _intern_tuple(value, pool)
+                elif key in INTERNED_FIELDS:
+                    value = _intern_value(value)
+                object.__setattr__(record, key, value)
+            else:
+                if heavy is None:
+                    heavy = {}
+                heavy[key] = value
+        object.__setattr__(record, "_heavy", _encode_heavy(heavy) if heavy else None)
+        return record
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("NewsRecord는 읽기 전용입니다")
+
+    def _heavy_fields(self) -> Dict[str, Any]:
+        heavy = self._heavy
+        return _decode_heavy(heavy) if heavy is not None else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _SLOT_SET:
+            return getattr(self, key, default)
+        return self._heavy_fields().get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NewsRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """일반 dict로 변환 (목록 필드는 list로 복원)"""
+        data = {}
+        for key in SLOT_FIELDS:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                continue
+            data[key] = list(value) if key in LIST_FIELDS and type(value) is tuple else value
+        data.update(self._heavy_fields())
+        return data
+
+    def project(self, fields: Sequence[str]) -> Dict[str, Any]:
+        """지정한 필드만 dict로 (없는 필드는 제외). 슬롯 밖 필드를 요청한 경우에만 본문 등을 디코딩"""
+        data = {}
+        heavy = None
+        for key in fields:
+            if key in _SLOT_SET:
+                value = getattr(self, key, _MISSING)
+                if value is _MISSING:
+                    continue
+                data[key] = list(value) if key in LIST_FIELDS and type(value) is tuple else value
+                continue
+            if heavy is None:
+                heavy = self._heavy_fields()
+            if key in heavy:
+                data[key] = heavy[key]
+        return data
+
+    def __repr__(self) -> str:
+        return f"NewsRecord(guid={self.get('guid')!r}, title={self.get('title')!r})"
+
+    def __reduce__(self):
+        # 슬롯 값을 그대로 저장 (재인코딩 없음). 필드 구성은 레코드 간에 공유
+        keys = tuple(key for key in SLOT_FIELDS if hasattr(self, key))
+        keys = _layouts.setdefault(keys, keys)
+        return (_restore_record, (keys, tuple(getattr(self, key) for key in keys), self._heavy))
+
+
+_SLOT_SET = frozenset(SLOT_FIELDS)
+
+# pickle 시 같은 필드 구성 튜플 공유
+_layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _restore_record(keys: Tuple[str, ...], values: Tuple[Any, ...], heavy: Any) -> NewsRecord:
+    """pickle된 슬롯 값으로 레코드 복원"""
+    record = NewsRecord.__new__(NewsRecord)
+    for key, value in zip(keys, values):
+        object.__setattr__(record, key, value)
+    object.__setattr__(record, "_heavy", heavy)
+    return record
+
+
+def project_fields(item: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """레코드(dict 또는 NewsRecord)에서 지정한 필드만 dict로 (없는 필드는 제외)"""
+    if isinstance(item, NewsRecord):
+        return item.project(fields)
+    return {key: item[key] for key in fields if key in item}
+
+
+def compact_records(items: Iterable[Any]) -> List[NewsRecord]:
+    """dict 레코드 목록을 NewsRecord 목록으로 변환 (dict가 아닌 값은 제외)
+
+    같은 내용의 목록 필드 튜플은 이번 호출 안에서만 공유합니다. 풀을 전역에 두면
+    재로드 후 더 이상 쓰지 않는 튜플도 계속 남기 때문입니다.
+    """
+    pool: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+    return [NewsRecord.from_dict(item, pool) for item in items if isinstance(item, dict)]
@@ -1,13 +1,18 @@
 """News Repository - 뉴스 데이터 접근 계층"""
-import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from pymongo import MongoClient
 from pymongo.collection import Collection
 
 from .base import BaseRepository
 from ..core.config import settings
+from ..core.executor import run_blocking
+from ..utils.compression import detect_compression
+from ..utils.data_loader import JsonlTailReader
+from .news_dataset import MmapNewsRecords
+from .news_files import NewsFileSet, is_multi_file
+from .news_record import compact_records, project_fields
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,10 @@ class NewsRepository(BaseRepository):
         super().__init__(settings.mongo_news_col)
         self.backend = settings.backend
         self.news_file = settings.news_file
+        self.file_mode = settings.news_file_mode
+        self.compact_records = settings.news_compact_records
+        self._tail_reader: Optional[JsonlTailReader] = None
+        self._file_set: Optional[NewsFileSet] = None
         
         # MongoDB 연결 (백엔드가 MONGO인 경우)
         self.mongo_client: Optional[MongoClient] = None
@@ -33,54 +42,150 @@ class NewsRepository(BaseRepository):
                 logger.error(f"MongoDB 연결 실패: {e}")
                 self.backend = "FILE"  # MongoDB 실패 시 파일 백엔드로 폴백
     
-    def _load_file_data(self) -> List[Dict[str, Any]]:
-        """파일에서 뉴스 데이터 로드 (동기)"""
+    @property
+    def file_set(self) -> Optional[NewsFileSet]:
+        """``news_file``이 디렉터리/글롭 패턴이면 파일 집합, 단일 파일이면 None"""
+        if not is_multi_file(self.news_file):
+            return None
+        if self._file_set is None or self._file_set.pattern != self.news_file:
+            self._file_set = NewsFileSet(self.news_file, self._open_reader, self._read_file)
+        return self._file_set
+    
+    def get_signature(self) -> Optional[Tuple[Any, ...]]:
+        """뉴스 파일의 변경 감지용 서명 반환
+
+        단일 파일은 (mtime_ns, size), 디렉터리/글롭 소스는 파일별
+        (경로, mtime_ns, size) 튜플입니다. 파일이 없거나 MONGO 백엔드인 경우
+        None을 반환합니다.
+        """
+        if self.backend == "MONGO":
+            return None
+        file_set = self.file_set
+        if file_set is not None:
+            return file_set.signature()
         try:
-            if not self.news_file.exists():
-                logger.warning(f"뉴스 파일이 존재하지 않음: {self.news_file}")
-                return []
-            
-            data = []
-            with open(self.news_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        if line.strip():
-                            item = json.loads(line.strip())
-                            data.append(item)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"라인 {line_num} JSON 파싱 오류: {e}")
-                        continue
-            
+            stat = self.news_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _get_tail_reader(self) -> JsonlTailReader:
+        """현재 뉴스 파일에 대한 증분 리더 반환"""
+        if self._tail_reader is None or self._tail_reader.file_path != self.news_file:
+            self._tail_reader = self._open_reader(self.news_file)
+        return self._tail_reader
+    
+    def _open_reader(self, file_path: Path) -> JsonlTailReader:
+        return JsonlTailReader(
+            file_path,
+            workers=settings.news_load_workers,
+            parallel_min_bytes=settings.news_parallel_min_bytes,
+        )
+    
+    def get_reader_state(self) -> Optional[Dict[str, Any]]:
+        """파일 읽기 위치 상태 (MONGO 백엔드는 None)"""
+        if self.backend == "MONGO":
+            return None
+        return self._get_tail_reader().get_state()
+    
+    def restore_reader_state(self, state: Dict[str, Any]) -> None:
+        """저장해 둔 파일 읽기 위치 복원 (이후 get_updates는 추가분만 반환)"""
+        self._get_tail_reader().set_state(state)
+    
+    def _read_file(self, reader: JsonlTailReader) -> Tuple[Sequence[Dict[str, Any]], bool]:
+        """리더의 현재 위치부터 읽기
+
+        mmap 모드는 오프셋과 경량 필드만, 메모리 모드는 압축 레코드(NewsRecord)로 보관합니다.
+        gzip/zstd 파일은 원본을 mmap할 수 없으므로 메모리 모드로 읽습니다.
+        """
+        file_path = reader.file_path
+        if self.file_mode == "mmap" and detect_compression(file_path) is not None:
+            logger.warning(f"압축 파일은 mmap 모드를 지원하지 않아 메모리 모드로 로드: {file_path}")
+        elif self.file_mode == "mmap":
+            records = MmapNewsRecords.from_lines(file_path, reader.iter_new())
+            return records, reader.rewound
+        if self.compact_records:
+            records = compact_records(item for _, item in reader.iter_new())
+            return records, reader.rewound
+        return reader.read_new()
+    
+    def _load_file_data(self) -> Sequence[Dict[str, Any]]:
+        """파일에서 뉴스 데이터 전체 로드 (동기, 오류는 읽기 위치를 초기화한 뒤 그대로 전달)"""
+        file_set = self.file_set
+        try:
+            if file_set is not None:
+                # 파일별 캐시를 유지해 바뀐 파일만 다시 읽음
+                data = file_set.load_all()
+                logger.info(f"{len(file_set.list_files())}개 파일에서 {len(data)}개 뉴스 항목 로드")
+                return data
+            reader = self._get_tail_reader()
+            reader.reset()
+            data, _ = self._read_file(reader)
             logger.info(f"파일에서 {len(data)}개 뉴스 항목 로드")
             return data
             
         except Exception as e:
             logger.error(f"파일 데이터 로드 오류: {e}")
-            return []
+            self._reset_readers()
+            raise
     
-    def _load_mongo_data_sync(self, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """MongoDB에서 뉴스 데이터 로드 (동기)"""
+    def _load_file_updates(self) -> Tuple[Sequence[Dict[str, Any]], bool]:
+        """마지막 로드 이후 파일에 추가된 뉴스만 로드 (동기, 오류는 그대로 전달)"""
+        file_set = self.file_set
         try:
-            if not self.mongo_collection:
-                logger.error("MongoDB 컬렉션이 초기화되지 않음")
-                return []
+            if file_set is not None:
+                data, full = file_set.load_updates()
+            else:
+                data, full = self._read_file(self._get_tail_reader())
+            if full:
+                logger.info(f"파일에서 {len(data)}개 뉴스 항목 로드")
+            else:
+                logger.info(f"파일에 추가된 {len(data)}개 뉴스 항목 로드")
+            return data, full
             
+        except Exception as e:
+            logger.error(f"파일 데이터 로드 오류: {e}")
+            self._reset_readers()
+            raise
+    
+    def _reset_readers(self) -> None:
+        """읽기 위치를 신뢰할 수 없으므로 다음 로드는 처음부터"""
+        if self.file_set is not None:
+            self.file_set.reset()
+        else:
+            self._get_tail_reader().reset()
+    
+    def _load_mongo_data_sync(self, query: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """MongoDB에서 뉴스 데이터 로드 (동기, 오류는 그대로 전달)"""
+        # pymongo Collection은 bool() 평가를 지원하지 않으므로 None과 비교
+        if self.mongo_collection is None:
+            raise RuntimeError("MongoDB 컬렉션이 초기화되지 않음")
+        
+        try:
             filter_query = query or {}
             cursor = self.mongo_collection.find(filter_query)
             data = list(cursor)
-            
-            logger.info(f"MongoDB에서 {len(data)}개 뉴스 항목 로드")
-            return data
-            
         except Exception as e:
             logger.error(f"MongoDB 데이터 로드 오류: {e}")
-            return []
+            raise
+        
+        logger.info(f"MongoDB에서 {len(data)}개 뉴스 항목 로드")
+        return data
     
-    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
-        """ID로 뉴스 조회"""
+    @staticmethod
+    def _projection(fields: Optional[Sequence[str]]) -> Optional[Dict[str, int]]:
+        """필드 목록 → MongoDB projection (본문 등 나머지 필드는 서버에서 제외)"""
+        if fields is None:
+            return None
+        projection = {field: 1 for field in fields}
+        projection.setdefault("_id", 0)
+        return projection
+    
+    async def find_by_id(self, id: str, fields: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """ID로 뉴스 조회 (fields가 있으면 그 필드만)"""
         if self.backend == "MONGO":
-            if self.mongo_collection:
-                return self.mongo_collection.find_one({"_id": id})
+            if self.mongo_collection is not None:
+                return await run_blocking(self.mongo_collection.find_one, {"_id": id}, self._projection(fields))
         # 파일 백엔드는 ID 조회 미지원
         return None
     
@@ -89,19 +194,23 @@ class NewsRepository(BaseRepository):
         filter_dict: Optional[Dict[str, Any]] = None,
         skip: int = 0,
         limit: int = 100,
-        sort: Optional[List[tuple]] = None
+        sort: Optional[List[tuple]] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
-        """여러 뉴스 조회"""
+        """여러 뉴스 조회 (fields가 있으면 그 필드만, MONGO 백엔드는 projection)"""
         if self.backend == "MONGO":
-            if self.mongo_collection:
-                cursor = self.mongo_collection.find(filter_dict or {})
+            if self.mongo_collection is not None:
+                cursor = self.mongo_collection.find(filter_dict or {}, self._projection(fields))
                 if sort:
                     cursor = cursor.sort(sort)
                 cursor = cursor.skip(skip).limit(limit)
-                return list(cursor)
+                return await run_blocking(list, cursor)
         
         # 파일 백엔드
-        data = self._load_file_data()
+        try:
+            data = list(await run_blocking(self._load_file_data))
+        except Exception:
+            return []
         
         # 필터링 (간단한 구현)
         if filter_dict:
@@ -122,13 +231,41 @@ class NewsRepository(BaseRepository):
                 data.sort(key=lambda x: x.get(field, ''), reverse=(direction == -1))
         
         # 페이징
-        return data[skip:skip + limit]
+        data = data[skip:skip + limit]
+        if fields is not None:
+            data = [project_fields(item, fields) for item in data]
+        return data
     
-    async def get_all(self) -> List[Dict[str, Any]]:
-        """모든 뉴스 조회"""
+    async def load_all(self) -> Sequence[Dict[str, Any]]:
+        """모든 뉴스 로드 (mmap 모드에서는 지연 디코딩 시퀀스, 이벤트 루프 밖에서 로드)
+
+        로드 오류는 호출자에게 그대로 전달하므로, 스냅샷 스토어는 빈 결과 대신
+        이전 스냅샷을 유지합니다.
+        """
+        if self.backend == "MONGO":
+            return await run_blocking(self._load_mongo_data_sync)
+        return await run_blocking(self._load_file_data)
+    
+    async def get_all(self) -> Sequence[Dict[str, Any]]:
+        """모든 뉴스 조회 (로드 오류 시 빈 목록)"""
+        try:
+            return await self.load_all()
+        except Exception:
+            return []
+    
+    async def get_updates(self) -> Tuple[Sequence[Dict[str, Any]], bool]:
+        """마지막 로드 이후 변경분 조회
+
+        Returns:
+            (뉴스 목록, 전체 여부). 파일 백엔드는 추가된 라인만 반환하며,
+            파일이 교체되었거나 MONGO 백엔드인 경우 전체 데이터를 반환합니다.
+
+        Raises:
+            로드 오류 (읽기 위치는 초기화되어 다음 호출은 전체를 다시 읽음)
+        """
         if self.backend == "MONGO":
-            return self._load_mongo_data_sync()
-        return self._load_file_data()
+            return await run_blocking(self._load_mongo_data_sync), True
+        return await run_blocking(self._load_file_updates)
     
     async def get_sources(self) -> List[str]:
         """사용 가능한 소스 목록 조회"""
@@ -146,6 +283,6 @@ class NewsRepository(BaseRepository):
     
     def __del__(self):
         """소멸자 - MongoDB 연결 정리"""
-        if self.mongo_client:
+        if self.mongo_client is not None:
             self.mongo_client.close()
 
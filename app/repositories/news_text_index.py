@@ -0,0 +1,151 @@
+"""News 전문 검색 역색인 - BM25 관련도 정렬
+
+단어(term) → 문서 번호 포스팅 리스트를 스냅샷과 함께 만들고, 재로드 시에는
+추가된 문서만 색인합니다. 필드 가중치(제목 > 요약 > 본문)를 적용한 단어
+빈도로 BM25 점수를 계산합니다.
+
+포스팅 리스트는 문서 번호 오름차순으로 뒤에만 추가되므로, 여러 스냅샷이
+같은 색인을 공유하고 각 스냅샷은 자신의 문서 수까지만 읽습니다.
+"""
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 필드별 단어 빈도 가중치
+FIELD_WEIGHTS = (("title", 3.0), ("summary", 2.0), ("article_text", 1.0))
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 목록 (한글은 공백/문장부호 기준 어절 단위)"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """append-only 역색인 (여러 스냅샷이 공유)"""
+
+    def __init__(self):
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.doc_lengths = array('f')
+        self.total_length = 0.0
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, items: Iterable[Dict[str, Any]]) -> None:
+        """문서를 현재 문서 수 뒤의 번호로 색인"""
+        postings = self.postings
+        doc_id = self.doc_count
+        for item in items:
+            weighted_tf: Dict[str, float] = defaultdict(float)
+            length = 0.0
+            for field, weight in FIELD_WEIGHTS:
+                value = item.get(field)
+                if not value:
+                    continue
+                tokens = tokenize(value if isinstance(value, str) else str(value))
+                length += weight * len(tokens)
+                for token in tokens:
+                    weighted_tf[token] += weight
+
+            for token, tf in weighted_tf.items():
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = (array('I'), array('f'))
+                posting[0].append(doc_id)
+                posting[1].append(tf)
+            self.doc_lengths.append(length)
+            self.total_length += length
+            doc_id += 1
+
+
+class TextIndexView:
+    """스냅샷 시점(문서 수)까지만 보는 역색인 뷰"""
+
+    def __init__(self, index: InvertedIndex, doc_count: int, total_length: float):
+        self.index = index
+        self.doc_count = doc_count
+        self.total_length = total_length
+        # 공유 array는 색인 중 크기가 바뀌므로 버퍼를 직접 참조하지 않고 복사본 사용
+        self.doc_lengths = np.array(index.doc_lengths[:doc_count], dtype=np.float32)
+
+    @classmethod
+    def build(cls, items: Iterable[Dict[str, Any]]) -> "TextIndexView":
+        """새 색인을 만들고 전체 문서를 색인"""
+        index = InvertedIndex()
+        index.add(items)
+        return cls(index, index.doc_count, index.total_length)
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> Optional["TextIndexView"]:
+        """추가된 문서만 색인한 다음 스냅샷용 뷰
+
+        공유 색인이 이 뷰보다 앞서 있으면(다른 경로로 이미 확장된 경우)
+        공유할 수 없으므로 None을 반환하며, 호출자가 새로 만들어야 합니다.
+        """
+        if self.index.doc_count != self.doc_count:
+            return None
+        self.index.add(items)
+        return TextIndexView(self.index, self.index.doc_count, self.index.total_length)
+
+    def _posting(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        posting = self.index.postings.get(term)
+        if posting is None:
+            return None
+        docs, tfs = posting
+        cut = bisect_left(docs, self.doc_count)
+        if cut == 0:
+            return None
+        # 슬라이스 복사본을 사용해야 색인 추가 중에도 안전 (버퍼 export 없음)
+        return (
+            np.frombuffer(docs[:cut], dtype=np.uint32).astype(np.intp),
+            np.frombuffer(tfs[:cut], dtype=np.float32),
+        )
+
+    def search(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """모든 검색 단어를 포함하는 문서와 BM25 점수
+
+        Returns:
+            (문서 번호 오름차순 배열, 같은 순서의 BM25 점수 배열)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64))
+        if not terms or self.doc_count == 0:
+            return empty
+
+        postings = []
+        for term in terms:
+            posting = self._posting(term)
+            if posting is None:
+                return empty
+            postings.append(posting)
+
+        # 짧은 포스팅부터 교집합
+        postings.sort(key=lambda p: len(p[0]))
+        ids = postings[0][0]
+        for docs, _ in postings[1:]:
+            ids = np.intersect1d(ids, docs, assume_unique=True)
+            if len(ids) == 0:
+                return empty
+
+        n = self.doc_count
+        avgdl = self.total_length / n if n else 0.0
+        doc_lengths = self.doc_lengths[ids]
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_lengths / avgdl) if avgdl else BM25_K1
+        scores = np.zeros(len(ids), dtype=np.float64)
+        for docs, tfs in postings:
+            df = len(docs)
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            tf = tfs[np.searchsorted(docs, ids)].astype(np.float64)
+            scores += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+        return ids, scores
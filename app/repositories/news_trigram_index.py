@@ -0,0 +1,176 @@
+"""News 트라이그램 색인 - 부분 문자열 검색 후보 축소
+
+소문자로 변환한 검색 텍스트(제목/요약/본문)의 3글자 조각(trigram)마다
+그 조각을 포함하는 문서 번호 목록을 만듭니다. 검색어의 모든 트라이그램을
+포함하는 문서만 후보로 남기고, 최종 판정은 기존과 같은 부분 문자열 검사로
+하므로 결과는 전체 순회와 동일합니다. 3글자 미만 검색어는 축소하지 않습니다.
+
+트라이그램은 세 코드 포인트(각 21비트)를 uint64 하나로 묶은 키로 표현하며,
+색인은 키 오름차순 CSR 배열(키, 시작 위치, 문서 번호)로 된 불변 세그먼트의
+목록입니다. 재로드 시 추가된 문서는 새 세그먼트로 붙이고, 세그먼트가 많아지면
+하나로 병합합니다.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 이 개수를 넘으면 세그먼트를 하나로 병합
+MAX_SEGMENTS = 8
+
+# 가장 드문 트라이그램도 후보의 이 비율 이상에 있으면 축소 효과가 없으므로 순회
+_SCAN_RATIO = 0.25
+
+# 후보가 이 수 이하로 줄면 나머지 트라이그램 교집합은 생략 (정확 검사로 판정)
+_VERIFY_THRESHOLD = 64
+
+# 한 번에 이어 붙여 색인할 문자 수 (배치 단위 메모리 상한)
+_BATCH_CHARS = 1 << 22
+
+_EMPTY_KEYS = np.empty(0, dtype=np.uint64)
+
+
+def _codes(text: str) -> np.ndarray:
+    """문자열의 코드 포인트 배열 (uint64)"""
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32).astype(np.uint64)
+
+
+def _pack(codes: np.ndarray) -> np.ndarray:
+    """연속한 세 코드 포인트를 키 하나로 묶음 (길이 len(codes) - 2)"""
+    return (codes[:-2] << np.uint64(42)) | (codes[1:-1] << np.uint64(21)) | codes[2:]
+
+
+def trigram_keys(text: str) -> np.ndarray:
+    """문자열의 서로 다른 트라이그램 키 (오름차순)"""
+    if len(text) < 3:
+        return _EMPTY_KEYS
+    return np.unique(_pack(_codes(text)))
+
+
+def _batch_pairs(texts: List[str], base: int) -> Tuple[np.ndarray, np.ndarray]:
+    """여러 문서의 중복 없는 (키, 문서 번호) 쌍 (문서 번호 오름차순)
+
+    문서들을 이어 붙여 한 번에 키를 만들고, 문서 경계를 넘는 트라이그램은 버립니다.
+    """
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    if lengths.sum() < 3:
+        return _EMPTY_KEYS, np.empty(0, dtype=np.int64)
+    codes = _codes("".join(texts))
+    owners = np.repeat(np.arange(base, base + len(texts), dtype=np.int64), lengths)
+    keys = _pack(codes)
+    inside = owners[:-2] == owners[2:]
+    keys, docs = keys[inside], owners[:-2][inside]
+    # 문서 안에서 같은 키는 하나만 (문서 번호 → 키 순 정렬 후 인접 중복 제거)
+    order = np.lexsort((keys, docs))
+    keys, docs = keys[order], docs[order]
+    keep = np.ones(len(keys), dtype=bool)
+    keep[1:] = (keys[1:] != keys[:-1]) | (docs[1:] != docs[:-1])
+    return keys[keep], docs[keep]
+
+
+class TrigramSegment:
+    """연속된 문서 구간의 트라이그램 CSR 색인"""
+
+    def __init__(self, keys: np.ndarray, starts: np.ndarray, docs: np.ndarray):
+        self.keys = keys
+        self.starts = starts
+        self.docs = docs
+
+    @classmethod
+    def from_pairs(cls, keys: np.ndarray, docs: np.ndarray) -> "TrigramSegment":
+        """(키, 문서 번호) 쌍으로 생성 (쌍은 문서 번호 오름차순이어야 함)"""
+        order = np.argsort(keys, kind='stable')
+        keys, docs = keys[order], docs[order]
+        unique, starts = np.unique(keys, return_index=True)
+        starts = np.append(starts, len(keys)).astype(np.int64)
+        return cls(unique, starts, docs)
+
+    @classmethod
+    def build(cls, texts: Iterable[str], base: int = 0) -> "TrigramSegment":
+        """검색 텍스트 목록을 base번 문서부터 색인"""
+        key_parts: List[np.ndarray] = []
+        doc_parts: List[np.ndarray] = []
+        batch: List[str] = []
+        batch_chars = 0
+        doc = base
+        for text in texts:
+            batch.append(text)
+            batch_chars += len(text)
+            if batch_chars >= _BATCH_CHARS:
+                keys, docs = _batch_pairs(batch, doc)
+                key_parts.append(keys)
+                doc_parts.append(docs)
+                doc += len(batch)
+                batch, batch_chars = [], 0
+        if batch:
+            keys, docs = _batch_pairs(batch, doc)
+            key_parts.append(keys)
+            doc_parts.append(docs)
+        if not key_parts:
+            return cls(_EMPTY_KEYS, np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64))
+        return cls.from_pairs(np.concatenate(key_parts), np.concatenate(doc_parts))
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(키, 문서 번호) 쌍으로 펼침"""
+        return np.repeat(self.keys, np.diff(self.starts)), self.docs
+
+    def lookup(self, key: np.uint64) -> np.ndarray:
+        """키를 포함하는 문서 번호 (오름차순)"""
+        pos = int(np.searchsorted(self.keys, key))
+        if pos == len(self.keys) or self.keys[pos] != key:
+            return self.docs[:0]
+        return self.docs[self.starts[pos]:self.starts[pos + 1]]
+
+
+class TrigramIndex:
+    """불변 세그먼트로 구성된 트라이그램 색인"""
+
+    def __init__(self, segments: Tuple[TrigramSegment, ...], doc_count: int):
+        self.segments = segments
+        self.doc_count = doc_count
+
+    @classmethod
+    def build(cls, texts: Iterable[str]) -> "TrigramIndex":
+        """검색 텍스트 목록으로 색인 생성"""
+        texts = list(texts)
+        return cls((TrigramSegment.build(texts),), len(texts))
+
+    def extend(self, texts: Iterable[str]) -> "TrigramIndex":
+        """추가된 문서를 새 세그먼트로 붙인 색인"""
+        texts = list(texts)
+        segment = TrigramSegment.build(texts, base=self.doc_count)
+        segments = self.segments + (segment,)
+        if len(segments) > MAX_SEGMENTS:
+            keys, docs = zip(*(s.pairs() for s in segments))
+            segments = (TrigramSegment.from_pairs(np.concatenate(keys), np.concatenate(docs)),)
+        return TrigramIndex(segments, self.doc_count + len(texts))
+
+    def _docs(self, key: np.uint64) -> np.ndarray:
+        parts = [segment.lookup(key) for segment in self.segments]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def candidates(self, search_term: str, ids: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """검색어(소문자)를 포함할 수 있는 문서 번호 (오름차순)
+
+        Args:
+            search_term: 소문자 검색어
+            ids: 후보를 제한할 문서 번호 (오름차순). None이면 전체
+
+        Returns:
+            정확 검사가 필요한 후보 배열. 검색어가 3글자 미만이거나 흔한
+            트라이그램뿐이라 축소할 수 없으면 None (호출자가 전체 후보를 검사)
+        """
+        keys = trigram_keys(search_term)
+        if len(keys) == 0:
+            return None
+
+        # 포스팅이 짧은 트라이그램부터 교집합
+        postings = sorted((self._docs(key) for key in keys), key=len)
+        total = self.doc_count if ids is None else len(ids)
+        if len(postings[0]) > total * _SCAN_RATIO:
+            return None
+        result = postings[0] if ids is None else np.intersect1d(postings[0], ids, assume_unique=True)
+        for docs in postings[1:]:
+            if len(result) <= _VERIFY_THRESHOLD:
+                break
+            result = np.intersect1d(result, docs, assume_unique=True)
+        return result
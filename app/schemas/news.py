@@ -1,10 +1,12 @@
 """
 뉴스 관련 API 스키마
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, HttpUrl
 from datetime import datetime
 
+from ..core.config import settings
+
 
 class NewsEntry(BaseModel):
     """extract_20250826_105701.json 구조의 뉴스 엔트리 모델"""
@@ -40,6 +42,7 @@ class NewsDescriptionResponse(BaseModel):
     count: int = Field(..., description="조회된 뉴스 개수")
     data: List[NewsEntry] = Field(..., description="뉴스 엔트리 목록")
     total: int = Field(..., description="전체 뉴스 개수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (sort=time이고 페이지가 가득 찬 경우)")
 
 
 class HealthResponse(BaseModel):
@@ -48,6 +51,12 @@ class HealthResponse(BaseModel):
     count: int = Field(..., description="캐시된 뉴스 개수")
     backend: str = Field(..., description="사용 중인 백엔드")
     version: str = Field(..., description="API 버전")
+    dataset_version: Optional[int] = Field(None, description="뉴스 스냅샷 버전")
+    date_formats: Optional[Dict[str, int]] = Field(None, description="날짜 필드/형식별 레코드 수")
+    query_cache: Optional[Dict[str, int]] = Field(None, description="검색 결과 캐시 적중/미스/제거 카운터와 사용량")
+    fragment_cache: Optional[Dict[str, int]] = Field(None, description="응답 JSON 조각 캐시 적중/미스/제거 카운터와 사용량")
+    dedup: Optional[Dict[str, int]] = Field(None, description="guid/link 중복 제거 키 수와 중복(제외/숨김) 레코드 수")
+    snapshot: Optional[Dict[str, Any]] = Field(None, description="스냅샷 나이/마지막 확인 후 경과 시간(초)과 백그라운드 갱신 상태")
 
 
 class NewsQuery(BaseModel):
@@ -55,7 +64,9 @@ class NewsQuery(BaseModel):
     q: Optional[str] = Field(None, description="검색어")
     source: Optional[str] = Field(None, description="특정 소스 필터")
     group: Optional[str] = Field(None, description="특정 그룹 필터")
-    limit: int = Field(20, ge=1, le=100, description="조회 개수")
+    # 일반 목록 엔드포인트는 100, NDJSON 스트리밍은 news_stream_max_limit까지 허용
+    limit: int = Field(20, ge=1, le=settings.news_stream_max_limit, description="조회 개수")
     offset: int = Field(0, ge=0, description="오프셋")
-    sort: str = Field("fresh", pattern="^(fresh|time)$", description="정렬 방식")
+    sort: str = Field("fresh", pattern="^(fresh|time|relevance)$", description="정렬 방식")
     refresh: bool = Field(False, description="캐시 새로고침")
+    cursor: Optional[str] = Field(None, description="이전 페이지의 next_cursor (sort=time 키셋 페이지네이션)")
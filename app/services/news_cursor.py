@@ -0,0 +1,45 @@
+"""
+뉴스 피드 커서 - 키셋(keyset) 페이지네이션용 불투명 커서
+
+최신순(sort=time) 피드의 마지막 항목 (발행 시각, 레코드 번호, guid)을
+URL-safe base64 문자열로 인코딩합니다. 다음 페이지는 offset만큼 건너뛰는 대신
+최신순 순열에서 이 위치를 이진 탐색해 이어서 읽으므로(O(log n + limit)), 깊은
+페이지도 비용이 같고 그사이 새 뉴스가 추가되어도 이미 본 항목이 다시 나오거나
+밀려나지 않습니다.
+
+같은 발행 시각 안에서는 레코드 번호 순서를 따르며, 레코드 번호는 증분 추가
+시 유지됩니다. 전체 재로드로 번호가 바뀐 경우에는 guid로 위치를 다시 찾습니다.
+"""
+import base64
+import binascii
+from typing import NamedTuple
+
+from ..core.exceptions import ValidationException
+from ..utils.json_codec import codec
+
+
+class NewsCursor(NamedTuple):
+    """마지막으로 반환한 항목의 위치"""
+    epoch_us: int
+    record_id: int
+    guid: str
+
+
+def encode_cursor(cursor: NewsCursor) -> str:
+    """커서를 불투명 문자열로 인코딩"""
+    payload = codec.dumps([cursor.epoch_us, cursor.record_id, cursor.guid])
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(value: str) -> NewsCursor:
+    """커서 문자열 디코딩 (형식이 맞지 않으면 ValidationException)"""
+    try:
+        payload = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        epoch_us, record_id, guid = codec.loads(payload)
+        if not (isinstance(epoch_us, int) and isinstance(record_id, int) and isinstance(guid, str)):
+            raise ValueError(value)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValidationException(f"잘못된 cursor: {value}") from e
+    if record_id < 0:
+        raise ValidationException(f"잘못된 cursor: {value}")
+    return NewsCursor(epoch_us, record_id, guid)
@@ -0,0 +1,192 @@
+"""
+뉴스 랭킹 - 신선도/시간순/관련도 상위 k개 선택
+
+전체 정렬 대신 필요한 ``offset + limit``개만 선택합니다.
+
+- 필터가 없는 경우: 스냅샷마다 한 번 만든 최신순 순열을 그대로 사용
+  (신선도 점수는 경과 시간에 대해 단조 감소하므로 순서가 같음)
+- 필터가 있는 경우: 후보에 대해 점수를 NumPy 식 하나로 계산하고
+  ``np.partition``으로 k번째 값을 찾아 상위 k개만 정렬
+- 커서 이후(키셋 페이지네이션): 최신순 순열에서 커서 위치를 이진 탐색해 이어서 선택
+- 검사 비용이 큰 조건(검색어): 최신 시간 세그먼트부터 확인하고 k개가 차면 멈춤
+"""
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from ..repositories.news_columns import MISSING_EPOCH, NewsColumns
+
+# 신선도 점수가 최대(1.0)로 같은 구간: 발행 후 1시간 이내
+_FRESH_WINDOW_US = 3600 * 1_000_000
+
+
+def freshness_scores(epoch_us: np.ndarray, now_ts: float) -> np.ndarray:
+    """신선도 점수 = 1 / max(1, 경과 시간(h)), 발행 시각이 없으면 0"""
+    age_h = (now_ts - epoch_us / 1_000_000) / 3600.0
+    scores = 1.0 / np.maximum(1.0, age_h)
+    return np.where(epoch_us == MISSING_EPOCH, 0.0, scores)
+
+
+def _top_k(ids: np.ndarray, keys: np.ndarray, k: int) -> np.ndarray:
+    """keys 오름차순 상위 k개 (같은 키는 ids 순서 유지)
+
+    ids는 오름차순이어야 하며, keys[j]는 ids[j]의 정렬 키입니다.
+    """
+    if k >= len(ids):
+        return ids[np.argsort(keys, kind='stable')]
+    if k <= 0:
+        return ids[:0]
+
+    # k번째 키보다 작은 항목은 모두 포함하고, 같은 키는 앞선 레코드부터 채움
+    kth = np.partition(keys, k - 1)[k - 1]
+    less = np.flatnonzero(keys < kth)
+    equal = np.flatnonzero(keys == kth)[:k - len(less)]
+    selected = np.concatenate([less, equal])
+    return ids[selected[np.argsort(keys[selected], kind='stable')]]
+
+
+def _fresh_head(columns: NewsColumns, now_ts: float) -> int:
+    """최신순 순열에서 신선도 점수가 최대(1.0)로 같은 앞부분의 길이"""
+    threshold = round(now_ts * 1_000_000) - _FRESH_WINDOW_US
+    return int(np.searchsorted(columns.time_keys, ~np.int64(threshold), side='right'))
+
+
+def _fresh_order_all(columns: NewsColumns, k: int, now_ts: float) -> np.ndarray:
+    """필터 없는 신선도 순서 상위 k개 (최신순 순열 재사용)"""
+    # 최신순 순열의 앞부분 중 1시간 이내(점수 1.0 동점) 구간은 레코드 순서로 재정렬
+    head = _fresh_head(columns, now_ts)
+    if head <= 1:
+        return columns.time_order[:k]
+    head_ids = np.sort(columns.time_order[:head])
+    if k <= head:
+        return head_ids[:k]
+    return np.concatenate([head_ids, columns.time_order[head:k]])
+
+
+def rank_news(
+    columns: NewsColumns,
+    ids: Optional[np.ndarray],
+    sort: str,
+    k: int,
+    now_ts: float,
+) -> np.ndarray:
+    """정렬 기준에 따른 상위 k개 레코드 번호
+
+    Args:
+        columns: 스냅샷 컬럼
+        ids: 후보 레코드 번호 (오름차순). None이면 전체 레코드
+        sort: "time" 또는 "fresh" (그 외 값은 "fresh"로 처리)
+        k: 필요한 개수 (offset + limit)
+        now_ts: 신선도 계산 기준 시각 (요청 내에서 하나의 값을 공유)
+    """
+    if ids is None:
+        if sort == "time":
+            return columns.time_order[:k]
+        return _fresh_order_all(columns, k, now_ts)
+
+    if sort == "time":
+        keys = ~columns.epoch_us[ids]
+    else:
+        keys = -freshness_scores(columns.epoch_us[ids], now_ts)
+    return _top_k(ids, keys, k)
+
+
+def rank_by_score(ids: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 내림차순 상위 k개 (관련도 정렬, 같은 점수는 레코드 순서)"""
+    return _top_k(ids, -scores, k)
+
+
+def time_block(columns: NewsColumns, epoch_us: int) -> Tuple[int, int]:
+    """최신순 순열에서 발행 시각이 epoch_us인 구간 [lo, hi) (구간 안은 레코드 번호 오름차순)"""
+    key = ~np.int64(epoch_us)
+    lo = int(np.searchsorted(columns.time_keys, key, side='left'))
+    hi = int(np.searchsorted(columns.time_keys, key, side='right'))
+    return lo, hi
+
+
+def time_position(columns: NewsColumns, epoch_us: int, record_id: int) -> int:
+    """최신순 순열에서 (발행 시각, 레코드 번호) 바로 다음 위치 (O(log n))"""
+    lo, hi = time_block(columns, epoch_us)
+    return lo + int(np.searchsorted(columns.time_order[lo:hi], record_id, side='right'))
+
+
+def rank_time_after(
+    columns: NewsColumns,
+    ids: Optional[np.ndarray],
+    epoch_us: int,
+    record_id: int,
+    k: int,
+    match: Optional[Callable[[np.ndarray], Optional[np.ndarray]]] = None,
+) -> np.ndarray:
+    """최신순으로 (발행 시각, 레코드 번호) 다음에 오는 상위 k개 레코드 번호
+
+    Args:
+        ids: 후보 레코드 번호 (오름차순, 검색어 결과). None이면 최신순 순열에서 선택
+        match: ids가 None일 때 적용할 조건 (레코드 번호 배열 → 불리언 마스크 또는 None)
+    """
+    if ids is not None:
+        keys = ~columns.epoch_us[ids]
+        key = ~np.int64(epoch_us)
+        after = (keys > key) | ((keys == key) & (ids > record_id))
+        return _top_k(ids[after], keys[after], k)
+
+    position = time_position(columns, epoch_us, record_id)
+    if match is None:
+        return columns.time_order[position:position + k]
+
+    # 조건이 있으면 커서 위치부터 구간을 두 배씩 늘려가며 k개가 찰 때까지 확인
+    selected = []
+    found = 0
+    chunk = max(4 * k, 256)
+    while found < k and position < len(columns.time_order):
+        window = columns.time_order[position:position + chunk]
+        keep = match(window)
+        if keep is not None:
+            window = window[keep]
+        selected.append(window[:k - found])
+        found += len(selected[-1])
+        position += chunk
+        chunk *= 2
+    if not selected:
+        return columns.time_order[:0]
+    return np.concatenate(selected)
+
+
+def rank_segments(
+    columns: NewsColumns,
+    sort: str,
+    k: int,
+    now_ts: float,
+    match: Callable[[np.ndarray], np.ndarray],
+    start: int = 0,
+) -> np.ndarray:
+    """최신 시간 세그먼트부터 조건에 맞는 레코드를 모아 상위 k개 선택
+
+    세그먼트 경계 양쪽은 발행 시각이 다르므로, 세그먼트를 통째로 확인해 k개가
+    모이면 그보다 오래된 세그먼트의 레코드는 결과에 들어올 수 없어 확인하지
+    않습니다. 신선도 정렬은 점수가 같은 1시간 이내 구간까지는 모두 확인합니다.
+    전체 개수는 알 수 없으므로 개수가 필요 없는 요청에만 사용합니다.
+
+    Args:
+        sort: "time" 또는 "fresh" (그 외 값은 "fresh"로 처리)
+        match: 최신순 레코드 번호 배열 → 조건을 만족하는 레코드 번호 배열
+        start: 확인을 시작할 최신순 순열 위치 (커서 다음 위치)
+    """
+    order = columns.time_order
+    bounds = columns.time_segments
+    reach = 0 if sort == "time" else _fresh_head(columns, now_ts)
+    segment = int(np.searchsorted(bounds, start, side='right')) - 1
+    position = start
+    selected = []
+    found = 0
+    while position < len(order) and (found < k or position < reach):
+        end = int(bounds[segment + 1])
+        matched = match(order[position:end])
+        selected.append(matched)
+        found += len(matched)
+        position = end
+        segment += 1
+    if not selected:
+        return order[:0]
+    ids = np.sort(np.concatenate(selected))
+    return rank_news(columns, ids, sort, k, now_ts)
@@ -2,11 +2,19 @@
 뉴스 서비스 - 비즈니스 로직 처리
 """
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ..core.exceptions import ValidationException
+from ..core.executor import run_blocking
+from ..core.news_store import NewsSnapshot, NewsStore
+from ..core.query_cache import normalize_query
 from ..repositories.news_repository import NewsRepository
 from ..schemas.news import NewsEntry, NewsOut, NewsQuery
+from .news_cursor import NewsCursor, decode_cursor, encode_cursor
+from .news_ranking import rank_by_score, rank_news, rank_segments, rank_time_after, time_block, time_position
 
 logger = logging.getLogger(__name__)
 
@@ -14,135 +22,240 @@ logger = logging.getLogger(__name__)
 class NewsService:
     """뉴스 데이터 처리 서비스"""
     
-    def __init__(self, news_repo: Optional[NewsRepository] = None):
-        self.news_repo = news_repo or NewsRepository()
-        self._cache: List[Dict[str, Any]] = []
-        self._cache_timestamp: Optional[float] = None
+    def __init__(
+        self,
+        news_repo: Optional[NewsRepository] = None,
+        news_store: Optional[NewsStore] = None,
+    ):
+        # 스토어를 주입받지 않으면 이 서비스 전용 스토어를 생성
+        self.news_store = news_store or NewsStore(news_repo or NewsRepository())
+        self.news_repo = self.news_store.news_repo
+    
+    async def get_news_data(self, refresh: bool = False) -> Sequence[Dict[str, Any]]:
+        """뉴스 데이터 조회 (공유 스냅샷에서, 중복 제거로 숨긴 이전 버전 제외)"""
+        snapshot = await self.news_store.get_snapshot(refresh=refresh)
+        if snapshot.columns.live is None:
+            return snapshot.items
+        return snapshot.get_items(snapshot.columns.live_ids().tolist())
     
-    async def get_news_data(self, refresh: bool = False) -> List[Dict[str, Any]]:
-        """뉴스 데이터 조회 (캐시 또는 백엔드에서)"""
-        current_time = datetime.now().timestamp()
+    async def search_news(self, query: NewsQuery) -> tuple[List[Dict[str, Any]], int]:
+        """뉴스 검색
+
+        필터링과 정렬은 레코드 번호와 경량 필드만으로 수행하고,
+        전체 레코드는 반환할 페이지에 대해서만 가져옵니다. 결과 레코드 번호는
+        스냅샷 버전별로 캐시합니다.
+        """
+        snapshot, page_ids, total = await self.search_news_page(query)
+        return await run_blocking(snapshot.get_items, page_ids.tolist()), total
+    
+    async def search_news_page(
+        self, query: NewsQuery, count_total: bool = True
+    ) -> Tuple[NewsSnapshot, np.ndarray, Optional[int]]:
+        """검색 결과 페이지의 (스냅샷, 레코드 번호, 전체 개수)
+
+        레코드는 가져오지 않으므로, 스트리밍 응답은 청크 단위로 나눠 가져옵니다.
+        ``query.cursor``가 있으면 그 항목 다음부터 (offset은 커서 기준)
+        선택하며, 형식이 잘못되었거나 sort=time이 아니면 ValidationException.
+        ``count_total=False``이면 검색어 조회를 최신 세그먼트부터 하다가 페이지가
+        차면 멈추므로 전체 개수는 None일 수 있습니다.
+
+        캐시에 없으면 검색(부분 문자열 검사, mmap 모드의 레코드 디코딩 포함)은
+        이벤트 루프 밖의 스레드 풀에서 실행합니다.
+        """
+        cursor = decode_cursor(query.cursor) if query.cursor else None
+        if cursor is not None and query.sort != "time":
+            raise ValidationException("cursor는 sort=time에서만 사용할 수 있습니다")
+        snapshot = await self.news_store.get_snapshot(refresh=query.refresh)
+        query_cache = self.news_store.query_cache
+        key = normalize_query(query, snapshot.version)
         
-        # 캐시가 유효하고 새로고침이 아닌 경우 캐시 반환
-        if (not refresh and self._cache and self._cache_timestamp and 
-            current_time - self._cache_timestamp < 300):  # 5분 캐시
-            return self._cache
+        cached = query_cache.get(key)
+        if cached is None or (count_total and cached[1] is None):
+            page_ids, total = await run_blocking(self._search_ids, snapshot, query, cursor, count_total)
+            query_cache.put(key, page_ids, total)
+        else:
+            page_ids, total = cached
         
-        # Repository를 통해 데이터 로드
-        data = await self.news_repo.get_all()
+        return snapshot, page_ids, total
+    
+    @staticmethod
+    def next_cursor(snapshot: NewsSnapshot, query: NewsQuery, page_ids: np.ndarray) -> Optional[str]:
+        """다음 페이지 커서 (sort=time이고 페이지가 가득 찬 경우, 아니면 None)"""
+        if query.sort != "time" or len(page_ids) < query.limit:
+            return None
+        last = int(page_ids[-1])
+        guid = snapshot.get_items([last])[0].get("guid")
+        return encode_cursor(NewsCursor(int(snapshot.columns.epoch_us[last]), last, str(guid or "")))
+    
+    @staticmethod
+    def _cursor_record(snapshot: NewsSnapshot, cursor: NewsCursor) -> int:
+        """커서 항목의 현재 레코드 번호
+
+        증분 추가에서는 번호가 유지되므로 그대로 사용하고, 전체 재로드로 번호가
+        바뀐 경우 같은 발행 시각 구간에서 guid로 다시 찾습니다(못 찾으면 원래 번호).
+        """
+        record_id = cursor.record_id
+        if not cursor.guid:
+            return record_id
+        if record_id < len(snapshot) and snapshot.get_items([record_id])[0].get("guid") == cursor.guid:
+            return record_id
+        lo, hi = time_block(snapshot.columns, cursor.epoch_us)
+        block = snapshot.columns.time_order[lo:hi].tolist()
+        for candidate, item in zip(block, snapshot.get_items(block)):
+            if item.get("guid") == cursor.guid:
+                return candidate
+        return record_id
+    
+    def _search_ids(
+        self,
+        snapshot: NewsSnapshot,
+        query: NewsQuery,
+        cursor: Optional[NewsCursor] = None,
+        count_total: bool = True,
+    ) -> Tuple[np.ndarray, Optional[int]]:
+        """쿼리 결과 페이지의 레코드 번호와 전체 개수 (count_total=False면 None일 수 있음)"""
+        columns = snapshot.columns
         
-        # 캐시 업데이트
-        self._cache = data
-        self._cache_timestamp = current_time
+        # 소스/그룹 필터링 (값별 색인의 레코드 번호 목록), 필터가 없으면 전체(None)
+        # 컬럼의 순열/값별 색인에는 중복 제거로 숨긴 레코드가 없으므로 색인 결과만 따로 거름
+        ids = columns.filter_ids(source=query.source, group=query.group)
         
-        return data
-    
-    async def search_news(self, query: NewsQuery) -> tuple[List[Dict[str, Any]], int]:
-        """뉴스 검색"""
-        data = await self.get_news_data(refresh=query.refresh)
+        # 관련도 정렬: 역색인 포스팅 리스트와 소스/그룹 조건의 교집합을 BM25 순으로
+        if query.sort == "relevance" and query.q and snapshot.text_index is not None:
+            ids, scores = snapshot.text_index.search(query.q)
+            keep = columns.match(ids, source=query.source, group=query.group)
+            if columns.live is not None:
+                keep = columns.live[ids] if keep is None else keep & columns.live[ids]
+            if keep is not None:
+                ids, scores = ids[keep], scores[keep]
+            ranked = rank_by_score(ids, scores, k=query.offset + query.limit)
+            return ranked[query.offset:], len(ids)
         
         # 검색어 필터링
         if query.q:
-            filtered_data = []
             search_term = query.q.lower()
-            for item in data:
-                title = item.get('title', '').lower()
-                summary = item.get('summary', '').lower()
-                content = item.get('article_text', '').lower()
-                
-                if (search_term in title or 
-                    search_term in summary or 
-                    search_term in content):
-                    filtered_data.append(item)
-            data = filtered_data
+            # 트라이그램 색인으로 후보를 줄인 뒤 부분 문자열 검사로 확정
+            candidates = None
+            if snapshot.trigram_index is not None:
+                candidates = snapshot.trigram_index.candidates(search_term, ids)
+                if candidates is not None and ids is None:
+                    candidates = columns.visible(candidates)
+            if not count_total:
+                if candidates is None:
+                    candidates = ids
+                return self._search_segments(snapshot, query, cursor, search_term, candidates), None
+            if candidates is None:
+                candidates = columns.live_ids() if ids is None else ids
+            ids = np.asarray(
+                columns.contains(candidates.tolist(), search_term, snapshot.items),
+                dtype=np.intp,
+            )
         
-        # 소스 필터링
-        if query.source:
-            data = [item for item in data if item.get('source') == query.source]
+        # 정렬: 필요한 offset + limit개만 상위 k 선택 (기준 시각은 요청당 하나)
+        total = columns.live_count if ids is None else len(ids)
         
-        # 그룹 필터링
-        if query.group:
-            data = [item for item in data if item.get('group') == query.group]
+        # 커서 이후: 최신순 순열에서 커서 위치를 찾아 이어서 선택 (offset만큼 다시 훑지 않음)
+        if cursor is not None:
+            record_id = self._cursor_record(snapshot, cursor)
+            k = query.offset + query.limit
+            if ids is not None and not query.q:
+                # 소스/그룹 조건만 있으면 조건 목록 전체 대신 커서 위치부터 순열을 훑음
+                ranked = rank_time_after(
+                    columns, None, cursor.epoch_us, record_id, k,
+                    match=lambda window: columns.match(window, source=query.source, group=query.group),
+                )
+            else:
+                ranked = rank_time_after(columns, ids, cursor.epoch_us, record_id, k)
+            return ranked[query.offset:], total
         
-        # 정렬
-        if query.sort == "time":
-            # 시간순 정렬 (published 또는 processed_at 기준)
-            data.sort(key=lambda x: x.get('published') or x.get('processed_at') or '', reverse=True)
-        else:
-            # 신선도 점수 기반 정렬
-            data.sort(key=lambda x: self._calculate_freshness_score(x), reverse=True)
+        ranked = rank_news(
+            columns, ids, query.sort,
+            k=query.offset + query.limit,
+            now_ts=datetime.now().timestamp(),
+        )
         
         # 페이징
-        total = len(data)
-        start = query.offset
-        end = start + query.limit
-        data = data[start:end]
-        
-        return data, total
+        return ranked[query.offset:], total
     
-    def _calculate_freshness_score(self, item: Dict[str, Any]) -> float:
-        """뉴스 아이템의 신선도 점수 계산"""
-        now_ts = datetime.now().timestamp()
-        
-        # published 필드 우선 확인
-        dt_str = item.get("published")
-        if not dt_str:
-            # processed_at 필드 확인
-            dt_str = item.get("processed_at")
-        
-        if not dt_str:
-            return 0.0
-        
-        try:
-            # 다양한 날짜 형식 처리
-            dt = None
-            
-            # 1. RFC 2822 형식 (예: "Mon, 25 Aug 2025 06:00:00 GMT")
-            try:
-                from email.utils import parsedate_to_datetime
-                dt = parsedate_to_datetime(dt_str)
-            except:
-                pass
-            
-            # 2. ISO 형식 (예: "2025-08-26T11:47:10.173932")
-            if not dt:
-                try:
-                    dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-                except:
-                    pass
-            
-            # 3. 다른 형식들 시도
-            if not dt:
-                try:
-                    dt = datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%S")
-                except:
-                    pass
-            
-            if dt:
-                age_h = max(1.0, (now_ts - dt.timestamp()) / 3600.0)
-                return 1.0 / age_h
-            else:
-                logger.warning(f"지원되지 않는 날짜 형식: {dt_str}")
-                return 0.0
-                
-        except Exception as e:
-            logger.warning(f"날짜 파싱 오류: {e}")
-            return 0.0
+    def _search_segments(
+        self,
+        snapshot: NewsSnapshot,
+        query: NewsQuery,
+        cursor: Optional[NewsCursor],
+        search_term: str,
+        candidates: Optional[np.ndarray],
+    ) -> np.ndarray:
+        """검색어 조회를 최신 시간 세그먼트부터 검사해 페이지가 차면 멈춤
+
+        부분 문자열 검사(mmap 모드는 디코딩)를 오래된 세그먼트에는 하지 않으므로
+        최신 뉴스 조회는 전체 기간 크기와 관계없이 최근 데이터만 읽습니다.
+
+        Args:
+            candidates: 검사할 레코드 번호 (오름차순, 트라이그램/소스/그룹 결과). None이면 전체
+        """
+        columns = snapshot.columns
+        allowed = None
+        if candidates is not None:
+            allowed = np.zeros(len(columns), dtype=bool)
+            allowed[candidates] = True
+
+        def match(window: np.ndarray) -> np.ndarray:
+            if allowed is not None:
+                window = window[allowed[window]]
+            return np.asarray(columns.contains(window.tolist(), search_term, snapshot.items), dtype=np.intp)
+
+        start = 0
+        if cursor is not None:
+            start = time_position(columns, cursor.epoch_us, self._cursor_record(snapshot, cursor))
+        ranked = rank_segments(
+            columns, query.sort,
+            k=query.offset + query.limit,
+            now_ts=datetime.now().timestamp(),
+            match=match,
+            start=start,
+        )
+        return ranked[query.offset:]
     
     async def get_health_status(self) -> Dict[str, Any]:
         """헬스체크 상태 반환"""
-        data = await self.get_news_data()
+        snapshot = await self.news_store.get_snapshot()
         return {
             "ok": True,
-            "count": len(data),
+            "count": snapshot.columns.live_count,
             "backend": self.news_repo.backend,
-            "version": "0.2.0"
+            "version": "0.2.0",
+            "dataset_version": snapshot.version,
+            "date_formats": dict(snapshot.columns.date_stats),
+            "query_cache": self.news_store.query_cache.stats(),
+            "fragment_cache": snapshot.fragments.stats(),
+            "dedup": snapshot.dedup.stats() if snapshot.dedup is not None else None,
+            "snapshot": self.news_store.status(),
         }
     
     async def get_sources(self) -> List[str]:
         """사용 가능한 소스 목록 조회"""
-        return await self.news_repo.get_sources()
+        return [facet["name"] for facet in await self.get_facets("source")]
     
     async def get_groups(self) -> List[str]:
         """사용 가능한 그룹 목록 조회"""
-        return await self.news_repo.get_groups()
+        return [facet["name"] for facet in await self.get_facets("group")]
+    
+    async def get_facets(self, field: str) -> List[Dict[str, Any]]:
+        """소스/그룹 값별 뉴스 수와 최신 발행 시각 (이름순)
+
+        Args:
+            field: "source" 또는 "group"
+        """
+        snapshot = await self.news_store.get_snapshot()
+        facets = [
+            {
+                "name": value,
+                "count": count,
+                "latest": None if latest is None
+                else datetime.fromtimestamp(latest / 1_000_000, tz=timezone.utc).isoformat(),
+            }
+            for value, count, latest in snapshot.columns.facet_counts(field)
+            if value
+        ]
+        facets.sort(key=lambda facet: facet["name"])
+        return facets
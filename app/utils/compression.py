@@ -0,0 +1,111 @@
+"""
+압축 JSONL 입출력 - gzip/zstd 파일을 풀지 않고 스트리밍으로 읽고 쓰기
+
+압축 형식은 파일 앞의 매직 바이트로 판별하고, 아직 없거나 빈 파일(저장 시)은
+확장자(``.gz``, ``.zst``)로 판별합니다. zstd는 선택 의존성 ``zstandard``가
+설치되어 있어야 합니다.
+
+읽기 스트림은 압축 해제에 걸린 시간과 바이트 수를 기록하므로(``TimedReader``),
+로더가 압축 해제 처리량과 JSON 파싱 처리량을 따로 보고할 수 있습니다.
+"""
+import gzip
+import io
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 압축 해제 스트림 버퍼 크기 (바이트)
+READ_BUFFER_SIZE = 1024 * 1024
+
+_EXTENSIONS = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def detect_compression(path: Path) -> Optional[str]:
+    """파일의 압축 형식 ("gzip", "zstd", 비압축이면 None)"""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4)
+    except OSError:
+        head = b""
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if head:
+        return None
+    return _EXTENSIONS.get(path.suffix.lower())
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstd 파일을 읽고 쓰려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+
+
+class TimedReader(io.RawIOBase):
+    """압축 해제 스트림을 감싸 read()에 걸린 시간과 읽은 바이트 수 기록"""
+
+    def __init__(self, stream: BinaryIO, source: BinaryIO):
+        self._stream = stream
+        self._source = source
+        self.seconds = 0.0
+        self.bytes_out = 0
+
+    @property
+    def bytes_in(self) -> int:
+        """지금까지 읽은 압축 바이트 수"""
+        return self._source.tell()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        started = time.perf_counter()
+        data = self._stream.read(len(buffer))
+        self.seconds += time.perf_counter() - started
+        n = len(data)
+        buffer[:n] = data
+        self.bytes_out += n
+        return n
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+            self._source.close()
+        finally:
+            super().close()
+
+
+def open_decompressed(path: Path, compression: str) -> io.BufferedReader:
+    """압축 파일을 풀면서 읽는 버퍼 스트림 (``.raw``가 TimedReader)"""
+    source = open(path, "rb")
+    try:
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=source, mode="rb")
+        elif compression == "zstd":
+            _require_zstandard()
+            stream = zstandard.ZstdDecompressor().stream_reader(source, read_size=READ_BUFFER_SIZE)
+        else:
+            raise ValueError(f"지원하지 않는 압축 형식: {compression}")
+    except BaseException:
+        source.close()
+        raise
+    return io.BufferedReader(TimedReader(stream, source), buffer_size=READ_BUFFER_SIZE)
+
+
+def open_for_write(path: Path) -> BinaryIO:
+    """확장자에 맞춰 압축하며 쓰는 바이너리 스트림 (비압축 확장자는 일반 파일)"""
+    compression = _EXTENSIONS.get(path.suffix.lower())
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb", buffering=READ_BUFFER_SIZE)
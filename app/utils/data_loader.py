@@ -1,34 +1,305 @@
 """
 데이터 로더 유틸리티
 """
-import json
 import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Generator, Iterator, List, Dict, Any, Optional, Tuple
 from pymongo import MongoClient
 from pymongo.collection import Collection
 
+from ..core.config import settings
+from .compression import detect_compression, open_decompressed, open_for_write
+from .json_codec import codec
+
 logger = logging.getLogger(__name__)
 
+# 파일 재작성 감지를 위해 마지막 읽기 위치 직전에서 보관하는 바이트 수
+_FINGERPRINT_SIZE = 64
 
-def load_jsonl_file(file_path: Path) -> List[Dict[str, Any]]:
-    """JSONL 파일에서 데이터 로드"""
-    try:
-        if not file_path.exists():
-            logger.warning(f"파일이 존재하지 않음: {file_path}")
-            return []
+# 병렬 로드 시 청크 최소 크기 (바이트) 및 워커당 청크 수
+_MIN_CHUNK_BYTES = 4 * 1024 * 1024
+_CHUNKS_PER_WORKER = 4
+
+
+def resolve_workers(workers: int) -> int:
+    """설정된 워커 수 해석 (0 이하이면 CPU 수)"""
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _decode_range(path: str, start: int, end: int) -> Tuple[List[Tuple[int, Any]], List[Tuple[int, str]], int]:
+    """파일의 [start, end) 구간(라인 경계로 정렬됨)을 디코딩 (워커 프로세스에서 실행)
+
+    Returns:
+        ((라인 시작 오프셋, 레코드) 목록, (구간 내 라인 번호, 오류) 목록, 라인 수)
+    """
+    records = []
+    errors = []
+    line_count = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    pos = 0
+    while pos < len(data):
+        # 직렬 읽기와 같은 라인 구분 ('\n' 기준)
+        newline = data.find(b'\n', pos)
+        next_pos = len(data) if newline == -1 else newline + 1
+        raw = data[pos:next_pos]
+        line_offset = start + pos
+        pos = next_pos
+        line_count += 1
+        if not raw.strip():
+            continue
+        try:
+            records.append((line_offset, codec.loads(raw)))
+        except ValueError as e:
+            errors.append((line_count, str(e)))
+    return records, errors, line_count
+
+
+def _split_ranges(f, start: int, end: int, chunks: int) -> List[Tuple[int, int]]:
+    """[start, end) 구간을 라인 경계에 맞춘 chunks개 이하의 구간으로 분할"""
+    bounds = [start]
+    step = (end - start) // chunks
+    for i in range(1, chunks):
+        target = max(start + i * step, bounds[-1])
+        if target >= end:
+            break
+        f.seek(target)
+        f.readline()
+        boundary = min(f.tell(), end)
+        if boundary > bounds[-1]:
+            bounds.append(boundary)
+    if bounds[-1] < end:
+        bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _complete_end(f, start: int, size: int) -> int:
+    """start 이후 마지막 개행 바로 다음 위치 (완성된 라인의 끝)"""
+    pos = size
+    block = 64 * 1024
+    while pos > start:
+        read_from = max(start, pos - block)
+        f.seek(read_from)
+        chunk = f.read(pos - read_from)
+        newline = chunk.rfind(b'\n')
+        if newline != -1:
+            return read_from + newline + 1
+        pos = read_from
+    return start
+
+
+class JsonlTailReader:
+    """append-only JSONL 파일 증분 리더
+
+    마지막으로 읽은 바이트 위치를 기억해 두었다가 그 이후에 추가된 라인만
+    파싱합니다. inode 변경(로테이션), 크기 감소(truncate), 읽은 구간의 내용
+    변경이 감지되면 처음부터 다시 읽습니다.
+    
+    읽을 양이 ``parallel_min_bytes`` 이상이고 워커가 2개 이상이면 완성된
+    라인 구간을 라인 경계 청크로 나눠 프로세스 풀에서 디코딩하고, 결과는
+    파일 순서대로 이어 붙입니다. 기록 중인 마지막 라인은 항상 직접 처리합니다.
+    
+    gzip/zstd 압축 파일은 풀면서 스트리밍으로 읽습니다. 압축 스트림은 중간부터
+    읽을 수 없으므로 변경될 때마다 전체를 다시 읽으며(오프셋은 압축 해제 후
+    기준), 마지막 읽기의 압축 해제/파싱 시간은 ``stats``에 기록됩니다.
+    """
+    
+    def __init__(self, file_path: Path, workers: int = 1, parallel_min_bytes: int = 0):
+        self.file_path = file_path
+        self.workers = resolve_workers(workers)
+        self.parallel_min_bytes = parallel_min_bytes
+        self.stats: Optional[Dict[str, Any]] = None
+        self.reset()
+    
+    def reset(self) -> None:
+        """읽기 위치 초기화 (다음 읽기는 파일 전체)"""
+        self.offset = 0
+        self.line_count = 0
+        self.inode: Optional[int] = None
+        self.rewound = False
+        self._fingerprint = b""
+    
+    def get_state(self) -> Dict[str, Any]:
+        """읽기 위치 상태 (스냅샷 사이드카 저장용)"""
+        return {
+            "offset": self.offset,
+            "line_count": self.line_count,
+            "inode": self.inode,
+            "fingerprint": self._fingerprint.hex(),
+        }
+    
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """저장해 둔 읽기 위치 복원 (다음 읽기는 그 이후 추가분)"""
+        self.offset = state["offset"]
+        self.line_count = state["line_count"]
+        self.inode = state["inode"]
+        self._fingerprint = bytes.fromhex(state["fingerprint"])
+        self.rewound = False
+    
+    def _is_rewritten(self, f, inode: int, size: int) -> bool:
+        """마지막 읽기 이후 파일이 교체되었거나 기존 내용이 바뀌었는지 확인"""
+        if self.inode != inode or size < self.offset:
+            return True
+        if self._fingerprint:
+            f.seek(self.offset - len(self._fingerprint))
+            return f.read(len(self._fingerprint)) != self._fingerprint
+        return False
+    
+    def iter_new(self) -> Iterator[Tuple[int, Any]]:
+        """마지막 위치 이후 추가된 레코드를 (라인 시작 오프셋, 레코드)로 순회
+
+        순회를 시작하면 ``rewound``에 전체 재로드 여부가 기록되며,
+        끝까지 순회한 경우에만 읽기 위치가 갱신됩니다.
+        """
+        self.rewound = False
+        if not self.file_path.exists():
+            logger.warning(f"파일이 존재하지 않음: {self.file_path}")
+            self.reset()
+            self.rewound = True
+            return
         
-        data = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
+        compression = detect_compression(self.file_path)
+        if compression is not None:
+            yield from self._iter_compressed(compression)
+            return
+        
+        with open(self.file_path, 'rb') as f:
+            stat = self.file_path.stat()
+            if self.inode is None or self._is_rewritten(f, stat.st_ino, stat.st_size):
+                if self.inode is not None:
+                    logger.info(f"파일 교체/변경 감지, 처음부터 다시 읽음: {self.file_path}")
+                self.reset()
+                self.inode = stat.st_ino
+                self.rewound = True
+            
+            offset = self.offset
+            line_num = self.line_count
+            if self.workers > 1 and stat.st_size - offset >= max(self.parallel_min_bytes, 1):
+                end = _complete_end(f, offset, stat.st_size)
+                line_num += yield from self._iter_parallel(f, offset, end, line_num)
+                offset = end
+            
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    # 기록 중인 마지막 라인: 완전한 JSON이 아니면 다음 읽기로 미룸
+                    try:
+                        item = codec.loads(raw)
+                    except ValueError:
+                        break
+                    yield offset, item
+                    offset += len(raw)
+                    line_num += 1
+                    break
+                
+                line_offset = offset
+                offset += len(raw)
+                line_num += 1
                 try:
-                    if line.strip():
-                        item = json.loads(line.strip())
-                        data.append(item)
-                except json.JSONDecodeError as e:
+                    if raw.strip():
+                        yield line_offset, codec.loads(raw)
+                except ValueError as e:
                     logger.warning(f"라인 {line_num} JSON 파싱 오류: {e}")
                     continue
+            
+            if offset > self.offset:
+                start = max(0, offset - _FINGERPRINT_SIZE)
+                f.seek(start)
+                self._fingerprint = f.read(offset - start)
+            self.offset = offset
+            self.line_count = line_num
+    
+    def _iter_compressed(self, compression: str) -> Iterator[Tuple[int, Any]]:
+        """압축 파일 전체를 풀면서 순회 (압축 해제와 파싱 시간을 따로 집계)"""
+        stat = self.file_path.stat()
+        if self.inode is not None:
+            logger.info(f"압축 파일 변경 감지, 처음부터 다시 읽음: {self.file_path}")
+        self.reset()
+        self.inode = stat.st_ino
+        self.rewound = True
         
+        offset = 0
+        line_num = 0
+        parse_seconds = 0.0
+        with open_decompressed(self.file_path, compression) as f:
+            for raw in f:
+                line_offset = offset
+                offset += len(raw)
+                line_num += 1
+                if not raw.strip():
+                    continue
+                started = time.perf_counter()
+                try:
+                    item = codec.loads(raw)
+                except ValueError as e:
+                    logger.warning(f"라인 {line_num} JSON 파싱 오류: {e}")
+                    continue
+                finally:
+                    parse_seconds += time.perf_counter() - started
+                yield line_offset, item
+            timed = f.raw
+            self.stats = {
+                "compression": compression,
+                "compressed_bytes": timed.bytes_in,
+                "bytes": timed.bytes_out,
+                "decompress_seconds": timed.seconds,
+                "parse_seconds": parse_seconds,
+            }
+        self.offset = offset
+        self.line_count = line_num
+        
+        mb = offset / 1e6
+        logger.info(
+            f"{compression} 파일 읽기: {self.stats['compressed_bytes'] / 1e6:,.1f} MB → {mb:,.1f} MB, "
+            f"압축 해제 {mb / max(timed.seconds, 1e-9):,.1f} MB/s, "
+            f"파싱 {mb / max(parse_seconds, 1e-9):,.1f} MB/s"
+        )
+    
+    def _iter_parallel(self, f, start: int, end: int, line_num: int) -> Generator[Tuple[int, Any], None, int]:
+        """[start, end) 구간을 프로세스 풀로 디코딩해 파일 순서대로 순회 (반환값은 라인 수)"""
+        total_lines = 0
+        chunks = max(1, min(self.workers * _CHUNKS_PER_WORKER, (end - start) // _MIN_CHUNK_BYTES))
+        ranges = _split_ranges(f, start, end, chunks)
+        path = str(self.file_path)
+        # 이벤트 루프/스레드와 함께 쓰이므로 fork 대신 spawn으로 워커 생성
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges)), mp_context=context) as pool:
+            futures = [pool.submit(_decode_range, path, s, e) for s, e in ranges]
+            for future in futures:
+                records, errors, line_count = future.result()
+                for chunk_line, error in errors:
+                    logger.warning(f"라인 {line_num + total_lines + chunk_line} JSON 파싱 오류: {error}")
+                yield from records
+                total_lines += line_count
+        return total_lines
+    
+    def read_new(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """마지막 위치 이후 추가된 레코드 읽기
+
+        Returns:
+            (레코드 목록, 전체 재로드 여부). 두 번째 값이 True이면 반환된
+            레코드가 파일 전체 내용이므로 기존 데이터를 대체해야 합니다.
+        """
+        data = [item for _, item in self.iter_new()]
+        return data, self.rewound
+
+
+def load_jsonl_file(file_path: Path) -> List[Dict[str, Any]]:
+    """JSONL 파일에서 데이터 로드 (큰 파일은 설정된 워커 수로 병렬 디코딩)"""
+    try:
+        reader = JsonlTailReader(
+            file_path,
+            workers=settings.news_load_workers,
+            parallel_min_bytes=settings.news_parallel_min_bytes,
+        )
+        data, _ = reader.read_new()
         logger.info(f"파일에서 {len(data)}개 항목 로드: {file_path}")
         return data
         
@@ -64,13 +335,13 @@ def load_mongo_data(
 
 
 def save_jsonl_file(data: List[Dict[str, Any]], file_path: Path) -> bool:
-    """데이터를 JSONL 파일로 저장"""
+    """데이터를 JSONL 파일로 저장 (확장자가 .gz/.zst이면 압축)"""
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open_for_write(file_path) as f:
             for item in data:
-                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+                f.write(codec.dumps(item) + b'\n')
         
         logger.info(f"{len(data)}개 항목을 파일에 저장: {file_path}")
         return True
@@ -0,0 +1,118 @@
+"""
+뉴스 날짜 문자열 파싱 유틸리티
+
+뉴스 로드 파이프라인에서 레코드마다 한 번만 날짜를 epoch 초(float)로
+정규화하기 위한 함수들입니다. 같은 날짜 문자열은 반복해서 등장하는 경우가
+많으므로 파싱 결과를 메모이제이션합니다.
+"""
+import logging
+from collections import Counter
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 뉴스 발행 시각으로 사용할 필드 (앞쪽 필드 우선)
+DATE_FIELDS = ("published", "pub_date", "processed_at", "scraped_at")
+
+# 날짜 형식 통계 키
+FORMAT_RFC2822 = "rfc2822"
+FORMAT_ISO8601 = "iso8601"
+FORMAT_STRPTIME = "strptime"
+FORMAT_DATETIME = "datetime"
+FORMAT_INVALID = "invalid"
+FORMAT_MISSING = "missing"
+
+
+@lru_cache(maxsize=65536)
+def _parse_string(value: str) -> Tuple[Optional[float], str]:
+    """날짜 문자열 파싱 → (epoch 초, 형식)"""
+    dt = None
+    fmt = FORMAT_INVALID
+
+    # 1. RFC 2822 형식 (예: "Mon, 25 Aug 2025 06:00:00 GMT")
+    try:
+        dt = parsedate_to_datetime(value)
+        fmt = FORMAT_RFC2822
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    # 2. ISO 형식 (예: "2025-08-26T11:47:10.173932")
+    if not dt:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            fmt = FORMAT_ISO8601
+        except ValueError:
+            pass
+
+    # 3. 다른 형식들 시도
+    if not dt:
+        try:
+            dt = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+            fmt = FORMAT_STRPTIME
+        except ValueError:
+            pass
+
+    if not dt:
+        logger.debug(f"지원되지 않는 날짜 형식: {value}")
+        return None, FORMAT_INVALID
+    try:
+        return dt.timestamp(), fmt
+    except (OverflowError, OSError, ValueError) as e:
+        logger.debug(f"날짜 변환 오류: {e}")
+        return None, FORMAT_INVALID
+
+
+def parse_news_datetime_with_format(value: Any) -> Tuple[Optional[float], str]:
+    """뉴스 날짜 값을 (epoch 초, 형식)으로 변환 (변환 불가 시 epoch은 None)"""
+    if not value:
+        return None, FORMAT_MISSING
+    if isinstance(value, datetime):
+        return value.timestamp(), FORMAT_DATETIME
+    if not isinstance(value, str):
+        return None, FORMAT_INVALID
+    return _parse_string(value)
+
+
+def parse_news_datetime(value: Any) -> Optional[float]:
+    """뉴스 날짜 값을 epoch 초(float)로 변환
+
+    지원 형식:
+    1. RFC 2822 (예: "Mon, 25 Aug 2025 06:00:00 GMT")
+    2. ISO 8601 (예: "2025-08-26T11:47:10.173932")
+    3. "%Y-%m-%dT%H:%M:%S"
+
+    변환할 수 없으면 None을 반환합니다.
+    """
+    return parse_news_datetime_with_format(value)[0]
+
+
+class DateNormalizer:
+    """뉴스 레코드의 발행 시각 정규화기
+
+    ``DATE_FIELDS`` 중 처음으로 값이 있는 필드를 epoch 초로 변환하고,
+    어떤 필드/형식이 쓰였는지 통계를 남깁니다.
+    """
+
+    def __init__(self):
+        self.stats: Counter = Counter()
+
+    def normalize(self, item: Dict[str, Any]) -> Optional[float]:
+        """레코드의 발행 시각(epoch 초) 반환, 없거나 변환 불가 시 None"""
+        for field in DATE_FIELDS:
+            value = item.get(field)
+            if value:
+                ts, fmt = parse_news_datetime_with_format(value)
+                self.stats[f"field:{field}"] += 1
+                self.stats[fmt] += 1
+                return ts
+        self.stats[FORMAT_MISSING] += 1
+        return None
+
+    def log_summary(self) -> None:
+        """변환하지 못한 날짜가 있으면 경고 로그 출력"""
+        invalid = self.stats.get(FORMAT_INVALID, 0)
+        if invalid:
+            logger.warning(f"지원되지 않는 날짜 형식 {invalid}건 (정렬 시 맨 뒤로 배치)")
@@ -0,0 +1,79 @@
+"""
+JSON 코덱 - JSONL 로더/저장과 API 응답 직렬화에 공통으로 사용
+
+orjson이 설치되어 있으면 orjson을, 없으면 표준 json을 사용합니다.
+``JSON_CODEC`` 설정(auto/orjson/json)으로 고정할 수도 있습니다.
+
+- ``loads``: bytes/str → 객체. orjson이 거부하는 입력(NaN, 짝이 없는
+  서로게이트 등)은 표준 json으로 다시 시도합니다. 단, 64비트를 넘는 정수는
+  orjson 버전에 따라 float로 파싱될 수 있습니다.
+- ``dumps``: 객체 → UTF-8 bytes (공백 없는 compact 형식, 비ASCII 문자 유지)
+"""
+import json
+import logging
+from collections.abc import Mapping
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """기본 직렬화가 지원하지 않는 객체 변환 (NewsRecord 등 dict가 아닌 Mapping)"""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+class StdlibJsonCodec:
+    """표준 json 코덱"""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=_default
+        ).encode("utf-8")
+
+
+class OrjsonCodec:
+    """orjson 코덱 (표준 json 폴백 포함)"""
+
+    name = "orjson"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson이 거부하지만 표준 json은 허용하는 입력 호환
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_codec(name: str = "auto"):
+    """이름으로 코덱 선택 (auto: orjson이 있으면 orjson)"""
+    if name == "json":
+        return StdlibJsonCodec()
+    if orjson is None:
+        if name == "orjson":
+            logger.warning("orjson이 설치되어 있지 않아 표준 json을 사용합니다")
+        return StdlibJsonCodec()
+    return OrjsonCodec()
+
+
+# 애플리케이션 전역 코덱
+codec = get_codec(settings.json_codec)
@@ -0,0 +1,89 @@
+"""
+JSON 코덱 벤치마크 - 표준 json과 orjson의 JSONL 파싱/응답 직렬화 처리량 비교
+
+sample.json 레코드를 복제해 본문 길이와 필드 값을 바꾼 합성 JSONL 데이터를
+만든 뒤, 코덱별로
+
+- 라인 단위 파싱 처리량 (MB/s)
+- 라인 단위 직렬화 처리량 (MB/s)
+- /news/description 형태 응답 본문 렌더링 시간 (FastAPI 기본 JSONResponse 포함)
+
+을 측정합니다.
+
+사용법:
+    python scripts/bench_json_codec.py --size 20000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.utils.json_codec import OrjsonCodec, StdlibJsonCodec, orjson  # noqa: E402
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "sample.json"
+
+
+def make_lines(n: int):
+    """sample.json 형태의 JSONL 라인 목록"""
+    sample = json.loads(SAMPLE_FILE.read_text(encoding="utf-8"))
+    lines = []
+    for i in range(n):
+        item = dict(sample)
+        item["guid"] = f"{sample['guid']}-{i}"
+        item["title"] = f"{sample['title']} {i}"
+        item["article_text"] = (sample.get("description") or "") * (1 + i % 8)
+        lines.append(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+    return lines
+
+
+def measure(func, repeat: int) -> float:
+    """중앙값 실행 시간(s)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = make_lines(args.size)
+    total_mb = sum(len(line) for line in lines) / 1e6
+    codecs = [StdlibJsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson이 설치되어 있지 않아 표준 json만 측정합니다")
+
+    print(f"=== {args.size:,}개 라인, {total_mb:,.1f} MB ===")
+    print(f"{'코덱':<10}{'파싱 (MB/s)':>14}{'직렬화 (MB/s)':>16}")
+    items = [json.loads(line) for line in lines]
+    for codec in codecs:
+        parse_s = measure(lambda: [codec.loads(line) for line in lines], args.repeat)
+        dump_s = measure(lambda: [codec.dumps(item) for item in items], args.repeat)
+        print(f"{codec.name:<10}{total_mb / parse_s:>14,.1f}{total_mb / dump_s:>16,.1f}")
+
+    # /news/description 한 페이지(최대 100건) 응답 본문 렌더링
+    page = {"success": True, "count": 100, "data": items[:100], "total": args.size}
+    print(f"{'응답 렌더링':<10}{'시간 (ms)':>14}")
+    baseline = measure(lambda: JSONResponse(page), args.repeat * 20)
+    print(f"{'JSONResponse':<10}{baseline * 1000:>14.3f}")
+    for codec in codecs:
+        elapsed = measure(lambda: codec.dumps(page), args.repeat * 20)
+        print(f"{codec.name:<10}{elapsed * 1000:>14.3f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
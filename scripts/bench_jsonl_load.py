@@ -0,0 +1,67 @@
+"""
+JSONL 로드 벤치마크 - 직렬/병렬 디코딩과 압축 파일(gzip/zstd) 로드 비교
+
+합성 뉴스 JSONL 파일을 임시로 만든 뒤 워커 수별로 전체 로드 시간을 측정하고,
+같은 내용을 압축한 파일의 로드 시간을 압축 해제와 파싱으로 나눠 측정합니다.
+
+사용법:
+    python scripts/bench_jsonl_load.py --size 300000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import compression  # noqa: E402
+from app.utils.data_loader import JsonlTailReader  # noqa: E402
+
+from bench_news_memory import write_items  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=300_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "news.jsonl"
+        write_items(path, args.size)
+        size_mb = path.stat().st_size / 1e6
+        print(f"=== {args.size:,}개 항목, {size_mb:,.1f} MB (CPU {os.cpu_count()}개) ===")
+        print(f"{'워커':<8}{'로드 (s)':>10}{'MB/s':>10}")
+        for workers in args.workers:
+            reader = JsonlTailReader(path, workers=workers, parallel_min_bytes=0)
+            started = time.perf_counter()
+            data, _ = reader.read_new()
+            elapsed = time.perf_counter() - started
+            assert len(data) == args.size
+            print(f"{workers:<8}{elapsed:>10.2f}{size_mb / elapsed:>10.1f}")
+            del data
+
+        suffixes = [".gz"] + ([".zst"] if compression.zstandard is not None else [])
+        print(f"{'압축':<8}{'크기 (MB)':>10}{'로드 (s)':>10}{'해제 MB/s':>12}{'파싱 MB/s':>12}")
+        for suffix in suffixes:
+            packed = path.with_name(path.name + suffix)
+            with path.open("rb") as src, compression.open_for_write(packed) as dst:
+                while chunk := src.read(compression.READ_BUFFER_SIZE):
+                    dst.write(chunk)
+            reader = JsonlTailReader(packed)
+            started = time.perf_counter()
+            data, _ = reader.read_new()
+            elapsed = time.perf_counter() - started
+            assert len(data) == args.size
+            stats = reader.stats
+            print(
+                f"{stats['compression']:<8}{packed.stat().st_size / 1e6:>10.1f}{elapsed:>10.2f}"
+                f"{size_mb / stats['decompress_seconds']:>12.1f}{size_mb / stats['parse_seconds']:>12.1f}"
+            )
+            del data
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+뉴스 응답 인코딩 벤치마크 - 항목당 NewsOut/NewsEntry 변환 비용 비교
+
+sample.json 레코드를 복제한 합성 레코드로 한 페이지 응답 본문을 만드는 비용을
+항목당 마이크로초로 측정합니다.
+
+- 모델+response_model: 모델을 하나씩 만든 뒤 FastAPI처럼 response_model로 다시
+  검증/직렬화 (조각 캐시 이전의 경로)
+- 모델 하나씩: 레코드마다 모델을 만들어 JSON 조각으로 인코딩
+- TypeAdapter 일괄: 목록 어댑터로 한 번에 검증/직렬화 (조각 캐시 미스 경로)
+- 조각 캐시 적중: 미리 인코딩한 조각을 이어 붙이기만 함
+
+사용법:
+    python scripts/bench_news_encode.py --page 100
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.api.v1.endpoints.news import (  # noqa: E402
+    _encode_news_entry,
+    _encode_news_out,
+    _json_array,
+    _news_entry_values,
+    _news_out_values,
+)
+from app.schemas.news import NewsEntry, NewsOut  # noqa: E402
+from app.utils.json_codec import codec  # noqa: E402
+
+SAMPLE_FILE = Path(__file__).resolve().parent.parent / "sample.json"
+
+
+def make_items(n: int):
+    """sample.json 형태의 레코드 목록"""
+    sample = json.loads(SAMPLE_FILE.read_text(encoding="utf-8"))
+    items = []
+    for i in range(n):
+        item = dict(sample)
+        item["guid"] = f"{sample['guid']}-{i}"
+        item["title"] = f"{sample['title']} {i}"
+        item["link"] = f"{sample['link']}-{i}"
+        item["summary"] = sample.get("description")
+        item["article_text"] = (sample.get("description") or "") * (1 + i % 8)
+        items.append(item)
+    return items
+
+
+def measure(func, repeat: int) -> float:
+    """중앙값 실행 시간(s)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    items = make_items(args.page)
+    print(f"=== 페이지 {args.page}건, 코덱 {codec.name} (항목당 µs) ===")
+    print(f"{'방식':<22}{'NewsOut':>10}{'NewsEntry':>12}")
+
+    cases = []
+    for model, values, encode in (
+        (NewsOut, _news_out_values, _encode_news_out),
+        (NewsEntry, _news_entry_values, _encode_news_entry),
+    ):
+        response_model = TypeAdapter(List[model])
+
+        def per_model_response(model=model, values=values, response_model=response_model):
+            models = [model(**values(item)) for item in items]
+            # FastAPI: 반환값을 dict로 바꾼 뒤 response_model로 다시 검증하고 JSON 모드로 직렬화
+            dumped = [m.model_dump() for m in models]
+            codec.dumps(response_model.dump_python(response_model.validate_python(dumped), mode="json"))
+
+        def per_model(model=model, values=values):
+            _json_array([codec.dumps(model(**values(item)).model_dump(mode="json")) for item in items])
+
+        def batched(encode=encode):
+            _json_array(encode(items))
+
+        fragments = encode(items)
+        cases.append((
+            measure(per_model_response, args.repeat),
+            measure(per_model, args.repeat),
+            measure(batched, args.repeat),
+            measure(lambda fragments=fragments: _json_array(fragments), args.repeat),
+        ))
+
+    labels = ("모델+response_model", "모델 하나씩", "TypeAdapter 일괄", "조각 캐시 적중")
+    for row, label in enumerate(labels):
+        out_us, entry_us = (case[row] / args.page * 1e6 for case in cases)
+        print(f"{label:<22}{out_us:>10.2f}{entry_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+뉴스 레코드 메모리 벤치마크 - dict 레코드와 압축 레코드(NewsRecord) 비교
+
+합성 뉴스 JSONL 파일을 임시로 만든 뒤 같은 파일을 dict 목록과 NewsRecord
+목록으로 각각 로드해 실제로 서비스하는 메모리 모드 스냅샷(NewsSnapshot: 레코드,
+컬럼, 전문/트라이그램 색인, 중복 제거 색인)을 만들고, tracemalloc으로 레코드만
+로드했을 때와 스냅샷까지 만든 뒤 남아 있는 메모리, 최대 메모리, 로드 시간,
+본문 접근 시간을 측정합니다.
+
+사용법:
+    python scripts/bench_news_memory.py --size 500000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.news_store import NewsSnapshot  # noqa: E402
+from app.repositories.news_record import compact_records  # noqa: E402
+from app.utils.data_loader import JsonlTailReader  # noqa: E402
+
+SOURCES = [f"Source {i}" for i in range(40)]
+GROUPS = ["frontier_lab", "research", "news", "policy", "industry"]
+TAGS = ["AI", "LLM", "Robotics", "Policy", "Chips", "Research"]
+WORDS = "model training inference chip robot policy research data market open source benchmark".split()
+
+
+def write_items(path: Path, n: int, seed: int = 42) -> None:
+    """합성 뉴스 JSONL 파일 생성 (본문 약 1,000자)"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    scraped_at = start.isoformat()
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            dt = start + timedelta(seconds=rng.randrange(0, 365 * 24 * 3600))
+            body = " ".join(rng.choice(WORDS) for _ in range(130))
+            item = {
+                "guid": f"guid-{i}",
+                "source": rng.choice(SOURCES),
+                "title": f"News title {i}",
+                "link": f"https://example.com/{i}",
+                "pub_date": dt.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+                "author": "",
+                "category": "",
+                "tags": rng.sample(TAGS, 2),
+                "group": rng.choice(GROUPS),
+                "scraped_at": scraped_at,
+                "summary": " ".join(rng.choice(WORDS) for _ in range(25)),
+                "article_text": body,
+            }
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+
+def load(path: Path, compact: bool):
+    """파일 로드 후 (스냅샷, 레코드만 남은 메모리 MB, 스냅샷 메모리 MB, 최대 메모리 MB, 로드 시간 s)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    reader = JsonlTailReader(path)
+    if compact:
+        records = compact_records(item for _, item in reader.iter_new())
+    else:
+        records, _ = reader.read_new()
+    del reader
+    records_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    snapshot = NewsSnapshot(1, records)
+    del records
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return snapshot, records_mb, current / 1e6, peak / 1e6, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "news.jsonl"
+        write_items(path, args.size)
+        print(f"=== {args.size:,}개 항목, 파일 {path.stat().st_size / 1e6:,.1f} MB ===")
+        print(
+            f"{'형식':<14}{'레코드 (MB)':>12}{'스냅샷 (MB)':>12}{'최대 (MB)':>12}"
+            f"{'로드 (s)':>10}{'본문 접근 (us)':>16}"
+        )
+        for name, compact in (("dict", False), ("NewsRecord", True)):
+            snapshot, records_mb, current, peak, elapsed = load(path, compact)
+            sample = snapshot.items[:: max(1, len(snapshot) // 10_000)]
+            started = time.perf_counter()
+            for record in sample:
+                record.get("article_text")
+            access_us = (time.perf_counter() - started) / len(sample) * 1e6
+            print(
+                f"{name:<14}{records_mb:>12,.1f}{current:>12,.1f}{peak:>12,.1f}"
+                f"{elapsed:>10.1f}{access_us:>16.2f}"
+            )
+            del snapshot, sample
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+뉴스 검색 벤치마크 - dict 순회 방식과 컬럼형(NumPy) 방식 비교
+
+합성 뉴스 데이터를 메모리에 만들어 소스/그룹 필터링과 시간순 정렬에 걸리는
+시간을 측정합니다. 서버나 데이터 파일 없이 실행할 수 있습니다.
+
+사용법:
+    python scripts/bench_news_search.py --sizes 100000 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.repositories.news_columns import NewsColumns, build_search_text  # noqa: E402
+from app.repositories.news_trigram_index import TrigramIndex  # noqa: E402
+from app.services.news_ranking import freshness_scores, rank_news  # noqa: E402
+
+SOURCES = [f"Source {i}" for i in range(40)]
+GROUPS = ["frontier_lab", "research", "news", "policy", "industry"]
+
+
+def make_items(n: int, seed: int = 42):
+    """합성 뉴스 레코드 생성"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for i in range(n):
+        dt = start + timedelta(seconds=rng.randrange(0, 365 * 24 * 3600))
+        item = {
+            "guid": f"guid-{i}",
+            "source": rng.choice(SOURCES),
+            "group": rng.choice(GROUPS),
+            "title": f"News title {i}",
+            "summary": "short summary",
+            "link": f"https://example.com/{i}",
+        }
+        if i % 2:
+            item["published"] = dt.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        else:
+            item["processed_at"] = dt.isoformat()
+        items.append(item)
+    return items
+
+
+def dict_search(items, source=None, group=None):
+    """기존 방식: dict 목록을 순회하며 필터링/정렬"""
+    data = list(items)
+    if source:
+        data = [item for item in data if item.get('source') == source]
+    if group:
+        data = [item for item in data if item.get('group') == group]
+    data.sort(key=lambda x: x.get('published') or x.get('processed_at') or '', reverse=True)
+    return data[:20], len(data)
+
+
+def columnar_search(columns: NewsColumns, source=None, group=None):
+    """컬럼형 방식: 값별 색인 + 상위 k 선택"""
+    ids = columns.filter_ids(source=source, group=group)
+    total = len(columns) if ids is None else len(ids)
+    return rank_news(columns, ids, "time", 20, 0.0), total
+
+
+def full_sort_fresh(columns: NewsColumns, ids, k: int, now_ts: float):
+    """전체 정렬 방식: 모든 후보의 점수를 정렬한 뒤 앞부분만 사용"""
+    epoch_us = columns.epoch_us if ids is None else columns.epoch_us[ids]
+    order = np.argsort(-freshness_scores(epoch_us, now_ts), kind='stable')
+    return order[:k]
+
+
+def scan_contains(columns: NewsColumns, items, term: str):
+    """전체 순회 부분 문자열 검색"""
+    return columns.contains(range(len(columns)), term, items)
+
+
+def trigram_contains(columns: NewsColumns, items, index: TrigramIndex, term: str):
+    """트라이그램 후보 축소 후 부분 문자열 검색"""
+    candidates = index.candidates(term)
+    if candidates is None:
+        return scan_contains(columns, items, term)
+    return columns.contains(candidates.tolist(), term, items)
+
+
+def measure(func, repeat: int) -> float:
+    """중앙값 실행 시간(ms)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = {
+        "source": {"source": SOURCES[3]},
+        "group": {"group": GROUPS[1]},
+        "source+group": {"source": SOURCES[3], "group": GROUPS[1]},
+        "all (time sort)": {},
+    }
+
+    for n in args.sizes:
+        items = make_items(n)
+        started = time.perf_counter()
+        columns = NewsColumns.build(items)
+        build_ms = (time.perf_counter() - started) * 1000
+        print(f"\n=== {n:,}개 항목 (컬럼 구축 {build_ms:,.0f} ms) ===")
+        print(f"{'케이스':<18}{'dict (ms)':>12}{'columnar (ms)':>15}{'배속':>10}")
+        for name, params in cases.items():
+            before = measure(lambda: dict_search(items, **params), args.repeat)
+            after = measure(lambda: columnar_search(columns, **params), args.repeat)
+            print(f"{name:<18}{before:>12.1f}{after:>15.2f}{before / after:>9.1f}x")
+
+        # 신선도 정렬 첫 페이지: 전체 정렬 vs 상위 k 선택
+        now_ts = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+        group_ids = columns.filter_ids(group=GROUPS[1])
+        print(f"{'fresh 첫 페이지':<18}{'full sort (ms)':>12}{'top-k (ms)':>15}{'배속':>10}")
+        for name, ids in (("all", None), ("group", group_ids)):
+            before = measure(lambda: full_sort_fresh(columns, ids, 20, now_ts), args.repeat)
+            after = measure(lambda: rank_news(columns, ids, "fresh", 20, now_ts), args.repeat)
+            print(f"{name:<18}{before:>12.1f}{after:>15.3f}{before / after:>9.1f}x")
+
+        # 부분 문자열 검색(q): 전체 순회 vs 트라이그램 후보 축소
+        started = time.perf_counter()
+        trigram = TrigramIndex.build(build_search_text(item) for item in items)
+        build_ms = (time.perf_counter() - started) * 1000
+        print(f"{f'q (색인 {build_ms:,.0f} ms)':<18}{'scan (ms)':>12}{'trigram (ms)':>15}{'배속':>10}")
+        for term in ("title 4242", "summary", "zzz"):
+            assert trigram_contains(columns, items, trigram, term) == scan_contains(columns, items, term)
+            before = measure(lambda: scan_contains(columns, items, term), args.repeat)
+            after = measure(lambda: trigram_contains(columns, items, trigram, term), args.repeat)
+            print(f"{term:<18}{before:>12.1f}{after:>15.3f}{before / after:>9.1f}x")
+        del items, columns, trigram
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+뉴스 스토어 시작 시간 벤치마크 - 전체 파싱과 스냅샷 사이드카 복원 비교
+
+합성 뉴스 JSONL 파일을 임시로 만든 뒤 새 NewsStore로 첫 스냅샷을 얻기까지의
+시간(첫 요청 처리 가능 시점)을 측정합니다.
+
+- 전체 파싱: 사이드카 없이 JSONL을 읽어 컬럼/색인 구축 (사이드카 저장 시간 별도 표시)
+- 사이드카: 저장된 사이드카를 불러와 바로 사용
+- 사이드카 + 추가분: 사이드카 저장 후 1% 라인을 추가한 파일
+
+사용법:
+    python scripts/bench_news_startup.py --size 200000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.core.news_store import NewsStore  # noqa: E402
+from app.core.snapshot_file import sidecar_path  # noqa: E402
+from app.repositories.news_repository import NewsRepository  # noqa: E402
+
+from bench_news_memory import write_items  # noqa: E402
+
+
+def start_store(news_file: Path):
+    """새 스토어로 첫 스냅샷 로드 → (스냅샷, 걸린 시간 s)"""
+    repo = NewsRepository()
+    repo.backend = "FILE"
+    repo.news_file = news_file
+    store = NewsStore(repo)
+    started = time.perf_counter()
+    snapshot = asyncio.run(store.get_snapshot())
+    return snapshot, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        news_file = Path(tmp) / "news.jsonl"
+        write_items(news_file, args.size)
+        sidecar = sidecar_path(news_file)
+        print(f"=== {args.size:,}개 항목, 파일 {news_file.stat().st_size / 1e6:,.1f} MB ===")
+        print(f"{'방식':<20}{'항목 수':>10}{'시작 (s)':>10}")
+
+        snapshot, elapsed = start_store(news_file)
+        print(f"{'전체 파싱+저장':<20}{len(snapshot):>10,}{elapsed:>10.2f}")
+        print(f"{'(사이드카 크기)':<20}{sidecar.stat().st_size / 1e6:>10,.1f} MB")
+
+        sidecar.unlink()
+        settings.news_snapshot_cache = False
+        snapshot, elapsed = start_store(news_file)
+        print(f"{'전체 파싱':<20}{len(snapshot):>10,}{elapsed:>10.2f}")
+        settings.news_snapshot_cache = True
+        start_store(news_file)
+
+        snapshot, elapsed = start_store(news_file)
+        print(f"{'사이드카':<20}{len(snapshot):>10,}{elapsed:>10.2f}")
+
+        extra = Path(tmp) / "extra.jsonl"
+        write_items(extra, max(1, args.size // 100), seed=7)
+        with news_file.open("ab") as f:
+            f.write(extra.read_bytes())
+        snapshot, elapsed = start_store(news_file)
+        print(f"{'사이드카+추가분':<20}{len(snapshot):>10,}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
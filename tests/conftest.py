@@ -4,6 +4,7 @@ pytest 설정 파일 및 공통 픽스처
 
 import pytest
 import sys
+import os
 import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -187,6 +188,49 @@ def test_jsonl_file(tmp_path, sample_news_entries):
     return test_file
 
 
+def write_jsonl(path: Path, entries: List[Dict[str, Any]], mode: str = "w") -> None:
+    """JSONL 파일 쓰기
+
+    같은 시각 안에 여러 번 써도 스토어가 변경을 감지하도록 mtime을 1ms 뒤로 옮깁니다.
+    """
+    with path.open(mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def news_service():
+    """파일 백엔드 NewsService 팩토리
+
+    ``news_service(path)``는 path를 바라보는 새 NewsRepository → NewsStore →
+    NewsService를 만듭니다 (프로세스 재시작에 해당). 키워드 인자는 Repository
+    속성으로 설정합니다 (예: ``file_mode="mmap"``).
+    """
+    from app.core.news_store import NewsStore
+    from app.repositories.news_repository import NewsRepository
+    from app.services.news_service import NewsService
+
+    def make(news_file: Path, **repo_attrs: Any) -> NewsService:
+        repo = NewsRepository()
+        repo.backend = "FILE"
+        repo.news_file = news_file
+        for name, value in repo_attrs.items():
+            setattr(repo, name, value)
+        return NewsService(news_store=NewsStore(repo))
+
+    return make
+
+
+@pytest.fixture
+def file_store(tmp_path, sample_news_entries, news_service):
+    """임시 JSONL 파일을 바라보는 NewsStore"""
+    news_file = tmp_path / "news.jsonl"
+    write_jsonl(news_file, sample_news_entries)
+    return news_service(news_file).news_store, news_file
+
+
 @pytest.fixture
 def invalid_json_file(tmp_path):
     """잘못된 JSON 파일"""
@@ -0,0 +1,202 @@
+"""
+데이터 로더(app.utils.data_loader) 단위 테스트
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from app.utils.compression import detect_compression
+from app.utils.data_loader import JsonlTailReader, load_jsonl_file, save_jsonl_file
+
+
+def _append(path, entries):
+    with path.open("a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class TestJsonlTailReader:
+    """JsonlTailReader 증분 읽기 테스트"""
+
+    def test_first_read_is_full(self, test_jsonl_file, sample_news_entries):
+        """최초 읽기는 파일 전체"""
+        reader = JsonlTailReader(test_jsonl_file)
+        data, full = reader.read_new()
+        assert full is True
+        assert [d["guid"] for d in data] == [e["guid"] for e in sample_news_entries]
+        assert reader.offset == test_jsonl_file.stat().st_size
+
+    def test_reads_only_appended_lines(self, test_jsonl_file):
+        """추가된 라인만 읽기"""
+        reader = JsonlTailReader(test_jsonl_file)
+        reader.read_new()
+
+        _append(test_jsonl_file, [{"guid": "new-1"}, {"guid": "new-2"}])
+        data, full = reader.read_new()
+        assert full is False
+        assert [d["guid"] for d in data] == ["new-1", "new-2"]
+
+        data, full = reader.read_new()
+        assert (data, full) == ([], False)
+
+    def test_partial_last_line_is_deferred(self, test_jsonl_file):
+        """기록 중인 마지막 라인은 완성될 때까지 보류"""
+        reader = JsonlTailReader(test_jsonl_file)
+        reader.read_new()
+
+        with test_jsonl_file.open("a", encoding="utf-8") as f:
+            f.write('{"guid": "par')
+        data, _ = reader.read_new()
+        assert data == []
+
+        with test_jsonl_file.open("a", encoding="utf-8") as f:
+            f.write('tial"}\n')
+        data, full = reader.read_new()
+        assert full is False
+        assert data == [{"guid": "partial"}]
+
+    def test_truncation_triggers_full_reload(self, test_jsonl_file):
+        """파일이 줄어들면 처음부터 다시 읽기"""
+        reader = JsonlTailReader(test_jsonl_file)
+        reader.read_new()
+
+        test_jsonl_file.write_text('{"guid": "only"}\n', encoding="utf-8")
+        data, full = reader.read_new()
+        assert full is True
+        assert data == [{"guid": "only"}]
+
+    def test_rotation_triggers_full_reload(self, tmp_path, test_jsonl_file):
+        """다른 파일로 교체(로테이션)되면 처음부터 다시 읽기"""
+        reader = JsonlTailReader(test_jsonl_file)
+        reader.read_new()
+
+        rotated = tmp_path / "rotated.jsonl"
+        rotated.write_text(
+            test_jsonl_file.read_text(encoding="utf-8") + '{"guid": "x"}\n',
+            encoding="utf-8",
+        )
+        os.replace(rotated, test_jsonl_file)
+        data, full = reader.read_new()
+        assert full is True
+        assert data[-1] == {"guid": "x"}
+
+    def test_invalid_lines_are_skipped(self, tmp_path):
+        """잘못된 JSON 라인은 건너뜀"""
+        path = tmp_path / "mixed.jsonl"
+        path.write_text('{"a": 1}\n{broken\n\n{"a": 2}\n', encoding="utf-8")
+        assert load_jsonl_file(path) == [{"a": 1}, {"a": 2}]
+
+    def test_missing_file(self, tmp_path):
+        """파일이 없으면 빈 목록"""
+        assert load_jsonl_file(tmp_path / "missing.jsonl") == []
+
+
+class TestParallelLoad:
+    """병렬 청크 디코딩 테스트"""
+
+    def _write_lines(self, path, n):
+        with path.open("w", encoding="utf-8") as f:
+            for i in range(n):
+                if i % 97 == 5:
+                    f.write("{broken json\n")
+                elif i % 89 == 7:
+                    f.write("\n")
+                else:
+                    f.write(json.dumps({"guid": f"g{i}", "title": "제목 " * (i % 5)}, ensure_ascii=False) + "\n")
+            f.write('{"guid": "partial')
+
+    def test_matches_serial(self, tmp_path, monkeypatch):
+        """병렬 결과(오프셋/순서/라인 수)가 직렬 결과와 동일"""
+        monkeypatch.setattr("app.utils.data_loader._MIN_CHUNK_BYTES", 1024)
+        path = tmp_path / "big.jsonl"
+        self._write_lines(path, 2000)
+
+        serial = JsonlTailReader(path)
+        parallel = JsonlTailReader(path, workers=2, parallel_min_bytes=1)
+        assert list(parallel.iter_new()) == list(serial.iter_new())
+        assert (parallel.offset, parallel.line_count) == (serial.offset, serial.line_count)
+
+        # 기록 중이던 라인이 완성되면 이어서 읽기
+        with path.open("a", encoding="utf-8") as f:
+            f.write('"}\n')
+        data, full = parallel.read_new()
+        assert full is False
+        assert data == [{"guid": "partial"}]
+
+    def test_error_line_numbers(self, tmp_path, caplog, monkeypatch):
+        """오류 라인 번호가 파일 전체 기준으로 보고됨"""
+        monkeypatch.setattr("app.utils.data_loader._MIN_CHUNK_BYTES", 1024)
+        path = tmp_path / "big.jsonl"
+        self._write_lines(path, 300)
+        reader = JsonlTailReader(path, workers=2, parallel_min_bytes=1)
+        with caplog.at_level("WARNING"):
+            reader.read_new()
+        reported = sorted(int(r.getMessage().split()[1]) for r in caplog.records if "파싱 오류" in r.getMessage())
+        assert reported == [i + 1 for i in range(300) if i % 97 == 5]
+
+    def test_split_ranges_align_to_lines(self, tmp_path):
+        """청크 경계는 항상 라인 시작"""
+        from app.utils.data_loader import _split_ranges
+
+        path = tmp_path / "big.jsonl"
+        self._write_lines(path, 500)
+        content = path.read_bytes()
+        end = content.rfind(b"\n") + 1
+        with path.open("rb") as f:
+            ranges = _split_ranges(f, 0, end, 7)
+        assert ranges[0][0] == 0 and ranges[-1][1] == end
+        for (_, prev_end), (start, _) in zip(ranges, ranges[1:]):
+            assert prev_end == start
+            assert content[start - 1:start] == b"\n"
+
+
+class TestCompressedJsonl:
+    """gzip/zstd 압축 JSONL 읽기/쓰기 테스트"""
+
+    def test_gzip_round_trip(self, tmp_path, sample_news_entries):
+        """.jsonl.gz로 저장하면 압축되고 그대로 다시 읽힘"""
+        path = tmp_path / "news.jsonl.gz"
+        assert save_jsonl_file(sample_news_entries, path)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert load_jsonl_file(path) == sample_news_entries
+
+    def test_detect_by_magic_bytes(self, tmp_path, sample_news_entries):
+        """확장자와 관계없이 매직 바이트로 판별"""
+        path = tmp_path / "news.jsonl"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for entry in sample_news_entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        assert detect_compression(path) == "gzip"
+        assert load_jsonl_file(path) == sample_news_entries
+        # 아직 없는 파일은 확장자로 판별
+        assert detect_compression(tmp_path / "new.jsonl.zst") == "zstd"
+        assert detect_compression(tmp_path / "new.jsonl") is None
+
+    def test_stats_and_full_reread(self, tmp_path, sample_news_entries):
+        """압축 해제/파싱 시간을 따로 기록하고, 변경 시 전체를 다시 읽음"""
+        path = tmp_path / "news.jsonl.gz"
+        save_jsonl_file(sample_news_entries, path)
+        reader = JsonlTailReader(path)
+        data, full = reader.read_new()
+        assert full is True and len(data) == len(sample_news_entries)
+        stats = reader.stats
+        assert stats["compression"] == "gzip"
+        assert stats["compressed_bytes"] == path.stat().st_size
+        assert stats["bytes"] == reader.offset > stats["compressed_bytes"] > 0
+        assert stats["decompress_seconds"] > 0 and stats["parse_seconds"] > 0
+
+        save_jsonl_file(sample_news_entries + sample_news_entries[:1], path)
+        data, full = reader.read_new()
+        assert full is True
+        assert len(data) == len(sample_news_entries) + 1
+
+    def test_zstd_round_trip(self, tmp_path, sample_news_entries):
+        """.jsonl.zst 저장/읽기 (zstandard 설치 시)"""
+        pytest.importorskip("zstandard")
+        path = tmp_path / "news.jsonl.zst"
+        assert save_jsonl_file(sample_news_entries, path)
+        assert detect_compression(path) == "zstd"
+        assert load_jsonl_file(path) == sample_news_entries
@@ -0,0 +1,61 @@
+"""
+날짜 정규화(app.utils.date_parser) 단위 테스트
+"""
+
+from datetime import datetime, timezone
+
+from app.utils.date_parser import (
+    DateNormalizer,
+    _parse_string,
+    parse_news_datetime,
+    parse_news_datetime_with_format,
+)
+
+
+class TestParseNewsDatetime:
+    """parse_news_datetime 테스트"""
+
+    def test_rfc2822(self):
+        ts = parse_news_datetime("Mon, 25 Aug 2025 06:00:00 GMT")
+        assert ts == datetime(2025, 8, 25, 6, tzinfo=timezone.utc).timestamp()
+
+    def test_iso8601_with_z(self):
+        ts, fmt = parse_news_datetime_with_format("2024-01-01T12:00:00Z")
+        assert fmt == "iso8601"
+        assert ts == datetime(2024, 1, 1, 12, tzinfo=timezone.utc).timestamp()
+
+    def test_invalid_and_missing(self):
+        assert parse_news_datetime_with_format("not a date") == (None, "invalid")
+        assert parse_news_datetime_with_format(None) == (None, "missing")
+        assert parse_news_datetime_with_format(12345) == (None, "invalid")
+
+    def test_repeated_strings_are_memoized(self):
+        value = "Tue, 26 Aug 2025 07:00:00 GMT"
+        parse_news_datetime(value)
+        hits = _parse_string.cache_info().hits
+        parse_news_datetime(value)
+        assert _parse_string.cache_info().hits == hits + 1
+
+
+class TestDateNormalizer:
+    """DateNormalizer 테스트"""
+
+    def test_field_priority(self):
+        """published → pub_date → processed_at → scraped_at 순서로 사용"""
+        normalizer = DateNormalizer()
+        item = {
+            "pub_date": "Fri, 22 Aug 2025 08:30:00 GMT",
+            "scraped_at": "2025-08-25T02:51:21.590956",
+        }
+        assert normalizer.normalize(item) == parse_news_datetime(item["pub_date"])
+        assert normalizer.stats["field:pub_date"] == 1
+        assert normalizer.stats["rfc2822"] == 1
+
+    def test_stats(self):
+        normalizer = DateNormalizer()
+        normalizer.normalize({"processed_at": "2025-08-26T11:47:10"})
+        normalizer.normalize({"published": "garbage"})
+        normalizer.normalize({})
+        assert normalizer.stats["iso8601"] == 1
+        assert normalizer.stats["invalid"] == 1
+        assert normalizer.stats["missing"] == 1
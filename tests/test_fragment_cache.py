@@ -0,0 +1,161 @@
+"""
+응답 JSON 조각 캐시(FragmentCache) 단위 테스트
+"""
+
+import asyncio
+import json
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.api.deps import get_news_service
+from app.core.fragment_cache import FragmentCache
+from app.main import app
+from app.schemas.news import NewsDescriptionResponse, NewsOut
+from app.utils.json_codec import codec
+
+from .conftest import write_jsonl
+
+
+def _encoder(calls):
+    def encode_missing(ids):
+        calls.append(list(ids))
+        return [str(i).encode() for i in ids]
+    return encode_missing
+
+
+class TestFragmentCache:
+    """FragmentCache 테스트"""
+
+    def test_encodes_only_missing(self):
+        """캐시에 없는 레코드만 인코딩하고 요청 순서대로 반환"""
+        calls = []
+        cache = FragmentCache(max_bytes=1 << 20)
+        assert cache.get_many("out", [3, 1], _encoder(calls)) == [b"3", b"1"]
+        assert cache.get_many("out", [1, 2, 3], _encoder(calls)) == [b"1", b"2", b"3"]
+        assert calls == [[3, 1], [2]]
+        # 응답 형식별로 따로 보관
+        cache.get_many("entry", [1], _encoder(calls))
+        assert calls[-1] == [1]
+        stats = cache.stats()
+        assert stats["hits"] == 2 and stats["misses"] == 4 and stats["entries"] == 4
+
+    def test_eviction_by_bytes(self):
+        """최대 메모리를 넘으면 오래 쓰지 않은 조각부터 제거"""
+        calls = []
+        cache = FragmentCache(max_bytes=2 * 121)
+        cache.get_many("out", [1, 2], _encoder(calls))
+        cache.get_many("out", [1], _encoder(calls))
+        cache.get_many("out", [3], _encoder(calls))
+        cache.get_many("out", [1, 2], _encoder(calls))
+        assert calls[-1] == [2]
+        assert cache.stats()["evictions"] == 2
+
+    def test_disabled(self):
+        """max_bytes=0이면 매번 인코딩"""
+        calls = []
+        cache = FragmentCache(max_bytes=0)
+        cache.get_many("out", [1], _encoder(calls))
+        cache.get_many("out", [1], _encoder(calls))
+        assert calls == [[1], [1]]
+        assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def service(tmp_path, news_service):
+    """임시 뉴스 파일을 바라보는 서비스"""
+    news_file = tmp_path / "news.jsonl"
+    write_jsonl(news_file, [
+        {
+            "guid": f"g{i}",
+            "source": "Alpha",
+            "title": f"뉴스 {i} \"따옴표\"",
+            "link": f"https://example.com/{i}" if i % 3 else f"https://Example.com/{i}/",
+            "article_text": "본문 " * 10,
+            "readability_score": 12.5 if i % 2 else None,
+            "tags": ["ai", "로봇"],
+            "published": f"2025-01-01T00:00:{i:02d}Z",
+        }
+        for i in range(30)
+    ])
+    return news_service(news_file)
+
+
+@pytest.fixture
+def client(service):
+    app.dependency_overrides[get_news_service] = lambda: service
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_news_service, None)
+
+
+class TestPreEncodedResponses:
+    """조각을 이어 붙인 응답이 모델 직렬화 결과와 같은 bytes인지"""
+
+    def test_news_list(self, client, service):
+        for _ in range(2):
+            response = client.get("/api/v1/news/", params={"sort": "time", "limit": 10})
+            assert response.headers["content-type"] == "application/json"
+            items = service.news_store.snapshot.get_items(range(29, 19, -1))
+            models = [NewsOut(**{**item, "authors": []}) for item in items]
+            assert response.content == codec.dumps(TypeAdapter(List[NewsOut]).dump_python(models, mode="json"))
+        stats = service.news_store.snapshot.fragments.stats()
+        assert stats["misses"] == 10 and stats["hits"] == 10
+
+    def test_description(self, client, service):
+        params = {"sort": "time", "limit": 5}
+        response = client.get("/api/v1/news/description", params=params)
+        body = NewsDescriptionResponse.model_validate_json(response.content)
+        expected = NewsDescriptionResponse(
+            success=True, count=5, data=body.data,
+            total=30, next_cursor=response.json()["next_cursor"],
+        )
+        assert response.content == codec.dumps(expected.model_dump(mode="json"))
+        assert body.data[0].guid == "g29"
+
+        # 스트리밍 응답도 같은 조각 사용
+        streamed = client.get("/api/v1/news/description", params={**params, "stream": "true"})
+        assert streamed.text.splitlines() == [codec.dumps(entry.model_dump()).decode() for entry in body.data]
+        assert service.news_store.snapshot.fragments.stats()["hits"] == 5
+
+    def test_batch_encoding_matches_models(self, service):
+        """목록 어댑터 일괄 인코딩이 모델을 하나씩 만든 결과와 같음, 잘못된 link는 검증 오류"""
+        from pydantic import ValidationError
+
+        from app.api.v1.endpoints.news import _encode_news_entry, _encode_news_out, _news_out_values
+
+        items = asyncio.run(service.news_store.get_snapshot()).get_items(range(6))
+        assert _encode_news_out(items) == [
+            codec.dumps(NewsOut(**_news_out_values(item)).model_dump(mode="json")) for item in items
+        ]
+        assert [json.loads(fragment)["guid"] for fragment in _encode_news_entry(items)] == [f"g{i}" for i in range(6)]
+        with pytest.raises(ValidationError):
+            _encode_news_out([*items, {"title": "링크 없음"}])
+
+
+class TestOffloadedWork:
+    """검색/디코딩/인코딩이 이벤트 루프 밖에서 실행되는지"""
+
+    def test_search_and_encoding_run_in_executor(self, client, service, monkeypatch):
+        import threading
+
+        from app.api.v1.endpoints import news as news_endpoint
+
+        threads = []
+
+        def record(func):
+            def wrapper(*args, **kwargs):
+                threads.append((func.__name__, threading.current_thread().name))
+                return func(*args, **kwargs)
+            wrapper.__name__ = func.__name__
+            return wrapper
+
+        monkeypatch.setattr(service, "_search_ids", record(service._search_ids))
+        monkeypatch.setattr(news_endpoint, "_encode_news_out", record(news_endpoint._encode_news_out))
+        monkeypatch.setattr(news_endpoint, "_sparse_rows", record(news_endpoint._sparse_rows))
+
+        assert client.get("/api/v1/news/", params={"q": "뉴스 1", "limit": 5}).status_code == 200
+        assert client.get("/api/v1/news/", params={"q": "뉴스 2", "fields": "title"}).status_code == 200
+        assert [name for name, _ in threads] == ["_search_ids", "_encode_news_out", "_search_ids", "_sparse_rows"]
+        assert all(thread.startswith("news-io") for _, thread in threads)
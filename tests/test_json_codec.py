@@ -0,0 +1,66 @@
+"""
+JSON 코덱(app.utils.json_codec) 단위 테스트
+"""
+
+import json
+import math
+
+import pytest
+
+from app.core.responses import CodecJSONResponse
+from app.repositories.news_record import NewsRecord
+from app.utils.json_codec import OrjsonCodec, StdlibJsonCodec, get_codec, orjson
+
+CODECS = [StdlibJsonCodec()]
+if orjson is not None:
+    CODECS.append(OrjsonCodec())
+
+ITEM = {"guid": "g1", "source": "한국경제", "tags": ["AI"], "score": 1.5, "n": None}
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+class TestJsonCodec:
+    """코덱별 공통 동작 테스트"""
+
+    def test_round_trip(self, codec):
+        data = codec.dumps(ITEM)
+        assert isinstance(data, bytes)
+        assert codec.loads(data) == ITEM
+        assert codec.loads(data.decode("utf-8")) == ITEM
+
+    def test_compact_non_ascii(self, codec):
+        """공백 없는 형식, 비ASCII 문자 유지"""
+        assert codec.dumps({"a": [1, "한"]}) == '{"a":[1,"한"]}'.encode("utf-8")
+
+    def test_stdlib_compatible_parsing(self, codec):
+        """표준 json이 허용하는 입력은 같은 결과로 파싱"""
+        assert math.isnan(codec.loads(b'{"x": NaN}')["x"])
+        assert codec.loads('{"x": "\\ud800"}')["x"] == "\ud800"
+
+    def test_invalid_json_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b'{"x": ')
+
+    def test_dumps_news_record(self, codec):
+        """NewsRecord는 원래 dict로 직렬화"""
+        record = NewsRecord.from_dict(ITEM)
+        assert json.loads(codec.dumps([record])) == [ITEM]
+
+
+class TestCodecSelection:
+    """코덱 선택 테스트"""
+
+    def test_json_forced(self):
+        assert get_codec("json").name == "json"
+
+    def test_auto(self):
+        assert get_codec("auto").name == ("json" if orjson is None else "orjson")
+
+
+class TestCodecJSONResponse:
+    """응답 클래스 테스트"""
+
+    def test_render(self):
+        response = CodecJSONResponse({"data": [ITEM]})
+        assert json.loads(response.body) == {"data": [ITEM]}
+        assert response.media_type == "application/json"
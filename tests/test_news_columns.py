@@ -0,0 +1,120 @@
+"""
+뉴스 컬럼형 표현(NewsColumns) 단위 테스트
+"""
+
+import numpy as np
+import pytest
+
+from app.repositories.news_columns import MISSING_EPOCH, DictionaryColumn, NewsColumns
+
+
+@pytest.fixture
+def items():
+    return [
+        {"source": "A", "group": "g1", "title": "Alpha", "published": "Mon, 25 Aug 2025 06:00:00 GMT"},
+        {"source": "B", "group": "g2", "title": "Beta", "processed_at": "2025-08-26T11:47:10.173932"},
+        {"source": "A", "group": "g2", "title": "Gamma", "summary": "AI 뉴스"},
+        {"source": None, "title": "Delta", "published": "2025-08-27T00:00:00Z"},
+    ]
+
+
+class TestDictionaryColumn:
+    """사전 인코딩 컬럼 테스트"""
+
+    def test_encode(self):
+        column = DictionaryColumn.encode(["x", "y", "x", None])
+        assert column.codes.tolist() == [0, 1, 0, -1]
+        assert column.values == ["x", "y"]
+
+    def test_encode_with_base(self):
+        base = DictionaryColumn.encode(["x", "y"])
+        column = DictionaryColumn.encode(["y", "z"], base=base)
+        assert column.codes.tolist() == [0, 1, 1, 2]
+        assert column.values == ["x", "y", "z"]
+        # 기존 컬럼은 변경되지 않음
+        assert base.values == ["x", "y"]
+
+    def test_unknown_value_not_in_lookup(self):
+        column = DictionaryColumn.encode(["x"])
+        assert column.lookup.get("unknown") is None
+
+
+class TestNewsColumns:
+    """NewsColumns 테스트"""
+
+    def test_filter_ids(self, items):
+        columns = NewsColumns.build(items)
+        assert columns.filter_ids() is None
+        assert columns.filter_ids(source="A").tolist() == [0, 2]
+        assert columns.filter_ids(group="g2").tolist() == [1, 2]
+        assert columns.filter_ids(source="A", group="g2").tolist() == [2]
+        assert columns.filter_ids(source="unknown").tolist() == []
+
+    def test_match(self, items):
+        """주어진 레코드 번호에 대한 소스/그룹 조건 확인"""
+        columns = NewsColumns.build(items)
+        ids = np.array([0, 2, 3])
+        assert columns.match(ids) is None
+        assert columns.match(ids, source="A").tolist() == [True, True, False]
+        assert columns.match(ids, source="A", group="g1").tolist() == [True, False, False]
+        assert not columns.match(ids, group="unknown").any()
+
+    def test_facet_counts(self, items):
+        """값별 레코드 수와 최신 발행 시각"""
+        columns = NewsColumns.build(items)
+        sources = {value: (count, latest) for value, count, latest in columns.facet_counts("source")}
+        assert sources["A"] == (2, columns.epoch_us[0])
+        assert sources["B"] == (1, columns.epoch_us[1])
+        groups = {value: (count, latest) for value, count, latest in columns.facet_counts("group")}
+        # g2의 Gamma는 날짜가 없으므로 Beta의 시각이 최신
+        assert groups["g2"] == (2, columns.epoch_us[1])
+
+    def test_time_order(self, items):
+        """최신순 순열, 날짜 없는 항목은 맨 뒤"""
+        columns = NewsColumns.build(items)
+        assert columns.epoch_us[2] == MISSING_EPOCH
+        assert columns.time_order.tolist() == [3, 1, 0, 2]
+
+    def test_contains_uses_lowercased_text(self, items):
+        columns = NewsColumns.build(items)
+        assert columns.contains(range(4), "ai 뉴", items) == [2]
+        assert columns.contains(range(4), "alpha", items) == [0]
+
+    def test_contains_reads_body_from_record(self, items):
+        """본문은 컬럼에 복사하지 않고 레코드에서 읽어 확인"""
+        items[1]["article_text"] = "Body About Chips"
+        columns = NewsColumns.build(items)
+        assert all("chips" not in text for text in columns.lead_text)
+        assert columns.contains(range(4), "about chips", items) == [1]
+        assert columns.contains(range(4), "beta", items) == [1]
+
+    def test_contains_does_not_cross_field_boundary(self, items):
+        """제목 끝과 요약 시작을 이어 붙인 검색어는 일치하지 않음"""
+        columns = NewsColumns.build(items)
+        assert columns.contains(range(4), "gammaai", items) == []
+
+    def test_extend_matches_full_build(self, items):
+        """앞부분 컬럼에 이어 붙인 결과가 전체 구축 결과와 동일"""
+        full = NewsColumns.build(items)
+        extended = NewsColumns.build(items[2:], base=NewsColumns.build(items[:2]))
+        assert extended.source.codes.tolist() == full.source.codes.tolist()
+        assert extended.group.codes.tolist() == full.group.codes.tolist()
+        assert extended.epoch_us.tolist() == full.epoch_us.tolist()
+        assert extended.time_order.tolist() == full.time_order.tolist()
+        assert extended.lead_text == full.lead_text
+        for field in ("source_facet", "group_facet"):
+            assert getattr(extended, field).order.tolist() == getattr(full, field).order.tolist()
+            assert getattr(extended, field).starts.tolist() == getattr(full, field).starts.tolist()
+        assert extended.facet_counts("source") == full.facet_counts("source")
+        assert extended.facet_counts("group") == full.facet_counts("group")
+
+    def test_extend_facets_with_new_values(self):
+        """기존 사전에 없던 값이 추가되어도 색인이 전체 구축과 동일"""
+        rows = [{"source": s, "group": g} for s, g in
+                [("A", "x"), ("B", None), ("A", "y"), ("C", "x"), ("B", "z"), (None, "y"), ("C", "x")]]
+        full = NewsColumns.build(rows)
+        extended = NewsColumns.build(rows[3:], base=NewsColumns.build(rows[:3]))
+        for value in ("A", "B", "C"):
+            assert extended.filter_ids(source=value).tolist() == full.filter_ids(source=value).tolist()
+        for value in ("x", "y", "z"):
+            assert extended.filter_ids(group=value).tolist() == full.filter_ids(group=value).tolist()
@@ -0,0 +1,157 @@
+"""
+키셋(cursor) 페이지네이션 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.schemas.news import NewsQuery
+from app.services.news_cursor import NewsCursor, decode_cursor, encode_cursor
+
+from .conftest import write_jsonl
+
+
+def _entries(prefix, n, day=1, undated=True):
+    # 두 항목씩 같은 발행 시각(동점)이 되도록 생성, undated이면 발행 시각 없는 항목 추가
+    entries = [
+        {
+            "guid": f"{prefix}{i}",
+            "source": "Alpha" if i % 3 else "Beta",
+            "title": f"{prefix} story {i}",
+            "link": f"https://example.com/{prefix}/{i}",
+            "published": f"2025-01-{day:02d}T00:{i // 2:02d}:00Z",
+        }
+        for i in range(n)
+    ]
+    if undated:
+        entries.append({
+            "guid": f"{prefix}-undated",
+            "source": "Alpha",
+            "title": f"{prefix} story undated",
+            "link": f"https://example.com/{prefix}/undated",
+        })
+    return entries
+
+
+@pytest.fixture
+def news_file(tmp_path):
+    path = tmp_path / "news.jsonl"
+    write_jsonl(path, _entries("a", 25))
+    return path
+
+
+def _page(service, **params):
+    query = NewsQuery(sort="time", **params)
+    snapshot, page_ids, total = asyncio.run(service.search_news_page(query))
+    guids = [item["guid"] for item in snapshot.get_items(page_ids.tolist())]
+    return guids, total, service.next_cursor(snapshot, query, page_ids)
+
+
+def _walk(service, limit, **params):
+    guids, cursor = [], None
+    while True:
+        page, _, cursor = _page(service, limit=limit, cursor=cursor, **params)
+        guids += page
+        if cursor is None:
+            return guids
+
+
+class TestNewsCursor:
+    """커서 인코딩 테스트"""
+
+    def test_round_trip(self):
+        """인코딩한 커서는 그대로 디코딩"""
+        cursor = NewsCursor(1_735_689_600_000_000, 42, "기사-1")
+        assert decode_cursor(encode_cursor(cursor)) == cursor
+
+    @pytest.mark.parametrize("value", ["", "not base64!", encode_cursor(NewsCursor(1, -1, "x")), "WzEsMl0"])
+    def test_invalid_cursor(self, value):
+        """형식이 맞지 않는 커서는 ValidationException"""
+        with pytest.raises(ValidationException):
+            decode_cursor(value)
+
+
+class TestCursorPagination:
+    """커서로 이어서 조회하는 테스트"""
+
+    @pytest.mark.parametrize("params", [{}, {"source": "Alpha"}, {"q": "story 1"}])
+    def test_walk_matches_time_order(self, news_file, params, news_service):
+        """커서로 끝까지 읽은 결과는 한 번에 조회한 최신순 결과와 같음 (동점/발행 시각 없음 포함)"""
+        service = news_service(news_file)
+        expected, total, _ = _page(service, limit=100, **params)
+        assert len(expected) == total
+        assert _walk(service, 4, **params) == expected
+
+    def test_stable_under_appends(self, news_file, news_service):
+        """페이지 사이에 새 뉴스가 추가되어도 이어지는 페이지는 중복/누락 없음"""
+        service = news_service(news_file)
+        expected, _, _ = _page(service, limit=100)
+        first, _, cursor = _page(service, limit=5)
+
+        # 이미 지나간 위치(더 최신)에 추가된 항목은 다음 페이지에 나오지 않음
+        write_jsonl(news_file, _entries("b", 4, day=2, undated=False), mode="a")
+        rest = _walk_from(service, cursor, 5)
+        assert first + rest == expected
+
+    def test_full_reload_finds_cursor_by_guid(self, news_file, news_service):
+        """전체 재로드로 레코드 번호가 바뀌면 guid로 커서 위치를 찾음"""
+        service = news_service(news_file)
+        first, _, cursor = _page(service, limit=5)
+
+        entries = _entries("a", 25)
+        write_jsonl(news_file, [{"guid": "z", "title": "older", "published": "2020-01-01T00:00:00Z"}] + entries)
+        expected, _, _ = _page(service, limit=100)
+        assert first + _walk_from(service, cursor, 5) == expected
+
+    def test_cursor_requires_time_sort(self, news_file, news_service):
+        """sort=time이 아니면 커서를 쓸 수 없고 다음 커서도 없음"""
+        service = news_service(news_file)
+        _, _, cursor = _page(service, limit=5)
+        with pytest.raises(ValidationException):
+            asyncio.run(service.search_news_page(NewsQuery(sort="fresh", cursor=cursor)))
+
+        query = NewsQuery(sort="fresh", limit=5)
+        snapshot, page_ids, _ = asyncio.run(service.search_news_page(query))
+        assert service.next_cursor(snapshot, query, page_ids) is None
+
+
+def _walk_from(service, cursor, limit):
+    guids = []
+    while cursor is not None:
+        page, _, cursor = _page(service, limit=limit, cursor=cursor)
+        guids += page
+    return guids
+
+
+class TestCursorEndpoints:
+    """엔드포인트 커서 응답 테스트"""
+
+    @pytest.fixture
+    def client(self, news_file, news_service):
+        from fastapi.testclient import TestClient
+
+        from app.api.deps import get_news_service
+        from app.main import app
+
+        service = news_service(news_file)
+        app.dependency_overrides[get_news_service] = lambda: service
+        yield TestClient(app)
+        app.dependency_overrides.pop(get_news_service, None)
+
+    def test_next_cursor_header_and_field(self, client):
+        """목록은 X-Next-Cursor 헤더, description은 next_cursor 필드로 다음 커서 반환"""
+        first = client.get("/api/v1/news/", params={"sort": "time", "limit": 3})
+        cursor = first.headers["x-next-cursor"]
+        second = client.get("/api/v1/news/", params={"sort": "time", "limit": 3, "cursor": cursor})
+        assert [item["title"] for item in second.json()] == ["a story 20", "a story 21", "a story 18"]
+
+        description = client.get("/api/v1/news/description", params={"sort": "time", "limit": 3}).json()
+        assert description["next_cursor"] == cursor
+        assert "x-next-cursor" not in client.get("/api/v1/news/", params={"limit": 3}).headers
+
+    def test_invalid_cursor_is_bad_request(self, client):
+        """잘못된 커서는 400"""
+        response = client.get("/api/v1/news/", params={"sort": "time", "cursor": "broken"})
+        assert response.status_code == 400
@@ -0,0 +1,95 @@
+"""
+mmap 기반 뉴스 데이터셋(MmapNewsRecords) 단위 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.news_store import NewsStore
+from app.repositories.news_dataset import MmapNewsRecords
+from app.repositories.news_repository import NewsRepository
+from app.schemas.news import NewsQuery
+from app.services.news_service import NewsService
+from app.utils.data_loader import JsonlTailReader
+
+
+@pytest.fixture
+def mmap_repo(test_jsonl_file):
+    """mmap 모드 파일 백엔드 Repository"""
+    repo = NewsRepository()
+    repo.backend = "FILE"
+    repo.file_mode = "mmap"
+    repo.news_file = test_jsonl_file
+    return repo
+
+
+class TestMmapNewsRecords:
+    """MmapNewsRecords 테스트"""
+
+    def test_lazy_decoding(self, test_jsonl_file, sample_news_entries):
+        """인덱싱 시점에 원본 레코드를 그대로 디코딩"""
+        reader = JsonlTailReader(test_jsonl_file)
+        records = MmapNewsRecords.from_lines(test_jsonl_file, reader.iter_new())
+
+        assert len(records) == len(sample_news_entries)
+        assert records.offsets.typecode == "Q"
+        assert records[1] == sample_news_entries[1]
+        assert records[-1] == sample_news_entries[-1]
+        assert list(records) == sample_news_entries
+        with pytest.raises(IndexError):
+            records[len(sample_news_entries)]
+
+    def test_light_columns(self, test_jsonl_file, sample_news_entries):
+        """필터/정렬용 경량 필드만 메모리에 보관"""
+        reader = JsonlTailReader(test_jsonl_file)
+        records = MmapNewsRecords.from_lines(test_jsonl_file, reader.iter_new())
+
+        assert records.columns["source"] == [e["source"] for e in sample_news_entries]
+        assert all(isinstance(ts, float) for ts in records.columns["epoch"])
+        assert "article_text" not in records.columns
+        assert records.date_stats["field:processed_at"] == len(sample_news_entries)
+
+
+class TestMmapBackend:
+    """mmap 모드 스토어/서비스 테스트"""
+
+    def test_search_matches_memory_mode(self, test_jsonl_file, news_service):
+        """mmap 모드 검색 결과가 메모리 모드와 동일"""
+        query = NewsQuery(q="test", sort="time")
+        mmap_result = asyncio.run(news_service(test_jsonl_file, file_mode="mmap").search_news(query))
+        memory_result = asyncio.run(news_service(test_jsonl_file).search_news(query))
+        assert mmap_result == memory_result
+
+    def test_append_extends_offsets(self, mmap_repo, test_jsonl_file, sample_news_entries):
+        """추가된 라인의 오프셋만 이어 붙임"""
+        store = NewsStore(mmap_repo)
+        first = asyncio.run(store.get_snapshot())
+
+        with test_jsonl_file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"guid": "appended", "source": "New"}) + "\n")
+        second = asyncio.run(store.get_snapshot())
+
+        assert len(second) == len(sample_news_entries) + 1
+        assert second.items[-1] == {"guid": "appended", "source": "New"}
+        assert second.columns.source.values[second.columns.source.codes[-1]] == "New"
+        # 이전 스냅샷은 그대로 유지
+        assert len(first) == len(sample_news_entries)
+        assert first.items[0] == sample_news_entries[0]
+
+    def test_search_indexes_off_by_default(self, mmap_repo, monkeypatch):
+        """mmap 모드는 설정하지 않으면 검색 색인을 만들지 않고, 명시하면 만듦"""
+        from app.core.config import settings
+
+        snapshot = asyncio.run(NewsStore(mmap_repo).get_snapshot())
+        assert snapshot.text_index is None and snapshot.trigram_index is None
+        items, total = asyncio.run(
+            NewsService(news_store=NewsStore(mmap_repo)).search_news(NewsQuery(q="test", sort="relevance"))
+        )
+        assert total == len(items) > 0
+
+        monkeypatch.setattr(settings, "news_text_index", True)
+        monkeypatch.setattr(settings, "news_trigram_index", True)
+        snapshot = asyncio.run(NewsStore(mmap_repo).get_snapshot(refresh=True))
+        assert snapshot.text_index is not None and snapshot.trigram_index is not None
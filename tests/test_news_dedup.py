@@ -0,0 +1,160 @@
+"""
+guid/link 중복 제거(news_dedup) 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.repositories.news_dedup import DedupIndex, dedup_keys, normalize_link
+from app.schemas.news import NewsQuery
+
+from .conftest import write_jsonl
+
+
+def _item(guid, link, title, source="Alpha", day=1):
+    return {
+        "guid": guid,
+        "link": link,
+        "title": title,
+        "source": source,
+        "published": f"2025-01-{day:02d}T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def dup_file(tmp_path):
+    """같은 기사가 guid/link로 반복되는 뉴스 파일"""
+    path = tmp_path / "news.jsonl"
+    write_jsonl(path, [
+        _item("g1", "https://example.com/a", "First draft", day=1),
+        _item("g2", "https://example.com/b", "Other story", source="Beta", day=2),
+        _item(" g1 ", "https://example.com/a-moved", "First updated", day=3),
+        _item("g3", "HTTPS://Example.com/b/?utm_source=rss#top", "Other repost", day=4),
+    ])
+    return path
+
+
+def _titles(service, **params):
+    items, total = asyncio.run(service.search_news(NewsQuery(sort="time", **params)))
+    return [item["title"] for item in items], total
+
+
+class TestDedupKeys:
+    """키 정규화 테스트"""
+
+    def test_normalize_link(self):
+        """스킴/호스트 대소문자, 끝 슬래시, 프래그먼트, 추적 파라미터 무시"""
+        assert normalize_link("HTTPS://Example.com/a/b/?utm_source=x&id=3#frag") == "https://example.com/a/b?id=3"
+        assert normalize_link("https://example.com/") == "https://example.com/"
+        assert normalize_link("  ") is None
+        assert normalize_link(None) is None
+
+    def test_keys(self):
+        """guid는 공백만 정리, 값이 없으면 0"""
+        assert dedup_keys({"guid": " x "}) == dedup_keys({"guid": "x"})
+        assert dedup_keys({}) == (0, 0)
+        # guid와 link는 서로 다른 키 공간
+        assert dedup_keys({"guid": "x"})[0] != dedup_keys({"link": "x"})[1]
+
+
+class TestDedupIndex:
+    """DedupIndex 테스트"""
+
+    def test_latest_version_wins(self):
+        """guid나 link가 같으면 이전 레코드를 숨김"""
+        keys = [(1, 10), (2, 20), (1, 30), (3, 20), (4, 0)]
+        index = DedupIndex.build(keys)
+        assert index.hidden.tolist() == [0, 1]
+        assert index.ids[1] == 2 and index.ids[20] == 3
+
+        unique, kept = index.compact(keys)
+        assert kept.tolist() == [2, 3, 4]
+        assert len(unique.hidden) == 0
+        assert unique.stats() == {"keys": 5, "duplicates": 2, "dropped": 2, "hidden": 0}
+
+    def test_extend(self):
+        """이어 붙인 레코드가 기존 레코드를 숨김"""
+        base = DedupIndex.build([(1, 0), (2, 0)])
+        extended = DedupIndex.build([(2, 0)], base=base)
+        assert extended.record_count == 3
+        assert extended.hidden.tolist() == [1]
+        # 기존 색인은 변경되지 않음
+        assert base.ids[2] == 1 and len(base.hidden) == 0
+        assert dict(base.ids) == {1: 0, 2: 1} and base.stats()["keys"] == 2
+
+    def test_extend_shares_key_table(self):
+        """가장 최근 버전에 이어 붙이면 키 표를 복사하지 않고, 이전 버전에서 갈라지면 복사"""
+        base = DedupIndex.build([(1, 0), (2, 0)])
+        extended = DedupIndex.build([(2, 0), (3, 0)], base=base)
+        assert extended._table is base._table
+        assert dict(extended.ids) == {1: 0, 2: 2, 3: 3}
+
+        branch = DedupIndex.build([(1, 0)], base=base)
+        assert branch._table is not base._table
+        assert dict(branch.ids) == {1: 2, 2: 1} and branch.hidden.tolist() == [0]
+        # 갈라진 버전은 다른 버전의 결과를 바꾸지 않음
+        assert dict(extended.ids) == {1: 0, 2: 2, 3: 3} and extended.hidden.tolist() == [1]
+        assert dict(base.ids) == {1: 0, 2: 1}
+
+
+class TestNewsDedup:
+    """스냅샷/검색 중복 제거 테스트"""
+
+    def test_full_load_keeps_latest(self, dup_file, news_service):
+        """전체 로드 시 이전 버전은 스냅샷에 넣지 않음"""
+        service = news_service(dup_file)
+        titles, total = _titles(service)
+        assert titles == ["Other repost", "First updated"]
+        assert total == 2
+
+        snapshot = service.news_store.snapshot
+        assert len(snapshot) == 2
+        health = asyncio.run(service.get_health_status())
+        assert health["count"] == 2
+        assert health["dedup"]["duplicates"] == 2
+
+    def test_append_hides_previous_version(self, dup_file, news_service):
+        """증분 추가된 새 버전이 기존 레코드를 숨김 (필터/검색/패싯 모두)"""
+        service = news_service(dup_file)
+        _titles(service)
+        write_jsonl(dup_file, [_item("g4", "https://example.com/b", "Third take", source="Gamma", day=5)], mode="a")
+
+        titles, total = _titles(service)
+        assert titles == ["Third take", "First updated"]
+        assert total == 2
+        assert _titles(service, source="Beta") == ([], 0)
+        assert _titles(service, q="repost") == ([], 0)
+        assert _titles(service, q="take") == (["Third take"], 1)
+
+        sources = asyncio.run(service.get_facets("source"))
+        assert {facet["name"]: facet["count"] for facet in sources} == {"Alpha": 1, "Gamma": 1}
+        health = asyncio.run(service.get_health_status())
+        assert health["count"] == 2
+        assert health["dedup"]["hidden"] == 1
+
+    def test_append_hides_in_relevance_search(self, dup_file, news_service):
+        """관련도 정렬 결과에서도 숨긴 레코드 제외"""
+        service = news_service(dup_file)
+        _titles(service)
+        write_jsonl(dup_file, [_item("g1", "https://example.com/z", "Final story", day=6)], mode="a")
+
+        items, total = asyncio.run(service.search_news(NewsQuery(q="first", sort="relevance")))
+        assert total == 0 and items == []
+
+    def test_mmap_mode_hides_instead_of_dropping(self, dup_file, monkeypatch, news_service):
+        """mmap 모드는 레코드를 빼지 않고 숨김"""
+        monkeypatch.setattr(settings, "news_file_mode", "mmap")
+        service = news_service(dup_file)
+        titles, total = _titles(service)
+        assert titles == ["Other repost", "First updated"]
+        assert len(service.news_store.snapshot) == 4
+        assert asyncio.run(service.get_health_status())["dedup"]["hidden"] == 2
+
+    def test_disabled(self, dup_file, monkeypatch, news_service):
+        """news_dedup=False이면 모든 레코드 노출"""
+        monkeypatch.setattr(settings, "news_dedup", False)
+        service = news_service(dup_file)
+        assert _titles(service)[1] == 4
+        assert asyncio.run(service.get_health_status())["dedup"] is None
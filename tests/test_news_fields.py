@@ -0,0 +1,143 @@
+"""
+sparse fieldset(fields=) 응답 테스트
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_news_service
+from app.core.config import settings
+from app.main import app
+from app.repositories.news_repository import NewsRepository
+
+from .conftest import write_jsonl
+
+
+@pytest.fixture(params=["memory", "mmap"])
+def client(request, tmp_path, monkeypatch, news_service):
+    """임시 뉴스 파일(memory/mmap 모드)을 바라보는 테스트 클라이언트"""
+    monkeypatch.setattr(settings, "news_file_mode", request.param)
+    news_file = tmp_path / "news.jsonl"
+    write_jsonl(news_file, [
+        {
+            "guid": f"g{i}",
+            "source": "Alpha",
+            "title": f"뉴스 {i}",
+            "link": f"https://example.com/{i}",
+            "article_text": "본문 " * 100,
+            "tags": ["ai"],
+            "processed_at": f"2025-01-0{i + 1}T00:00:00Z",
+        }
+        for i in range(5)
+    ])
+    service = news_service(news_file)
+    app.dependency_overrides[get_news_service] = lambda: service
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_news_service, None)
+
+
+class TestSparseFields:
+    """fields= 파라미터 테스트"""
+
+    def test_news_list_fields(self, client):
+        """목록은 요청한 필드만 (published는 processed_at으로 대체되는 규칙 유지)"""
+        full = client.get("/api/v1/news/", params={"sort": "time", "limit": 2}).json()
+        sparse = client.get("/api/v1/news/", params={"sort": "time", "limit": 2, "fields": "title, published"}).json()
+        assert sparse == [{"title": item["title"], "published": item["published"]} for item in full]
+
+    def test_description_fields(self, client):
+        """description은 data 항목에 요청한 필드만, 본문 제외"""
+        params = {"sort": "time", "limit": 3, "fields": "guid,title,tags"}
+        body = client.get("/api/v1/news/description", params=params).json()
+        assert body["count"] == 3 and body["total"] == 5
+        assert body["data"][0] == {"guid": "g4", "title": "뉴스 4", "tags": ["ai"]}
+
+        streamed = client.get("/api/v1/news/description", params={**params, "stream": "true"})
+        assert [json.loads(line) for line in streamed.text.splitlines()] == body["data"]
+
+    def test_unknown_field_is_bad_request(self, client):
+        """모델에 없는 필드는 400"""
+        response = client.get("/api/v1/news/", params={"fields": "title,article_text"})
+        assert response.status_code == 400
+        assert "article_text" in response.json()["detail"]
+
+
+class TestMongoProjection:
+    """MONGO 백엔드 projection 테스트"""
+
+    def test_find_many_passes_projection(self):
+        """fields가 있으면 find에 projection 전달"""
+        import asyncio
+
+        calls = []
+
+        class FakeCursor(list):
+            def skip(self, n):
+                return self
+
+            def limit(self, n):
+                return self
+
+        class FakeCollection:
+            def find(self, query, projection=None):
+                calls.append(projection)
+                return FakeCursor([{"title": "t"}])
+
+        repo = NewsRepository()
+        repo.backend = "MONGO"
+        repo.mongo_collection = FakeCollection()
+        assert asyncio.run(repo.find_many(fields=("title", "link"))) == [{"title": "t"}]
+        assert asyncio.run(repo.find_many()) == [{"title": "t"}]
+        assert calls == [{"title": 1, "link": 1, "_id": 0}, None]
+
+
+@pytest.fixture
+def odd_client(tmp_path, news_service):
+    """정규화/형 변환이 필요한 값을 가진 뉴스 파일의 테스트 클라이언트"""
+    news_file = tmp_path / "news.jsonl"
+    write_jsonl(news_file, [{
+        "guid": "g1",
+        "source": "Alpha",
+        "title": "대문자 링크",
+        "link": "HTTPS://Example.COM",
+        "readability_score": 8,
+        "text_length": "12",
+        "published": "2025-01-02T00:00:00Z",
+    }])
+    service = news_service(news_file)
+    app.dependency_overrides[get_news_service] = lambda: service
+    yield TestClient(app), news_file
+    app.dependency_overrides.pop(get_news_service, None)
+
+
+class TestSparseValues:
+    """sparse 응답 값이 전체 응답의 같은 키와 같은지"""
+
+    def test_news_list_values(self, odd_client):
+        client, _ = odd_client
+        full = client.get("/api/v1/news/").json()
+        fields = "link,title,published"
+        sparse = client.get("/api/v1/news/", params={"fields": fields}).json()
+        assert full[0]["link"] == "https://example.com/"
+        assert sparse == [{key: row[key] for key in fields.split(",")} for row in full]
+
+    def test_description_values(self, odd_client):
+        client, _ = odd_client
+        fields = "link,readability_score,text_length,tags"
+        full = client.get("/api/v1/news/description").json()["data"]
+        sparse = client.get("/api/v1/news/description", params={"fields": fields}).json()["data"]
+        assert sparse == [{key: row[key] for key in fields.split(",")} for row in full]
+        assert isinstance(sparse[0]["readability_score"], float) and sparse[0]["text_length"] == 12
+        streamed = client.get("/api/v1/news/description", params={"fields": fields, "stream": "true"})
+        assert [json.loads(line) for line in streamed.text.splitlines()] == sparse
+
+    def test_invalid_link_fails_like_full_response(self, odd_client):
+        """전체 응답이 검증 오류(500)인 값은 sparse 응답에서도 오류"""
+        client, news_file = odd_client
+        with news_file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"guid": "g2", "title": "링크 아님", "link": "not a url"}) + "\n")
+        assert client.get("/api/v1/news/", params={"refresh": "true"}).status_code == 500
+        assert client.get("/api/v1/news/", params={"fields": "link,title"}).status_code == 500
+        assert client.get("/api/v1/news/", params={"fields": "title"}).status_code == 200
@@ -0,0 +1,151 @@
+"""
+디렉터리/글롭 뉴스 소스(NewsFileSet) 단위 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.repositories.news_dataset import ChainedMmapRecords
+from app.repositories.news_files import is_multi_file
+from app.schemas.news import NewsQuery
+
+from .conftest import write_jsonl
+
+
+def _entries(prefix, n):
+    return [
+        {
+            "guid": f"{prefix}-{i}",
+            "source": f"Source {i % 2}",
+            "title": f"{prefix} title {i}",
+            "published": f"2025-01-{i + 1:02d}T00:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def news_dir(tmp_path):
+    """실행별 파일 두 개가 있는 뉴스 디렉터리"""
+    directory = tmp_path / "news"
+    directory.mkdir()
+    write_jsonl(directory / "run_20250101.jsonl", _entries("a", 3))
+    write_jsonl(directory / "run_20250102.jsonl", _entries("b", 2))
+    (directory / "notes.txt").write_text("not news")
+    return directory
+
+
+def _guids(snapshot):
+    return [item["guid"] for item in snapshot.items]
+
+
+class TestNewsFileSet:
+    """여러 파일 소스 로드 테스트"""
+
+    def test_is_multi_file(self, news_dir):
+        """디렉터리와 글롭 패턴만 여러 파일 소스"""
+        assert is_multi_file(news_dir)
+        assert is_multi_file(news_dir / "run_*.jsonl")
+        assert not is_multi_file(news_dir / "run_20250101.jsonl")
+
+    def test_directory_merges_files_in_name_order(self, news_dir, news_service):
+        """디렉터리의 JSONL 파일을 이름순으로 이어 붙임"""
+        snapshot = asyncio.run(news_service(news_dir).news_store.get_snapshot())
+        assert _guids(snapshot) == ["a-0", "a-1", "a-2", "b-0", "b-1"]
+        counts = dict((name, count) for name, count, _ in snapshot.columns.facet_counts("source"))
+        assert counts == {"Source 0": 3, "Source 1": 2}
+
+    def test_glob_pattern(self, news_dir, news_service):
+        """글롭 패턴에 해당하는 파일만 사용"""
+        snapshot = asyncio.run(news_service(news_dir / "*0102.jsonl").news_store.get_snapshot())
+        assert _guids(snapshot) == ["b-0", "b-1"]
+
+    def test_new_file_extends_snapshot(self, news_dir, news_service):
+        """마지막 파일 뒤에 새 파일이 생기면 그 파일만 읽어 이어 붙임"""
+        store = news_service(news_dir).news_store
+        first = asyncio.run(store.get_snapshot())
+        write_jsonl(news_dir / "run_20250103.jsonl", _entries("c", 2))
+
+        second = asyncio.run(store.get_snapshot())
+        assert second.version == first.version + 1
+        assert _guids(second) == _guids(first) + ["c-0", "c-1"]
+        # 이어 붙인 경우 기존 컬럼 앞부분을 그대로 사용
+        assert second.columns.source.values[:2] == first.columns.source.values[:2]
+
+    def test_append_to_last_file(self, news_dir, news_service):
+        """마지막 파일에 추가된 라인만 읽음"""
+        store = news_service(news_dir).news_store
+        asyncio.run(store.get_snapshot())
+        write_jsonl(news_dir / "run_20250102.jsonl", _entries("b2", 1), mode="a")
+
+        snapshot = asyncio.run(store.get_snapshot())
+        assert _guids(snapshot)[-1] == "b2-0"
+        assert len(snapshot) == 6
+
+    def test_removed_file_rebuilds_without_rereading(self, news_dir, monkeypatch, news_service):
+        """파일이 삭제되면 남은 파일의 캐시된 레코드로 전체 스냅샷을 다시 만듦"""
+        store = news_service(news_dir).news_store
+        asyncio.run(store.get_snapshot())
+        reads = []
+        read_file = store.news_repo._read_file
+        monkeypatch.setattr(
+            store.news_repo._file_set, "_read",
+            lambda reader: reads.append(reader.file_path.name) or read_file(reader),
+        )
+        (news_dir / "run_20250101.jsonl").unlink()
+
+        snapshot = asyncio.run(store.get_snapshot())
+        assert _guids(snapshot) == ["b-0", "b-1"]
+        assert reads == []
+
+    def test_changed_middle_file_rereads_only_that_file(self, news_dir, monkeypatch, news_service):
+        """중간 파일이 바뀌면 그 파일만 다시 읽고 전체 스냅샷을 만듦"""
+        store = news_service(news_dir).news_store
+        asyncio.run(store.get_snapshot())
+        reads = []
+        read_file = store.news_repo._read_file
+        monkeypatch.setattr(
+            store.news_repo._file_set, "_read",
+            lambda reader: reads.append(reader.file_path.name) or read_file(reader),
+        )
+        write_jsonl(news_dir / "run_20250101.jsonl", _entries("a2", 1), mode="a")
+
+        snapshot = asyncio.run(store.get_snapshot())
+        assert _guids(snapshot) == ["a-0", "a-1", "a-2", "a2-0", "b-0", "b-1"]
+        assert reads == ["run_20250101.jsonl"]
+
+    def test_corrupt_file_keeps_snapshot(self, news_dir, news_service):
+        """파일 하나가 손상되면 그 파일을 빼고 줄인 스냅샷 대신 이전 스냅샷 유지"""
+        import gzip
+
+        packed = news_dir / "run_20250103.jsonl.gz"
+        lines = "".join(json.dumps(entry) + "\n" for entry in _entries("c", 5)).encode()
+        packed.write_bytes(gzip.compress(lines))
+        store = news_service(news_dir).news_store
+        first = asyncio.run(store.get_snapshot())
+        assert len(first) == 10
+
+        packed.write_bytes(gzip.compress(lines)[:-8] + bytes(8))  # CRC가 깨진 압축 파일
+        with pytest.raises(gzip.BadGzipFile):
+            asyncio.run(store.get_snapshot())
+        assert store.snapshot is first and store.snapshot.version == first.version
+
+        # 고쳐지면 모든 파일을 다시 읽어 전체 스냅샷 (중복 없이)
+        packed.write_bytes(gzip.compress(lines))
+        snapshot = asyncio.run(store.get_snapshot())
+        assert _guids(snapshot) == _guids(first)
+
+    def test_mmap_mode_across_files(self, news_dir, monkeypatch, news_service):
+        """mmap 모드는 파일별 mmap 시퀀스를 이어 붙여 지연 디코딩"""
+        monkeypatch.setattr(settings, "news_file_mode", "mmap")
+        service = news_service(news_dir)
+        snapshot = asyncio.run(service.news_store.get_snapshot())
+        assert isinstance(snapshot.items, ChainedMmapRecords)
+        assert _guids(snapshot) == ["a-0", "a-1", "a-2", "b-0", "b-1"]
+
+        write_jsonl(news_dir / "run_20250103.jsonl", _entries("c", 1))
+        items, total = asyncio.run(service.search_news(NewsQuery(q="c title", sort="time")))
+        assert total == 1 and items[0]["guid"] == "c-0"
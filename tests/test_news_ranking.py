@@ -0,0 +1,66 @@
+"""
+뉴스 랭킹(app.services.news_ranking) 단위 테스트
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.repositories.news_columns import NewsColumns
+from app.services.news_ranking import freshness_scores, rank_news
+
+NOW = datetime(2025, 9, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def columns():
+    """1시간 이내/동일 시각/날짜 없음이 섞인 컬럼"""
+    rng = random.Random(7)
+    items = []
+    for i in range(300):
+        roll = rng.random()
+        if roll < 0.1:
+            item = {}
+        elif roll < 0.3:
+            # 1시간 이내 (신선도 점수 1.0 동점) 또는 미래 시각
+            item = {"published": (NOW - timedelta(minutes=rng.randint(-30, 59))).isoformat()}
+        else:
+            item = {"published": (NOW - timedelta(hours=rng.randint(2, 50))).isoformat()}
+        items.append(item)
+    return NewsColumns.build(items)
+
+
+def _reference(columns, ids, sort, now_ts):
+    """전체 정렬 기준 결과 (기존 구현과 같은 안정 정렬)"""
+    ids = list(ids)
+    if sort == "time":
+        keys = (~columns.epoch_us[ids]).tolist()
+        return [ids[j] for j in sorted(range(len(ids)), key=keys.__getitem__)]
+    scores = freshness_scores(columns.epoch_us[ids], now_ts).tolist()
+    return [ids[j] for j in sorted(range(len(ids)), key=scores.__getitem__, reverse=True)]
+
+
+class TestRankNews:
+    """rank_news가 전체 정렬 결과의 앞부분과 일치하는지 확인"""
+
+    @pytest.mark.parametrize("sort", ["fresh", "time"])
+    @pytest.mark.parametrize("k", [1, 5, 20, 61, 300, 500])
+    def test_all_records(self, columns, sort, k):
+        now_ts = NOW.timestamp()
+        expected = _reference(columns, range(len(columns)), sort, now_ts)[:k]
+        assert rank_news(columns, None, sort, k, now_ts).tolist() == expected
+
+    @pytest.mark.parametrize("sort", ["fresh", "time"])
+    @pytest.mark.parametrize("k", [1, 7, 40, 200])
+    def test_filtered_records(self, columns, sort, k):
+        now_ts = NOW.timestamp()
+        ids = np.arange(0, len(columns), 3)
+        expected = _reference(columns, ids, sort, now_ts)[:k]
+        assert rank_news(columns, ids, sort, k, now_ts).tolist() == expected
+
+    def test_missing_dates_score_zero(self):
+        columns = NewsColumns.build([{}, {"published": NOW.isoformat()}])
+        scores = freshness_scores(columns.epoch_us, NOW.timestamp())
+        assert scores.tolist() == [0.0, 1.0]
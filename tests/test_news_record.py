@@ -0,0 +1,83 @@
+"""
+압축 뉴스 레코드(NewsRecord) 단위 테스트
+"""
+
+import pickle
+
+import pytest
+
+from app.repositories.news_record import NewsRecord, compact_records
+
+ITEM = {
+    "guid": "g1",
+    "source": "OpenAI",
+    "title": "Title",
+    "tags": ["AI", "LLM"],
+    "summary": None,
+    "article_text": "본문 " * 200,
+    "extra_field": {"nested": [1, 2]},
+}
+
+
+class TestNewsRecord:
+    """NewsRecord 테스트"""
+
+    def test_get_like_dict(self):
+        """dict와 같은 get 동작 (없는 키는 기본값, None 값은 None)"""
+        record = NewsRecord.from_dict(ITEM)
+        assert record.get("title") == "Title"
+        assert record.get("summary", "default") is None
+        assert record.get("link") is None
+        assert record.get("link", "") == ""
+        assert record.get("article_text") == ITEM["article_text"]
+        assert record["extra_field"] == {"nested": [1, 2]}
+        assert "link" not in record
+        assert "extra_field" in record
+        with pytest.raises(KeyError):
+            record["link"]
+
+    def test_round_trip(self):
+        """to_dict/비교/pickle 시 원래 레코드와 동일"""
+        record = NewsRecord.from_dict(ITEM)
+        assert record.to_dict() == ITEM
+        assert record == ITEM
+        assert dict(record).keys() == ITEM.keys()
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_interning_and_shared_tuples(self):
+        """범주형 문자열과 같은 태그 목록은 객체를 공유"""
+        first, second = compact_records([
+            {"source": "".join(["Open", "AI"]), "tags": ["AI", "LLM"]},
+            {"source": "".join(["Op", "enAI"]), "tags": ["AI", "LLM"]},
+        ])
+        assert first.get("source") is second.get("source")
+        assert first.get("tags") is second.get("tags")
+        assert first.get("tags") == ("AI", "LLM")
+
+    def test_tuple_pool_scoped_to_call(self):
+        """목록 튜플 공유는 compact_records 호출 안에서만 (전역 풀에 남기지 않음)"""
+        first, = compact_records([{"tags": ["AI", "LLM"]}])
+        second, = compact_records([{"tags": ["AI", "LLM"]}])
+        assert first.get("tags") == second.get("tags")
+        assert first.get("tags") is not second.get("tags")
+
+    def test_read_only(self):
+        record = NewsRecord.from_dict(ITEM)
+        with pytest.raises(AttributeError):
+            record.title = "changed"
+
+    def test_compact_records_skips_non_dict(self):
+        assert len(compact_records([ITEM, [1, 2], "text"])) == 1
+
+    def test_project_skips_heavy_decode(self, monkeypatch):
+        """슬롯 필드만 요청하면 본문 등 나머지 필드를 디코딩하지 않음"""
+        from app.repositories import news_record
+
+        record = NewsRecord.from_dict(ITEM)
+        assert record.project(("title", "tags", "article_text"))["tags"] == ["AI", "LLM"]
+
+        def fail(data):
+            raise AssertionError("heavy 필드 디코딩")
+
+        monkeypatch.setattr(news_record, "_decode_heavy", fail)
+        assert record.project(("guid", "title", "link", "summary")) == {"guid": "g1", "title": "Title", "summary": None}
@@ -0,0 +1,146 @@
+"""
+시간 세그먼트(최신 세그먼트부터 검색) 단위 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.repositories.news_columns import NewsColumns, segment_bounds
+from app.schemas.news import NewsQuery
+from app.services.news_cursor import decode_cursor
+from app.services.news_ranking import rank_news, rank_segments
+
+from .conftest import write_jsonl
+
+HOUR_US = 3600 * 1_000_000
+
+
+@pytest.fixture
+def news_file(tmp_path):
+    """10일 동안 하루 3건씩, 매일 한 건만 'robot'이 들어간 뉴스 파일"""
+    now = datetime.now(timezone.utc)
+    path = tmp_path / "news.jsonl"
+    write_jsonl(path, [
+        {
+            "guid": f"g{day}-{n}",
+            "source": "Alpha" if n else "Beta",
+            "title": f"robot day {day}" if n == 0 else f"market day {day} #{n}",
+            "link": f"https://example.com/{day}/{n}",
+            "published": (now - timedelta(days=day, minutes=10 * n)).isoformat(),
+        }
+        for day in range(10)
+        for n in range(3)
+    ])
+    return path
+
+
+def _page(service, count_total, **params):
+    _, ids, total = asyncio.run(service.search_news_page(NewsQuery(**params), count_total=count_total))
+    return ids.tolist(), total
+
+
+class TestSegmentBounds:
+    """세그먼트 경계 테스트"""
+
+    def test_bounds(self):
+        """같은 구간의 발행 시각은 한 세그먼트, 발행 시각이 없는 레코드는 마지막 세그먼트"""
+        epoch_us = np.array([5 * HOUR_US, 30 * HOUR_US, 1 * HOUR_US, np.iinfo(np.int64).min, 29 * HOUR_US])
+        base = NewsColumns.build([{}] * 5)
+        columns = NewsColumns(base.source, base.group, epoch_us, None, segment_us=24 * HOUR_US)
+        assert columns.time_order.tolist() == [1, 4, 0, 2, 3]
+        assert columns.time_segments.tolist() == [0, 2, 4, 5]
+        assert segment_bounds(columns.time_keys[:0], 24 * HOUR_US).tolist() == [0, 0]
+
+
+class TestRankSegments:
+    """rank_segments 테스트"""
+
+    def _columns(self, n_days=5, per_day=4):
+        epoch_us = np.array([
+            (n_days - day) * 24 * HOUR_US + i * HOUR_US for day in range(n_days) for i in range(per_day)
+        ], dtype=np.int64)
+        base = NewsColumns.build([{}] * len(epoch_us))
+        return NewsColumns(base.source, base.group, epoch_us, None, segment_us=24 * HOUR_US)
+
+    @pytest.mark.parametrize("sort", ["time", "fresh"])
+    def test_same_as_full_ranking(self, sort):
+        """세그먼트를 나눠 확인해도 전체 순위와 같은 결과"""
+        columns = self._columns()
+        now_ts = 6 * 24 * 3600.0
+        odd = lambda window: window[window % 2 == 1]
+        for k in (1, 3, 7, 20):
+            expected = rank_news(columns, np.arange(1, len(columns), 2), sort, k, now_ts)
+            assert rank_segments(columns, sort, k, now_ts, odd).tolist() == expected.tolist()
+
+    def test_stops_when_page_is_full(self):
+        """k개가 모이면 오래된 세그먼트는 확인하지 않음"""
+        columns = self._columns()
+        seen = []
+        ranked = rank_segments(columns, "time", 5, 0.0, lambda window: seen.append(len(window)) or window)
+        assert len(ranked) == 5
+        assert seen == [4, 4]
+
+    def test_fresh_scans_tied_head(self):
+        """신선도 정렬은 1시간 이내(동점) 구간을 끝까지 확인"""
+        columns = self._columns()
+        # 모든 레코드가 미래 시각 → 신선도 동점, 레코드 순서
+        seen = []
+        ranked = rank_segments(columns, "fresh", 2, 0.0, lambda window: seen.append(len(window)) or window)
+        assert ranked.tolist() == [0, 1]
+        assert sum(seen) == len(columns)
+
+        # 기준 시각이 첫 세그먼트 안이면 그 세그먼트의 동점 구간만 레코드 순서로
+        now_ts = (5 * 24 + 2.5) * 3600.0
+        assert rank_segments(columns, "fresh", 2, now_ts, lambda window: window).tolist() == [2, 3]
+
+
+class TestSegmentedSearch:
+    """count_total=False 검색어 조회 테스트"""
+
+    @pytest.mark.parametrize("mode", ["memory", "mmap"])
+    @pytest.mark.parametrize("sort", ["time", "fresh"])
+    def test_same_page_without_total(self, news_file, monkeypatch, mode, sort, news_service):
+        """전체 개수 없이 조회해도 같은 페이지"""
+        monkeypatch.setattr(settings, "news_file_mode", mode)
+        monkeypatch.setattr(settings, "news_query_cache_entries", 0)
+        service = news_service(news_file)
+        for params in ({"q": "robot"}, {"q": "day", "offset": 4}, {"q": "market", "source": "Alpha"}, {"q": "zzz"}):
+            full, total = _page(service, True, sort=sort, limit=3, **params)
+            partial, none = _page(service, False, sort=sort, limit=3, **params)
+            assert partial == full
+            assert none is None and total is not None
+
+    def test_only_recent_segments_are_checked(self, news_file, monkeypatch, news_service):
+        """페이지가 차면 오래된 세그먼트 레코드는 검사하지 않음"""
+        monkeypatch.setattr(settings, "news_trigram_index", False)
+        service = news_service(news_file)
+        checked = []
+        contains = NewsColumns.contains
+        monkeypatch.setattr(
+            NewsColumns, "contains",
+            lambda self, ids, term, items: checked.extend(ids) or contains(self, ids, term, items),
+        )
+        ids, total = _page(service, False, q="robot", sort="time", limit=2)
+        assert len(ids) == 2 and total is None
+        assert len(checked) < 30
+
+    def test_cursor(self, news_file, news_service):
+        """커서 다음 페이지도 세그먼트 조회와 전체 조회가 같음"""
+        service = news_service(news_file)
+        snapshot, first, _ = asyncio.run(service.search_news_page(NewsQuery(q="day", sort="time", limit=4)))
+        cursor = service.next_cursor(snapshot, NewsQuery(q="day", sort="time", limit=4), first)
+        query = NewsQuery(q="day", sort="time", limit=4, cursor=cursor)
+        full = service._search_ids(snapshot, query, decode_cursor(cursor))[0]
+        partial = service._search_ids(snapshot, query, decode_cursor(cursor), count_total=False)[0]
+        assert partial.tolist() == full.tolist()
+        assert not set(partial.tolist()) & set(first.tolist())
+
+    def test_total_recomputed_after_partial_cache(self, news_file, news_service):
+        """개수 없이 캐시된 결과는 개수가 필요한 요청에서 다시 계산"""
+        service = news_service(news_file)
+        assert _page(service, False, q="robot", sort="time", limit=2)[1] is None
+        assert _page(service, True, q="robot", sort="time", limit=2)[1] == 10
@@ -0,0 +1,426 @@
+"""
+뉴스 스토어(NewsStore) 단위 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.news_service import NewsService
+
+from .conftest import write_jsonl
+
+
+class TestNewsStore:
+    """NewsStore 테스트"""
+
+    def test_initial_load(self, file_store, sample_news_entries):
+        """최초 조회 시 스냅샷 로드"""
+        store, _ = file_store
+        snapshot = asyncio.run(store.get_snapshot())
+        assert snapshot.version == 1
+        assert len(snapshot) == len(sample_news_entries)
+
+    def test_unchanged_file_reuses_snapshot(self, file_store):
+        """파일이 바뀌지 않으면 같은 스냅샷 재사용"""
+        store, _ = file_store
+        first = asyncio.run(store.get_snapshot())
+        second = asyncio.run(store.get_snapshot())
+        assert first is second
+
+    def test_changed_file_bumps_version(self, file_store, sample_news_entries):
+        """파일이 바뀌면 버전이 증가한 새 스냅샷으로 교체"""
+        store, news_file = file_store
+        first = asyncio.run(store.get_snapshot())
+
+        write_jsonl(news_file, sample_news_entries[:1], mode="a")
+
+        second = asyncio.run(store.get_snapshot())
+        assert second.version == first.version + 1
+        assert len(second) == len(first) + 1
+        # 이전 스냅샷은 변경되지 않음
+        assert len(first) == len(sample_news_entries)
+
+    def test_refresh_keeps_unchanged_snapshot(self, file_store, monkeypatch):
+        """refresh=True여도 원본이 그대로면 다시 읽거나 사이드카를 쓰지 않음"""
+        store, _ = file_store
+        first = asyncio.run(store.get_snapshot())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("변경 없는 새로고침에서 호출되면 안 됨")
+
+        monkeypatch.setattr(store.news_repo, "load_all", fail)
+        monkeypatch.setattr(store.news_repo, "get_updates", fail)
+        monkeypatch.setattr(store, "_save_sidecar", fail)
+        assert asyncio.run(store.get_snapshot(refresh=True)) is first
+
+    def test_refresh_loads_changes_incrementally(self, file_store, sample_news_entries):
+        """refresh=True는 추가된 라인만 읽어 붙임"""
+        store, news_file = file_store
+        first = asyncio.run(store.get_snapshot())
+        write_jsonl(news_file, [dict(sample_news_entries[0], guid="refreshed")], mode="a")
+
+        second = asyncio.run(store.get_snapshot(refresh=True))
+        assert second.version == first.version + 1
+        assert len(second) == len(first) + 1
+        assert second.items[len(first)]["guid"] == "refreshed"
+
+    def test_services_share_store(self, file_store):
+        """같은 스토어를 쓰는 서비스는 스냅샷을 공유"""
+        store, _ = file_store
+        service_a = NewsService(news_store=store)
+        service_b = NewsService(news_store=store)
+
+        data_a = asyncio.run(service_a.get_news_data())
+        data_b = asyncio.run(service_b.get_news_data())
+        assert data_a is data_b
+        assert store.snapshot.version == 1
+
+
+class TestIncrementalReload:
+    """append-only 파일 증분 재로드 테스트"""
+
+    def test_append_extends_snapshot(self, file_store, sample_news_entries):
+        """추가된 라인만 읽어 기존 스냅샷 뒤에 붙임"""
+        store, news_file = file_store
+        first = asyncio.run(store.get_snapshot())
+
+        write_jsonl(news_file, [{"guid": "appended"}], mode="a")
+        second = asyncio.run(store.get_snapshot())
+
+        assert second.version == first.version + 1
+        assert second.items[:len(first)] == first.items
+        assert second.items[-1] == {"guid": "appended"}
+        # 기존 레코드 객체를 그대로 재사용 (다시 파싱하지 않음)
+        assert second.items[0] is first.items[0]
+
+    def test_truncate_replaces_snapshot(self, file_store):
+        """파일이 잘리면 전체를 다시 읽어 교체"""
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+
+        news_file.write_text('{"guid": "fresh"}\n', encoding="utf-8")
+        snapshot = asyncio.run(store.get_snapshot())
+        assert snapshot.items == ({"guid": "fresh"},)
+
+
+class TestCompressedSource:
+    """압축 JSONL 파일을 바라보는 스토어 테스트"""
+
+    def test_gzip_file_in_mmap_mode(self, file_store, sample_news_entries, monkeypatch, news_service):
+        """gzip 파일은 mmap 모드 설정이어도 메모리 모드로 로드"""
+        import gzip
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_file_mode", "mmap")
+        _, news_file = file_store
+        packed = news_file.with_name("news.jsonl.gz")
+        packed.write_bytes(gzip.compress(news_file.read_bytes()))
+
+        snapshot = asyncio.run(news_service(packed).news_store.get_snapshot())
+        assert len(snapshot) == len(sample_news_entries)
+        assert snapshot.items[0]["guid"] == sample_news_entries[0]["guid"]
+
+
+class TestNewsFacets:
+    """소스/그룹 목록 테스트"""
+
+    def test_source_facets(self, file_store):
+        """소스별 뉴스 수와 최신 발행 시각"""
+        store, _ = file_store
+        service = NewsService(news_store=store)
+        facets = asyncio.run(service.get_facets("source"))
+        assert [facet["name"] for facet in facets] == ["AI Research", "Test Source 1"]
+        assert facets[0]["count"] == 1
+        assert facets[0]["latest"] == "2024-01-02T09:45:00+00:00"
+        assert asyncio.run(service.get_sources()) == ["AI Research", "Test Source 1"]
+
+
+class TestBackgroundRefresh:
+    """백그라운드 갱신(stale-while-revalidate) 테스트"""
+
+    @staticmethod
+    async def _wait_for(predicate, timeout=2.0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            assert asyncio.get_running_loop().time() < deadline, "조건 대기 시간 초과"
+            await asyncio.sleep(0.01)
+
+    def test_requests_do_not_wait_for_reload(self, file_store, monkeypatch):
+        """재로드가 진행 중이어도 요청은 이전 스냅샷을 바로 받음"""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 0.01)
+        store, news_file = file_store
+        release = asyncio.Event()
+        get_updates = store.news_repo.get_updates
+
+        async def slow_updates():
+            await release.wait()
+            return await get_updates()
+
+        monkeypatch.setattr(store.news_repo, "get_updates", slow_updates)
+
+        async def scenario():
+            await store.start()
+            first = store.snapshot
+            write_jsonl(news_file, [{"guid": "appended"}], mode="a")
+            await self._wait_for(store._lock.locked)
+
+            # 갱신 태스크가 락을 잡고 있는 동안에도 즉시 반환
+            snapshot = await asyncio.wait_for(store.get_snapshot(), timeout=0.1)
+            assert snapshot is first
+            release.set()
+            await self._wait_for(lambda: store.snapshot is not first)
+            assert store.snapshot.items[-1] == {"guid": "appended"}
+            await store.close()
+
+        asyncio.run(scenario())
+
+    def test_failed_reload_keeps_snapshot_and_reports_staleness(self, file_store, monkeypatch):
+        """재로드가 실패하면 이전 스냅샷을 유지하고 허용 신선도를 넘으면 stale 표시"""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 0.01)
+        monkeypatch.setattr(settings, "news_max_staleness", 0.05)
+        store, news_file = file_store
+
+        async def broken_updates():
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(store.news_repo, "get_updates", broken_updates)
+
+        async def scenario():
+            await store.start()
+            first = store.snapshot
+            assert store.status()["stale"] is False
+            write_jsonl(news_file, [{"guid": "appended"}], mode="a")
+
+            await self._wait_for(lambda: store.status()["stale"])
+            assert await store.get_snapshot() is first
+            status = store.status()
+            assert status["background_refresh"] is True
+            assert status["last_error"] == "disk gone"
+            assert status["staleness_seconds"] > 0.05
+            await store.close()
+            assert not store.refreshing_in_background
+
+        asyncio.run(scenario())
+
+    def test_corrupt_file_keeps_snapshot_and_reports_error(
+        self, tmp_path, sample_news_entries, monkeypatch, news_service
+    ):
+        """원본 파일이 깨지면(잘린 gzip) 빈 스냅샷 대신 이전 스냅샷과 마지막 오류 유지"""
+        import gzip
+
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 0.01)
+        monkeypatch.setattr(settings, "news_max_staleness", 0.05)
+        news_file = tmp_path / "news.jsonl.gz"
+        lines = "".join(json.dumps(entry) + "\n" for entry in sample_news_entries * 50).encode()
+        news_file.write_bytes(gzip.compress(lines))
+        store = news_service(news_file).news_store
+
+        async def scenario():
+            await store.start()
+            first = store.snapshot
+            count = len(first)
+            # 다른 내용으로 교체된 뒤 압축 스트림 중간에서 잘린 파일
+            broken = gzip.compress(lines + b'{"guid": "new"}\n')
+            news_file.write_bytes(broken[:len(broken) // 2])
+
+            await self._wait_for(lambda: store.status()["last_error"] is not None)
+            assert store.snapshot is first
+            assert len(await store.get_snapshot()) == count
+            await self._wait_for(lambda: store.status()["stale"])
+            await store.close()
+
+        asyncio.run(scenario())
+
+    def test_start_survives_failed_initial_load(self, tmp_path, sample_news_entries, monkeypatch, news_service):
+        """시작 시 원본이 깨져 있어도 빈 데이터로 시작하고, 원본이 고쳐지면 로드"""
+        import gzip
+
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 0.01)
+        news_file = tmp_path / "news.jsonl.gz"
+        lines = "".join(json.dumps(entry) + "\n" for entry in sample_news_entries).encode()
+        news_file.write_bytes(gzip.compress(lines)[:20])
+        store = news_service(news_file).news_store
+
+        async def scenario():
+            await store.start()
+            assert store.refreshing_in_background
+            assert store.snapshot is None
+            status = store.status()
+            assert status["last_error"] is not None and status["stale"] is True
+            empty = await store.get_snapshot()
+            assert len(empty) == 0 and empty.version == 0
+
+            news_file.write_bytes(gzip.compress(lines))
+            await self._wait_for(lambda: store.snapshot is not None)
+            assert len(await store.get_snapshot()) == len(sample_news_entries)
+            assert store.status()["last_error"] is None
+            assert store.status()["stale"] is False
+            await store.close()
+
+        asyncio.run(scenario())
+
+    def test_start_survives_unreachable_mongo(self, monkeypatch):
+        """MONGO 컬렉션이 없어도 시작하고 오류를 보고"""
+        from app.core.config import settings
+        from app.core.news_store import NewsStore
+        from app.repositories.news_repository import NewsRepository
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 0.01)
+        repo = NewsRepository()
+        repo.backend = "MONGO"
+        repo.mongo_collection = None
+        store = NewsStore(repo)
+
+        async def scenario():
+            await store.start()
+            assert "MongoDB" in store.status()["last_error"]
+            assert len(await store.get_snapshot()) == 0
+            await store.close()
+
+        asyncio.run(scenario())
+
+    def test_refresh_request_is_handled_in_background(self, file_store, monkeypatch):
+        """refresh=True는 갱신 태스크에 즉시 확인을 요청하고 기다리지 않음"""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "news_refresh_interval", 60)
+        store, news_file = file_store
+
+        async def scenario():
+            await store.start()
+            first = store.snapshot
+            write_jsonl(news_file, [{"guid": "refreshed", "title": "t"}], mode="a")
+            assert await store.get_snapshot(refresh=True) is first
+            await self._wait_for(lambda: store.snapshot.version == first.version + 1)
+            assert len(store.snapshot) == len(first) + 1
+            await store.close()
+
+        asyncio.run(scenario())
+
+
+class TestNonBlockingReload:
+    """재로드 중 이벤트 루프 응답성 테스트"""
+
+    @staticmethod
+    async def _max_loop_lag(task, interval=0.005):
+        """task가 끝날 때까지 sleep(interval) 지연의 최댓값(초)"""
+        loop = asyncio.get_running_loop()
+        worst = 0.0
+        while not task.done():
+            started = loop.time()
+            await asyncio.sleep(interval)
+            worst = max(worst, loop.time() - started - interval)
+        await task
+        return worst
+
+    def test_event_loop_stays_responsive_during_reload(self, file_store, monkeypatch):
+        """파일 읽기/파싱이 오래 걸려도 이벤트 루프는 멈추지 않음"""
+        import time
+
+        store, _ = file_store
+        repo = store.news_repo
+        read_file = repo._read_file
+
+        def slow_read(reader):
+            time.sleep(0.3)  # 느린 디스크/대용량 파싱 흉내 (동기 블로킹)
+            return read_file(reader)
+
+        monkeypatch.setattr(repo, "_read_file", slow_read)
+
+        async def scenario():
+            task = asyncio.create_task(store.get_snapshot(refresh=True))
+            lag = await self._max_loop_lag(task)
+            assert task.result().version == 1
+            return lag
+
+        assert asyncio.run(scenario()) < 0.1
+
+    def test_mongo_collection_is_compared_with_none(self, monkeypatch):
+        """pymongo Collection은 bool() 평가 시 예외이므로 None 비교로 확인"""
+        from app.repositories.news_repository import NewsRepository
+
+        class FakeCollection:
+            def __bool__(self):
+                raise NotImplementedError("Collection objects do not implement truth value testing")
+
+            def find(self, query):
+                return iter([{"_id": "1", "title": "from mongo"}])
+
+        repo = NewsRepository()
+        repo.backend = "MONGO"
+        repo.mongo_collection = FakeCollection()
+        assert asyncio.run(repo.get_all()) == [{"_id": "1", "title": "from mongo"}]
+
+
+class TestRepositoryLoadErrors:
+    """로드 오류가 빈 스냅샷으로 바뀌지 않는지 테스트"""
+
+    @staticmethod
+    def _break_reads(monkeypatch, repo):
+        def broken_read(reader):
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+        monkeypatch.setattr(repo, "_read_file", broken_read)
+
+    def test_updates_propagate_errors_and_reset_reader(self, file_store, sample_news_entries, monkeypatch):
+        """get_updates는 오류를 전달하고 읽기 위치를 초기화, 기존 get_all은 빈 목록"""
+        store, _ = file_store
+        repo = store.news_repo
+        asyncio.run(repo.load_all())
+        self._break_reads(monkeypatch, repo)
+
+        with pytest.raises(EOFError):
+            asyncio.run(repo.get_updates())
+        with pytest.raises(EOFError):
+            asyncio.run(repo.load_all())
+        assert asyncio.run(repo.get_all()) == []
+
+        monkeypatch.undo()
+        items, full = asyncio.run(repo.get_updates())
+        assert full is True
+        assert len(items) == len(sample_news_entries)
+
+    def test_failed_reload_keeps_snapshot_and_signature(self, file_store, sample_news_entries, monkeypatch):
+        """요청 시 재로드가 실패하면 이전 스냅샷과 서명을 유지하고 다음 요청에서 다시 시도"""
+        store, news_file = file_store
+        first = asyncio.run(store.get_snapshot())
+        write_jsonl(news_file, [{"guid": "appended", "link": "https://example.com/appended"}], mode="a")
+        self._break_reads(monkeypatch, store.news_repo)
+
+        with pytest.raises(EOFError):
+            asyncio.run(store.get_snapshot())
+        assert store.snapshot is first
+        assert len(first) == len(sample_news_entries)
+
+        monkeypatch.undo()
+        second = asyncio.run(store.get_snapshot())
+        assert len(second) == len(sample_news_entries) + 1
+
+    def test_mongo_errors_propagate(self):
+        """MONGO 로드 오류도 전달 (컬렉션이 없으면 RuntimeError)"""
+        from app.repositories.news_repository import NewsRepository
+
+        class BrokenCollection:
+            def find(self, query):
+                raise ConnectionError("network is unreachable")
+
+        repo = NewsRepository()
+        repo.backend = "MONGO"
+        repo.mongo_collection = BrokenCollection()
+        with pytest.raises(ConnectionError):
+            asyncio.run(repo.get_updates())
+        assert asyncio.run(repo.get_all()) == []
+
+        repo.mongo_collection = None
+        with pytest.raises(RuntimeError):
+            asyncio.run(repo.load_all())
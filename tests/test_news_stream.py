@@ -0,0 +1,72 @@
+"""
+/news/description NDJSON 스트리밍 응답 테스트
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_news_service
+from app.main import app
+
+from .conftest import write_jsonl
+
+
+@pytest.fixture
+def client(tmp_path, news_service):
+    """임시 뉴스 파일을 바라보는 서비스로 바꾼 테스트 클라이언트"""
+    news_file = tmp_path / "news.jsonl"
+    write_jsonl(news_file, [
+        {
+            "guid": f"g{i}",
+            "source": "Alpha" if i % 2 else "Beta",
+            "title": f"뉴스 {i}",
+            "link": f"https://example.com/{i}",
+            "article_text": "본문 " * 10,
+            "published": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+        }
+        for i in range(150)
+    ])
+    service = news_service(news_file)
+    app.dependency_overrides[get_news_service] = lambda: service
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_news_service, None)
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestNewsDescriptionStream:
+    """NDJSON 스트리밍 테스트"""
+
+    def test_accept_header_streams_entries(self, client):
+        """Accept: application/x-ndjson이면 NewsEntry를 한 줄에 하나씩 반환"""
+        response = client.get(
+            "/api/v1/news/description",
+            params={"limit": 5, "sort": "time"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["x-total-count"] == "150"
+        lines = _lines(response)
+        assert [line["guid"] for line in lines] == ["g149", "g148", "g147", "g146", "g145"]
+        assert lines[0]["title"] == "뉴스 149"
+        assert lines[0]["content_type"] == "NEWS"
+
+    def test_same_entries_as_json_response(self, client):
+        """stream=true 결과는 일반 응답의 data와 같음"""
+        params = {"limit": 20, "offset": 3, "source": "Alpha"}
+        regular = client.get("/api/v1/news/description", params=params).json()
+        streamed = client.get("/api/v1/news/description", params={**params, "stream": "true"})
+        assert _lines(streamed) == regular["data"]
+        assert streamed.headers["x-total-count"] == str(regular["total"])
+
+    def test_stream_allows_larger_pages(self, client):
+        """스트리밍 모드는 100개를 넘는 페이지 허용, 일반 응답은 422"""
+        assert client.get("/api/v1/news/description", params={"limit": 150}).status_code == 422
+        response = client.get("/api/v1/news/description", params={"limit": 150, "stream": "true"})
+        assert response.status_code == 200
+        assert len(_lines(response)) == 150
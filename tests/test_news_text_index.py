@@ -0,0 +1,99 @@
+"""
+전문 검색 역색인(app.repositories.news_text_index) 단위 테스트
+"""
+
+import asyncio
+
+from app.core.news_store import NewsSnapshot
+from app.core.query_cache import QueryCache
+from app.repositories.news_text_index import TextIndexView, tokenize
+from app.schemas.news import NewsQuery
+from app.services.news_service import NewsService
+
+ITEMS = [
+    {"title": "AI chip market", "summary": "", "article_text": "semiconductor news", "source": "a"},
+    {"title": "Weather", "summary": "sunny", "article_text": "no ai mention here chip", "source": "b"},
+    {"title": "Sports", "summary": "chip shot", "article_text": "golf", "source": "a"},
+    {"title": "AI 반도체 시장", "summary": "AI 투자", "article_text": "", "source": "b"},
+]
+
+
+class _SnapshotStore:
+    """고정 스냅샷을 반환하는 스토어"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.news_repo = None
+        self.query_cache = QueryCache(max_entries=0, max_bytes=0, ttl=0)
+
+    async def get_snapshot(self, refresh=False):
+        return self.snapshot
+
+
+class TestTextIndex:
+    """TextIndexView 테스트"""
+
+    def test_tokenize(self):
+        """소문자 단어 단위 토큰화"""
+        assert tokenize("AI-Chip, 반도체 시장!") == ["ai", "chip", "반도체", "시장"]
+
+    def test_and_semantics(self):
+        """모든 검색 단어를 포함하는 문서만 반환"""
+        view = TextIndexView.build(ITEMS)
+        ids, scores = view.search("ai chip")
+        assert ids.tolist() == [0, 1]
+        assert len(scores) == 2
+        assert view.search("ai nothing")[0].tolist() == []
+        assert view.search("")[0].tolist() == []
+
+    def test_title_outranks_body(self):
+        """제목 일치가 본문 일치보다 높은 점수"""
+        view = TextIndexView.build(ITEMS)
+        ids, scores = view.search("chip")
+        by_id = dict(zip(ids.tolist(), scores.tolist()))
+        assert by_id[0] > by_id[1]
+        assert by_id[2] > by_id[1]
+
+    def test_extend_keeps_old_view_bounded(self):
+        """확장 후에도 이전 뷰는 자신의 문서 수까지만 검색"""
+        view = TextIndexView.build(ITEMS[:2])
+        extended = view.extend(ITEMS[2:])
+        assert extended is not None
+        assert view.search("ai")[0].tolist() == [0, 1]
+        assert extended.search("ai")[0].tolist() == [0, 1, 3]
+        # 같은 결과를 처음부터 만든 색인과 점수도 동일
+        full_ids, full_scores = TextIndexView.build(ITEMS).search("ai")
+        ext_ids, ext_scores = extended.search("ai")
+        assert ext_ids.tolist() == full_ids.tolist()
+        assert ext_scores.tolist() == full_scores.tolist()
+
+    def test_extend_from_stale_view(self):
+        """공유 색인이 이미 앞서 있으면 확장하지 않음"""
+        view = TextIndexView.build(ITEMS[:2])
+        view.extend(ITEMS[2:3])
+        assert view.extend(ITEMS[3:]) is None
+
+
+class TestRelevanceSearch:
+    """sort=relevance 검색 테스트"""
+
+    def _search(self, **params):
+        service = NewsService(news_store=_SnapshotStore(NewsSnapshot(1, ITEMS)))
+        return asyncio.run(service.search_news(NewsQuery(**params)))
+
+    def test_relevance_order(self):
+        """BM25 점수 순으로 정렬"""
+        data, total = self._search(q="chip", sort="relevance")
+        assert total == 3
+        assert data[-1] is ITEMS[1]
+
+    def test_relevance_with_source_filter(self):
+        """소스 필터와 교집합"""
+        data, total = self._search(q="ai", sort="relevance", source="b")
+        assert total == 2
+        assert {item["title"] for item in data} == {"Weather", "AI 반도체 시장"}
+
+    def test_relevance_without_query_falls_back(self):
+        """검색어가 없으면 기존 정렬 경로 사용"""
+        data, total = self._search(sort="relevance")
+        assert total == len(ITEMS)
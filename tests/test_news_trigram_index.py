@@ -0,0 +1,79 @@
+"""
+트라이그램 색인(app.repositories.news_trigram_index) 단위 테스트
+"""
+
+import random
+
+import numpy as np
+
+from app.repositories.news_columns import build_search_text
+from app.repositories.news_trigram_index import TrigramIndex, trigram_keys
+
+WORDS = ["ai", "로봇", "반도체", "protein", "market", "chip", "openai", "딥러닝", "model"]
+
+
+def _make_texts(n, seed=3):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        items.append({
+            "title": " ".join(rng.choice(WORDS) for _ in range(3)) + f" {i}",
+            "summary": "".join(rng.choice(WORDS) for _ in range(2)),
+            "article_text": rng.choice(["", "Title " + str(i), "로봇반도체AI"]),
+        })
+    return [build_search_text(item) for item in items]
+
+
+def _scan(texts, term, ids=None):
+    ids = range(len(texts)) if ids is None else ids
+    return [i for i in ids if term in texts[i]]
+
+
+def _search(index, texts, term, ids=None):
+    candidates = index.candidates(term, ids)
+    if candidates is None:
+        candidates = np.arange(len(texts)) if ids is None else ids
+    return [i for i in candidates.tolist() if term in texts[i]]
+
+
+class TestTrigramIndex:
+    """TrigramIndex 테스트"""
+
+    def test_trigram_keys(self):
+        """서로 다른 트라이그램만 키로 변환"""
+        assert len(trigram_keys("ab")) == 0
+        assert len(trigram_keys("aaaa")) == 1
+        assert len(trigram_keys("로봇반도체")) == 3
+
+    def test_short_query_not_narrowed(self):
+        """3글자 미만 검색어는 축소하지 않음"""
+        index = TrigramIndex.build(_make_texts(10))
+        assert index.candidates("ai") is None
+
+    def test_matches_scan(self):
+        """후보 축소 + 정확 검사 결과가 전체 순회와 동일"""
+        texts = _make_texts(500)
+        index = TrigramIndex.build(texts)
+        subset = np.arange(0, 500, 3)
+        for term in ["protein", "로봇반", "title 1", "chipai", "ai", "zzz", "openai model", "\x00rob"]:
+            assert _search(index, texts, term) == _scan(texts, term)
+            assert _search(index, texts, term, subset) == _scan(texts, term, subset.tolist())
+
+    def test_extend_and_merge(self):
+        """세그먼트 추가/병합 후에도 결과 동일"""
+        texts = _make_texts(300)
+        index = TrigramIndex.build(texts[:20])
+        for start in range(20, 300, 20):
+            index = index.extend(texts[start:start + 20])
+        assert index.doc_count == 300
+        assert len(index.segments) < 15
+        for term in ["protein", "반도체ai", "title 29"]:
+            assert _search(index, texts, term) == _scan(texts, term)
+
+    def test_batch_boundary(self, monkeypatch):
+        """배치를 나눠 색인해도 결과 동일 (문서 경계를 넘는 트라이그램 없음)"""
+        monkeypatch.setattr("app.repositories.news_trigram_index._BATCH_CHARS", 50)
+        texts = _make_texts(200)
+        index = TrigramIndex.build(texts)
+        for term in ["protein", "0\x00", "1 로봇", "title 12"]:
+            assert _search(index, texts, term) == _scan(texts, term)
@@ -0,0 +1,92 @@
+"""
+뉴스 검색 결과 캐시(QueryCache) 단위 테스트
+"""
+
+import asyncio
+
+import numpy as np
+
+from app.core.query_cache import QueryCache, normalize_query
+from app.schemas.news import NewsQuery
+from app.services.news_service import NewsService
+
+from .conftest import write_jsonl
+
+
+class TestQueryCache:
+    """QueryCache 테스트"""
+
+    def test_hit_and_miss(self):
+        cache = QueryCache(max_entries=10, max_bytes=1 << 20, ttl=60)
+        assert cache.get("a") is None
+        cache.put("a", np.array([3, 1, 2]), 7)
+        ids, total = cache.get("a")
+        assert ids.tolist() == [3, 1, 2]
+        assert total == 7
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        """가장 오래 쓰지 않은 항목부터 제거"""
+        cache = QueryCache(max_entries=2, max_bytes=1 << 20, ttl=60)
+        cache.put("a", np.arange(3), 3)
+        cache.put("b", np.arange(3), 3)
+        cache.get("a")
+        cache.put("c", np.arange(3), 3)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """메모리 한도를 넘으면 제거"""
+        cache = QueryCache(max_entries=100, max_bytes=2000, ttl=60)
+        for key in range(5):
+            cache.put(key, np.arange(100), 100)
+        stats = cache.stats()
+        assert stats["bytes"] <= 2000
+        assert stats["entries"] == 1
+        assert stats["evictions"] == 4
+
+    def test_ttl_expiry(self):
+        cache = QueryCache(max_entries=10, max_bytes=1 << 20, ttl=0)
+        cache.put("a", np.arange(3), 3)
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled(self):
+        cache = QueryCache(max_entries=0, max_bytes=1 << 20, ttl=60)
+        cache.put("a", np.arange(3), 3)
+        assert cache.get("a") is None
+
+    def test_normalize_query(self):
+        """refresh와 검색어 대소문자는 키에 영향 없음, 스냅샷 버전은 영향"""
+        base = normalize_query(NewsQuery(q="AI", source=""), 1)
+        assert normalize_query(NewsQuery(q="ai", refresh=True), 1) == base
+        assert normalize_query(NewsQuery(q="ai"), 2) != base
+        assert normalize_query(NewsQuery(q="ai", offset=20), 1) != base
+
+
+class TestSearchCache:
+    """NewsService 검색 결과 캐시 테스트"""
+
+    def test_repeated_query_hits_cache(self, file_store):
+        store, _ = file_store
+        service = NewsService(news_store=store)
+        first = asyncio.run(service.search_news(NewsQuery(sort="time")))
+        second = asyncio.run(service.search_news(NewsQuery(sort="time")))
+        assert first == second
+        assert store.query_cache.stats()["hits"] == 1
+
+    def test_new_snapshot_misses(self, file_store, sample_news_entries):
+        """스냅샷 버전이 바뀌면 이전 결과를 쓰지 않음"""
+        store, news_file = file_store
+        service = NewsService(news_store=store)
+        _, total = asyncio.run(service.search_news(NewsQuery(sort="time")))
+
+        # 중복 제거 대상이 되지 않도록 guid/link가 다른 항목 추가
+        extra = dict(sample_news_entries[0], guid="appended", link="https://example.com/appended")
+        write_jsonl(news_file, [extra], mode="a")
+
+        _, new_total = asyncio.run(service.search_news(NewsQuery(sort="time")))
+        assert new_total == total + 1
+        assert store.query_cache.stats()["hits"] == 0
@@ -0,0 +1,127 @@
+"""
+스냅샷 사이드카(snapshot_file) 단위 테스트
+"""
+
+import asyncio
+import os
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.snapshot_file import load_snapshot, save_snapshot, sidecar_path
+from app.services.news_service import NewsService
+from app.schemas.news import NewsQuery
+
+from .conftest import write_jsonl
+
+
+def _search(store, **params):
+    items, total = asyncio.run(NewsService(news_store=store).search_news(NewsQuery(**params)))
+    return [item.get("guid") for item in items], total
+
+
+class TestSnapshotFile:
+    """사이드카 파일 형식 테스트"""
+
+    def test_round_trip_numpy_zero_copy(self, tmp_path):
+        """NumPy 배열은 파일을 참조하는 읽기 전용 배열로 복원"""
+        path = tmp_path / "data.snapshot"
+        array = np.arange(1000, dtype=np.int64)
+        save_snapshot(path, {"array": array, "text": "뉴스"}, {"count": 1})
+
+        payload, meta = load_snapshot(path)
+        assert meta["count"] == 1
+        assert payload["text"] == "뉴스"
+        assert np.array_equal(payload["array"], array)
+        assert not payload["array"].flags.writeable
+
+    def test_corrupt_file_returns_none(self, tmp_path):
+        """형식이 다르거나 잘린 파일은 None"""
+        path = tmp_path / "data.snapshot"
+        path.write_bytes(b"not a snapshot")
+        assert load_snapshot(path) is None
+        assert load_snapshot(tmp_path / "missing.snapshot") is None
+
+
+class TestNewsStoreSidecar:
+    """NewsStore 사이드카 저장/복원 테스트"""
+
+    def test_restart_restores_same_results(self, file_store, news_service):
+        """재시작 후 사이드카에서 복원한 스냅샷이 전체 파싱과 같은 결과"""
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+        assert sidecar_path(news_file).exists()
+        expected = _search(store, q="ai", sort="time")
+
+        restored = news_service(news_file).news_store
+        snapshot = asyncio.run(restored.get_snapshot())
+        assert restored._saved_version == snapshot.version
+        assert len(snapshot) == len(store.snapshot)
+        assert _search(restored, q="ai", sort="time") == expected
+        assert restored.snapshot.columns.facet_counts("source") == store.snapshot.columns.facet_counts("source")
+
+    def test_appended_lines_loaded_incrementally(self, file_store, sample_news_entries, news_service):
+        """사이드카 저장 후 추가된 라인만 읽어 붙임"""
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+        extra = dict(
+            sample_news_entries[0], guid="appended", link="https://example.com/appended",
+            title="Appended quantum item",
+        )
+        write_jsonl(news_file, [extra], mode="a")
+
+        restored = news_service(news_file).news_store
+        snapshot = asyncio.run(restored.get_snapshot())
+        assert len(snapshot) == len(sample_news_entries) + 1
+        # 복원(v1) 후 추가분을 붙인 v2
+        assert snapshot.version == 2
+        assert _search(restored, q="quantum")[0] == ["appended"]
+
+        # 종료 시 증분 결과를 사이드카에 반영
+        asyncio.run(restored.close())
+        again = news_service(news_file).news_store
+        assert len(asyncio.run(again.get_snapshot())) == len(sample_news_entries) + 1
+        assert again.snapshot.version == 1
+
+    def test_rewritten_file_falls_back_to_full_parse(self, file_store, sample_news_entries, news_service):
+        """파일이 교체되면 사이드카를 쓰지 않고 전체 파싱"""
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+        replacement = news_file.with_name("replacement.jsonl")
+        write_jsonl(replacement, sample_news_entries[:2])
+        os.replace(replacement, news_file)
+
+        restored = news_service(news_file).news_store
+        snapshot = asyncio.run(restored.get_snapshot())
+        assert len(snapshot) == 2
+
+    def test_config_mismatch_ignored(self, file_store, sample_news_entries, monkeypatch, news_service):
+        """스냅샷 내용에 영향을 주는 설정이 다르면 사용하지 않음"""
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+        monkeypatch.setattr(settings, "news_trigram_index", not settings.news_trigram_index)
+
+        restored = news_service(news_file).news_store
+        snapshot = asyncio.run(restored.get_snapshot())
+        assert len(snapshot) == len(sample_news_entries)
+        assert (snapshot.trigram_index is None) != settings.news_trigram_index
+
+    def test_disabled(self, file_store, monkeypatch):
+        """news_snapshot_cache=False이면 사이드카를 만들지 않음"""
+        monkeypatch.setattr(settings, "news_snapshot_cache", False)
+        store, news_file = file_store
+        asyncio.run(store.get_snapshot())
+        assert not sidecar_path(news_file).exists()
+
+    def test_mmap_mode_round_trip(self, file_store, monkeypatch, news_service):
+        """mmap 모드 레코드도 복원 후 파일을 다시 mmap해 읽음"""
+        monkeypatch.setattr(settings, "news_file_mode", "mmap")
+        _, news_file = file_store
+        store = news_service(news_file).news_store
+        asyncio.run(store.get_snapshot())
+        expected = _search(store, sort="time")
+
+        restored = news_service(news_file).news_store
+        asyncio.run(restored.get_snapshot())
+        assert restored._saved_version == restored.snapshot.version
+        assert _search(restored, sort="time") == expected